@@ -4,34 +4,44 @@
 from RPA import core
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import csv
+import hashlib
 import importlib
+import importlib.util
 import json
 import logging
-from functools import wraps
+from functools import partial, wraps
 import os
+import queue
+import threading
 from pathlib import Path
 from time import sleep
-from typing import Any, Dict, List, Optional, Union
-
-try:
-    import boto3
-    from botocore.exceptions import ClientError, WaiterError
-    from botocore.waiter import Waiter, WaiterModel, create_waiter_with_client
-    from boto3.exceptions import S3UploadFailedError
-
-    HAS_BOTO3 = True
-except ImportError:
-    HAS_BOTO3 = False
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
+from robot.libraries.BuiltIn import BuiltIn
 
 from RPA.core.logger import RobotLogListener
-from RPA.core.helpers import required_param
+from RPA.core.helpers import LazyModule, required_param
 
 from .textract import TextractDocument
 
 
 DEFAULT_REGION = "eu-west-1"
 
+# Checked without importing, `boto3` and `botocore` are loaded when the first
+#  client is initialized.
+HAS_BOTO3 = importlib.util.find_spec("boto3") is not None
+boto3 = LazyModule("boto3")
+boto3_exceptions = LazyModule("boto3.exceptions")
+botocore_exceptions = LazyModule("botocore.exceptions")
+botocore_waiter = LazyModule("botocore.waiter")
+s3_transfer = LazyModule("boto3.s3.transfer")
+
+MB = 1024 * 1024
+DEFAULT_TRANSFER_WORKERS = 8
+
 
 def import_vault():
     """Try to import Vault library."""
@@ -74,6 +84,51 @@ class RedshiftDatabaseError(Exception):
     """Raised when the Redshift API raises a database error."""
 
 
+@dataclass
+class S3TransferResult:
+    """Outcome of a single file transfer between S3 and the local filesystem.
+
+    The ``status`` is one of ``uploaded``, ``downloaded``, ``skipped`` (already
+    up to date), ``deleted`` or ``failed``, with the reason in ``error``.
+    """
+
+    bucket: str
+    key: str
+    path: str
+    status: str
+    size: int = 0
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.status == "failed"
+
+
+def calculate_s3_etag(
+    path: Union[str, Path], multipart_chunksize: Optional[int] = None
+) -> str:
+    """Calculate the ETag S3 gives to the file when uploaded without encryption.
+
+    :param path: local file
+    :param multipart_chunksize: part size in bytes if the file was uploaded in
+        multiple parts, otherwise the ETag is the MD5 hash of the content
+    :return: the ETag without the surrounding quotes
+    """
+    with open(path, "rb") as stream:
+        if not multipart_chunksize:
+            digest = hashlib.md5()
+            for chunk in iter(partial(stream.read, MB), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+        part_digests = [
+            hashlib.md5(part).digest()
+            for part in iter(partial(stream.read, multipart_chunksize), b"")
+        ]
+    combined = hashlib.md5(b"".join(part_digests)).hexdigest()
+    return f"{combined}-{len(part_digests)}"
+
+
 class AWSBase:
     """AWS base class for generic methods"""
 
@@ -176,6 +231,8 @@ class ServiceS3(AWSBase):
     def __init__(self) -> None:
         self.services.append("s3")
         self.logger.debug("ServiceS3 init")
+        self.transfer_workers = DEFAULT_TRANSFER_WORKERS
+        self.transfer_config = None
 
     def init_s3_client(
         self,
@@ -220,7 +277,7 @@ class ServiceS3(AWSBase):
         try:
             response = client.create_bucket(Bucket=bucket_name, **kwargs)
             return response["ResponseMetadata"]["HTTPStatusCode"] == 204
-        except ClientError as e:
+        except botocore_exceptions.ClientError as e:
             self.logger.error(e)
             return False
 
@@ -236,7 +293,7 @@ class ServiceS3(AWSBase):
         try:
             response = client.delete_bucket(Bucket=bucket_name)
             return response["ResponseMetadata"]["HTTPStatusCode"] == 204
-        except ClientError as e:
+        except botocore_exceptions.ClientError as e:
             self.logger.error(e)
             return False
 
@@ -279,7 +336,7 @@ class ServiceS3(AWSBase):
                 Bucket=bucket_name, Delete=objects, **kwargs
             )
             return len(response["Deleted"]) if "Deleted" in response else 0
-        except ClientError as e:
+        except botocore_exceptions.ClientError as e:
             self.logger.error(e)
             return False
 
@@ -356,16 +413,13 @@ class ServiceS3(AWSBase):
             )
         """  # noqa: E501
         client = self._get_client_for_service("s3")
-        paginator = client.get_paginator("list_objects_v2")
-        max_keys = min(limit or 1001, 1000)
-
-        new_params = self._set_list_files_arguments(prefix, limit)
-        request_params = {**kwargs, **new_params}
-
         files = []
         try:
-            paginated = paginator.paginate(Bucket=bucket_name, **request_params)
             if search:
+                paginator = client.get_paginator("list_objects_v2")
+                new_params = self._set_list_files_arguments(prefix, limit)
+                request_params = {**kwargs, **new_params}
+                paginated = paginator.paginate(Bucket=bucket_name, **request_params)
                 filtered = paginated.search(search)
                 for index, page in enumerate(filtered, start=1):
                     if page:
@@ -373,15 +427,189 @@ class ServiceS3(AWSBase):
                     if limit and limit == index:
                         break
             else:
-                for index, page in enumerate(paginated, start=1):
-                    if limit and (index * max_keys) > limit:
-                        break
-                    files.extend(page["Contents"] if "Contents" in page.keys() else [])
-
-        except ClientError as e:
+                files.extend(
+                    self._iterate_s3_objects(bucket_name, prefix, limit, **kwargs)
+                )
+        except botocore_exceptions.ClientError as e:
             self.logger.error(e)
         return files
 
+    def _iterate_s3_pages(
+        self,
+        bucket_name: str,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: int = 1000,
+        **kwargs,
+    ) -> Generator[dict, None, None]:
+        client = self._get_client_for_service("s3")
+        params = {"Bucket": bucket_name, **kwargs}
+        if prefix:
+            params["Prefix"] = prefix
+        remaining = limit
+        while True:
+            # Never ask for more keys than still needed to reach the limit.
+            params["MaxKeys"] = min(page_size, remaining or page_size)
+            response = client.list_objects_v2(**params)
+            yield response
+            if remaining:
+                remaining -= len(response.get("Contents", []))
+                if remaining <= 0:
+                    return
+            if not response.get("IsTruncated"):
+                return
+            params["ContinuationToken"] = response["NextContinuationToken"]
+
+    def _iterate_s3_objects(
+        self,
+        bucket_name: str,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: int = 1000,
+        **kwargs,
+    ) -> Generator[dict, None, None]:
+        for response in self._iterate_s3_pages(
+            bucket_name, prefix, limit, page_size, **kwargs
+        ):
+            yield from response.get("Contents", [])
+
+    def _walk_s3_prefixes(
+        self,
+        bucket_name: str,
+        prefixes: List[str],
+        workers: int,
+        page_size: int,
+        **kwargs,
+    ) -> Generator[List[dict], None, None]:
+        pages = queue.Queue(maxsize=workers * 2)
+        stopped = threading.Event()
+        done = object()
+
+        def put(item):
+            # Gives up once the consumer stopped, instead of blocking on a full
+            #  queue forever.
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def list_prefix(prefix):
+            try:
+                for response in self._iterate_s3_pages(
+                    bucket_name, prefix, page_size=page_size, **kwargs
+                ):
+                    if not put(response.get("Contents", [])):
+                        return
+            except Exception as err:  # pylint: disable=broad-except
+                put(err)
+            finally:
+                put(done)
+
+        executor = ThreadPoolExecutor(max_workers=min(workers, len(prefixes)))
+        try:
+            for prefix in prefixes:
+                executor.submit(list_prefix, prefix)
+            pending = len(prefixes)
+            while pending:
+                item = pages.get()
+                if item is done:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=True)
+
+    @aws_dependency_required
+    def iterate_files(
+        self,
+        bucket_name: str,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        workers: int = 1,
+        page_size: int = 1000,
+        **kwargs,
+    ) -> Generator[dict, None, None]:
+        """Iterate over the files in the bucket, fetching them lazily page by page.
+
+        Unlike ``List Files``, the files are not collected in memory, so any number
+        of them can be processed, and no more pages are fetched than needed to
+        reach the ``limit``.
+
+        With more than one worker, the "directories" (common prefixes ending with
+        ``/``) right under ``prefix`` are listed in parallel. The files are then
+        yielded in the order the pages arrive, not sorted by key.
+
+        **note** This keyword accepts additional parameters in key=value format
+
+        More info on `additional parameters <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.list_objects_v2/>`_.
+
+        :param bucket_name: name for the bucket
+        :param prefix: limits the files to keys that begin with the
+         specified prefix
+        :param limit: stop after this many files
+        :param workers: number of "directories" listed at the same time
+        :param page_size: number of files fetched per request, at most 1000
+        :return: generator of file dictionaries, as returned by ``List Files``
+
+        **Python example**
+
+        .. code:: python
+
+            for item in AWSlibrary.iterate_files("bucket_name", prefix="invoices/"):
+                process(item["Key"])
+
+        **Robot Framework example**
+
+        .. code:: robotframework
+
+            ${files}=    Iterate Files    bucket-name    prefix=invoices/    workers=8
+            FOR    ${file}    IN    @{files}
+                Log    ${file}[Key]
+            END
+        """  # noqa: E501
+        page_size = min(int(page_size), 1000)
+        workers = int(workers)
+        if workers <= 1:
+            yield from self._iterate_s3_objects(
+                bucket_name, prefix, limit, page_size, **kwargs
+            )
+            return
+
+        # Files directly under the prefix are yielded while collecting the
+        #  prefixes to walk in parallel.
+        remaining = limit
+        prefixes = []
+        for response in self._iterate_s3_pages(
+            bucket_name, prefix, page_size=page_size, Delimiter="/", **kwargs
+        ):
+            for item in response.get("Contents", []):
+                yield item
+                if remaining:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+            prefixes.extend(
+                common["Prefix"] for common in response.get("CommonPrefixes", [])
+            )
+        if not prefixes:
+            return
+
+        for page in self._walk_s3_prefixes(
+            bucket_name, prefixes, workers, page_size, **kwargs
+        ):
+            for item in page:
+                yield item
+                if remaining:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+
     def _set_list_files_arguments(self, prefix=None, limit=None):
         kwargs = {}
         if prefix:
@@ -391,23 +619,116 @@ class ServiceS3(AWSBase):
         return kwargs
 
     @aws_dependency_required
-    def _s3_upload_file(self, bucket_name, filename, object_name, **kwargs):
+    def set_s3_transfer_config(
+        self,
+        workers: int = DEFAULT_TRANSFER_WORKERS,
+        multipart_threshold: int = 8 * MB,
+        multipart_chunksize: int = 8 * MB,
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> None:
+        """Configure the concurrent file transfers of ``Upload Files``,
+        ``Download Files``, ``Sync Directory To S3`` and ``Sync S3 To Directory``.
+
+        Many small files are transferred in parallel by the worker threads, while
+        files of at least ``multipart_threshold`` bytes are also split into parts
+        of ``multipart_chunksize`` bytes, transferred in parallel with up to
+        ``max_concurrency`` threads per file.
+
+        **note** This keyword accepts additional parameters in key=value format.
+
+        More info on `additional parameters <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/customizations/s3.html#boto3.s3.transfer.TransferConfig>`_.
+
+        :param workers: number of files transferred at the same time
+        :param multipart_threshold: file size in bytes from which the transfers
+         are split into parts
+        :param multipart_chunksize: size of the parts in bytes
+        :param max_concurrency: number of threads transferring the parts of a file
+
+        .. code-block:: robotframework
+
+            *** Tasks ***
+            Upload Invoices
+                Init S3 Client
+                Set S3 Transfer Config    workers=16
+                ${count}=    Upload Files    invoices-bucket    ${files}
+        """  # noqa: E501
+        self.transfer_workers = max(1, int(workers))
+        self.transfer_config = s3_transfer.TransferConfig(
+            multipart_threshold=int(multipart_threshold),
+            multipart_chunksize=int(multipart_chunksize),
+            max_concurrency=int(max_concurrency),
+            **kwargs,
+        )
+
+    def _get_transfer_config(self):
+        if self.transfer_config is None:
+            self.transfer_config = s3_transfer.TransferConfig()
+        return self.transfer_config
+
+    def _run_s3_transfers(
+        self,
+        transfers: List[Callable[[], S3TransferResult]],
+        workers: Optional[int] = None,
+    ) -> List[S3TransferResult]:
+        workers = min(max(1, int(workers or self.transfer_workers)), len(transfers))
+        if workers <= 1:
+            results = [transfer() for transfer in transfers]
+        else:
+            # The clients are thread-safe, so all the workers share the same one.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda transfer: transfer(), transfers))
+        for result in results:
+            if result.failed:
+                self.logger.warning(
+                    "Transfer of '%s' failed with error: %s", result.key, result.error
+                )
+        return results
+
+    def _upload_s3_file(
+        self, bucket_name, filename, object_name, **kwargs
+    ) -> S3TransferResult:
         client = self._get_client_for_service("s3")
-        uploaded = False
-        error = None
+        kwargs.setdefault("Config", self._get_transfer_config())
+        result = S3TransferResult(
+            bucket=bucket_name, key=object_name, path=str(filename), status="failed"
+        )
         try:
             client.upload_file(filename, bucket_name, object_name, **kwargs)
-            uploaded = True
-        except ClientError as e:
-            error = str(e)
-            uploaded = False
-        except FileNotFoundError as e:
-            error = str(e)
-            uploaded = False
-        except S3UploadFailedError as e:
-            error = str(e)
-            uploaded = False
-        return (uploaded, error)
+            result.size = os.path.getsize(filename)
+            result.status = "uploaded"
+        except (
+            botocore_exceptions.ClientError,
+            boto3_exceptions.S3UploadFailedError,
+            FileNotFoundError,
+        ) as e:
+            result.error = str(e)
+        return result
+
+    def _download_s3_file(
+        self, bucket_name, object_name, download_path, **kwargs
+    ) -> S3TransferResult:
+        client = self._get_client_for_service("s3")
+        kwargs.setdefault("Config", self._get_transfer_config())
+        result = S3TransferResult(
+            bucket=bucket_name,
+            key=object_name,
+            path=str(download_path),
+            status="failed",
+        )
+        try:
+            Path(download_path).parent.mkdir(parents=True, exist_ok=True)
+            client.download_file(bucket_name, object_name, str(download_path), **kwargs)
+            result.size = os.path.getsize(download_path)
+            result.status = "downloaded"
+        except (botocore_exceptions.ClientError, OSError) as e:
+            result.error = str(e)
+        return result
+
+    @aws_dependency_required
+    def _s3_upload_file(self, bucket_name, filename, object_name, **kwargs):
+        result = self._upload_s3_file(bucket_name, filename, object_name, **kwargs)
+        return (not result.failed, result.error)
 
     @aws_dependency_required
     def upload_file(
@@ -449,12 +770,23 @@ class ServiceS3(AWSBase):
 
     @aws_dependency_required
     def upload_files(
-        self, bucket_name: Optional[str] = None, files: Optional[list] = None, **kwargs
-    ) -> list:
+        self,
+        bucket_name: Optional[str] = None,
+        files: Optional[list] = None,
+        workers: Optional[int] = None,
+        return_results: bool = False,
+        **kwargs,
+    ) -> Union[int, List[S3TransferResult]]:
         """Upload multiple files into bucket
 
+        The files are uploaded concurrently, see ``Set S3 Transfer Config``.
+
         :param bucket_name: name for the bucket
         :param files: list of files (2 possible ways, see above)
+        :param workers: number of files uploaded at the same time, by default
+         the one set with ``Set S3 Transfer Config`` (8)
+        :param return_results: return a ``S3TransferResult`` (with the `bucket`,
+         `key`, `path`, `status`, `size` and `error`) per file instead of the count
         :return: number of files uploaded
 
         Giving files as list of filepaths:
@@ -487,27 +819,25 @@ class ServiceS3(AWSBase):
             awslibrary.upload_files("mybucket", files=upload_files)
         """  # noqa: E501
         required_param([bucket_name, files], "upload_files")
-        upload_count = 0
-        for _, item in enumerate(files):
-            # filepath = None
-            # object_name = None
-            parameters = {"filename": None, "object_name": None}
+        transfers = []
+        for item in files:
             if isinstance(item, dict):
-                # filepath = item["filepath"]
-                # object_name = item["object_name"]
-                parameters = item
+                parameters = dict(item)
             elif isinstance(item, str):
-                parameters["filename"] = item
-                parameters["object_name"] = Path(item).name
+                parameters = {"filename": item, "object_name": Path(item).name}
             else:
-                error = "incorrect input format for files"
+                self.logger.warning(
+                    "File upload failed with error: incorrect input format for files"
+                )
+                continue
+            transfers.append(
+                partial(self._upload_s3_file, bucket_name, **parameters, **kwargs)
+            )
 
-            uploaded, error = self._s3_upload_file(bucket_name, **parameters, **kwargs)
-            if uploaded:
-                upload_count += 1
-            if error:
-                self.logger.warning("File upload failed with error: %s", error)
-        return upload_count
+        results = self._run_s3_transfers(transfers, workers)
+        if return_results:
+            return results
+        return sum(1 for result in results if not result.failed)
 
     @aws_dependency_required
     def download_files(
@@ -515,10 +845,14 @@ class ServiceS3(AWSBase):
         bucket_name: Optional[str] = None,
         files: Optional[list] = None,
         target_directory: Optional[str] = None,
+        workers: Optional[int] = None,
+        return_results: bool = False,
         **kwargs,
-    ) -> list:
+    ) -> Union[int, List[S3TransferResult]]:
         """Download files from bucket to local filesystem
 
+        The files are downloaded concurrently, see ``Set S3 Transfer Config``.
+
         **note** This keyword accepts additional parameters in key=value format.
 
         More info on `additional parameters <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.download_file/>`_.
@@ -527,25 +861,222 @@ class ServiceS3(AWSBase):
         :param files: list of S3 object names
         :param target_directory: location for the downloaded files, default
             current directory
+        :param workers: number of files downloaded at the same time, by default
+         the one set with ``Set S3 Transfer Config`` (8)
+        :param return_results: return a ``S3TransferResult`` per file instead of
+         the count
         :return: number of files downloaded
         """  # noqa: E501
         required_param([bucket_name, files, target_directory], "download_files")
-        client = self._get_client_for_service("s3")
-        download_count = 0
+        self._get_client_for_service("s3")
+        transfers = [
+            partial(
+                self._download_s3_file,
+                bucket_name,
+                object_name,
+                Path(target_directory) / Path(object_name).name,
+                **kwargs,
+            )
+            for object_name in files
+        ]
 
-        for _, object_name in enumerate(files):
-            try:
-                object_as_path = Path(object_name)
-                download_path = str(Path(target_directory) / object_as_path.name)
-                response = client.download_file(
-                    bucket_name, object_name, download_path, **kwargs
+        results = self._run_s3_transfers(transfers, workers)
+        if return_results:
+            return results
+        return sum(1 for result in results if not result.failed)
+
+    def _list_s3_objects(self, bucket_name: str, prefix: str) -> Dict[str, dict]:
+        return {
+            item["Key"]: item
+            for item in self._iterate_s3_objects(bucket_name, prefix)
+            if not item["Key"].endswith("/")  # folder placeholders
+        }
+
+    def _is_s3_object_changed(self, path: Path, s3_object: dict) -> bool:
+        if path.stat().st_size != s3_object["Size"]:
+            return True
+        etag = s3_object.get("ETag", "").strip('"')
+        # Multipart uploads have the number of parts suffixed in the ETag.
+        chunksize = (
+            self._get_transfer_config().multipart_chunksize if "-" in etag else None
+        )
+        return calculate_s3_etag(path, chunksize) != etag
+
+    @staticmethod
+    def _join_s3_prefix(prefix: Optional[str]) -> str:
+        prefix = (prefix or "").strip("/")
+        return f"{prefix}/" if prefix else ""
+
+    @aws_dependency_required
+    def sync_directory_to_s3(
+        self,
+        bucket_name: str,
+        directory: str,
+        prefix: Optional[str] = None,
+        delete: bool = False,
+        workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[S3TransferResult]:
+        """Upload the files of a local directory (recursively) which are missing
+        from the bucket or differ from the objects in it.
+
+        The files are compared by size first and then by ETag, which is the
+        MD5 hash of the content, or derived from the MD5 hashes of the parts for
+        multipart uploads. Objects encrypted with SSE-KMS or SSE-C don't have
+        such ETags and are always uploaded again.
+
+        **note** This keyword accepts additional parameters in key=value format.
+
+        More info on `additional parameters <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.upload_file/>`_.
+
+        :param bucket_name: name for the bucket
+        :param directory: local directory to upload
+        :param prefix: key prefix (folder) of the objects in the bucket
+        :param delete: delete the objects under the prefix which don't exist
+         locally
+        :param workers: number of files uploaded at the same time, by default
+         the one set with ``Set S3 Transfer Config`` (8)
+        :return: list of ``S3TransferResult``, one per file (and deleted object)
+
+        .. code-block:: robotframework
+
+            *** Tasks ***
+            Back Up Invoices
+                Init S3 Client
+                @{results}=    Sync Directory To S3
+                ...    invoices-bucket    ${OUTPUT_DIR}${/}invoices    prefix=2024
+                FOR    ${result}    IN    @{results}
+                    Log    ${result.key}: ${result.status}
+                END
+        """  # noqa: E501
+        root = Path(directory)
+        if not root.is_dir():
+            raise NotADirectoryError(f"Not a directory: {directory}")
+        prefix = self._join_s3_prefix(prefix)
+        remote = self._list_s3_objects(bucket_name, prefix)
+
+        results, transfers = [], []
+        for path in sorted(root.rglob("*")):
+            if not path.is_file():
+                continue
+            key = prefix + path.relative_to(root).as_posix()
+            s3_object = remote.pop(key, None)
+            if s3_object and not self._is_s3_object_changed(path, s3_object):
+                results.append(
+                    S3TransferResult(
+                        bucket_name, key, str(path), "skipped", s3_object["Size"]
+                    )
+                )
+            else:
+                transfers.append(
+                    partial(self._upload_s3_file, bucket_name, path, key, **kwargs)
+                )
+        if transfers:
+            results.extend(self._run_s3_transfers(transfers, workers))
+        if delete and remote:
+            results.extend(self._delete_s3_objects(bucket_name, list(remote)))
+        return results
+
+    def _delete_s3_objects(
+        self, bucket_name: str, keys: List[str]
+    ) -> List[S3TransferResult]:
+        client = self._get_client_for_service("s3")
+        results = []
+        for start in range(0, len(keys), 1000):  # the limit of a single request
+            batch = keys[start : start + 1000]
+            response = client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = {error["Key"]: error for error in response.get("Errors", [])}
+            for key in batch:
+                error = errors.get(key)
+                results.append(
+                    S3TransferResult(
+                        bucket_name,
+                        key,
+                        "",
+                        "failed" if error else "deleted",
+                        error=error["Message"] if error else None,
+                    )
                 )
-                if response is None:
-                    download_count += 1
-            except ClientError as e:
-                self.logger.error("Download error with '%s': %s", object_name, str(e))
+        return results
 
-        return download_count
+    @aws_dependency_required
+    def sync_s3_to_directory(
+        self,
+        bucket_name: str,
+        directory: str,
+        prefix: Optional[str] = None,
+        delete: bool = False,
+        workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[S3TransferResult]:
+        """Download the objects of the bucket which are missing from a local
+        directory or differ from the files in it.
+
+        The objects are compared like with ``Sync Directory To S3`` and their
+        keys (without the ``prefix``) are used as paths inside the directory.
+
+        :param bucket_name: name for the bucket
+        :param directory: local target directory, created if missing
+        :param prefix: key prefix (folder) of the objects to download
+        :param delete: delete the local files which don't exist in the bucket
+         under the prefix
+        :param workers: number of files downloaded at the same time, by default
+         the one set with ``Set S3 Transfer Config`` (8)
+        :return: list of ``S3TransferResult``, one per object (and deleted file)
+        """
+        root = Path(directory)
+        root.mkdir(parents=True, exist_ok=True)
+        prefix = self._join_s3_prefix(prefix)
+        remote = self._list_s3_objects(bucket_name, prefix)
+
+        results, transfers, expected = [], [], set()
+        for key, s3_object in remote.items():
+            path = self._get_s3_sync_path(root, key[len(prefix) :])
+            if path is None:
+                error = f"Key '{key}' points outside of the directory {root}"
+                self.logger.warning(error)
+                results.append(
+                    S3TransferResult(bucket_name, key, "", "failed", error=error)
+                )
+                continue
+            expected.add(path.resolve())
+            if path.is_file() and not self._is_s3_object_changed(path, s3_object):
+                results.append(
+                    S3TransferResult(
+                        bucket_name, key, str(path), "skipped", s3_object["Size"]
+                    )
+                )
+            else:
+                transfers.append(
+                    partial(self._download_s3_file, bucket_name, key, path, **kwargs)
+                )
+        if transfers:
+            results.extend(self._run_s3_transfers(transfers, workers))
+
+        if delete:
+            for path in sorted(root.rglob("*")):
+                if path.is_file() and path.resolve() not in expected:
+                    path.unlink()
+                    key = prefix + path.relative_to(root).as_posix()
+                    results.append(
+                        S3TransferResult(bucket_name, key, str(path), "deleted")
+                    )
+        return results
+
+    @staticmethod
+    def _get_s3_sync_path(root: Path, name: str) -> Optional[Path]:
+        """Local path of an object in a synced directory, `None` if its key
+        would land outside of the directory (e.g. with ``..`` in it).
+        """
+        path = root / name
+        resolved_root = root.resolve()
+        resolved = path.resolve()
+        if resolved == resolved_root or not resolved.is_relative_to(resolved_root):
+            return None
+        return path
 
     @aws_dependency_required
     def generate_presigned_url(
@@ -576,7 +1107,7 @@ class ServiceS3(AWSBase):
                 "get_object",
                 **request_params,
             )
-        except ClientError as e:
+        except botocore_exceptions.ClientError as e:
             self.logger.error("Client request error: %s", str(e))
         return response
 
@@ -665,64 +1196,61 @@ class ServiceTextract(AWSBase):
     def _parse_response_blocks(self, response):
         if "Blocks" not in response:
             return False
-        blocks = response["Blocks"]
         raw_tables = {}
         self.cells = {}
         self.lines = {}
         self.words = {}
-        for b in blocks:
-            if b["BlockType"] == "TABLE":
-                raw_tables[b["Id"]] = []
-                if "Relationships" in b:
-                    raw_tables[b["Id"]] = b["Relationships"][0]["Ids"]
-            elif b["BlockType"] == "CELL":
+        for b in response["Blocks"]:
+            block_type = b["BlockType"]
+            if block_type == "WORD":
+                self.words[b["Id"]] = b["Text"]
+            elif block_type == "LINE":
+                self.lines[b["Id"]] = [b["Text"], b["Confidence"]]
+            elif block_type == "CELL":
                 self.cells[b["Id"]] = {
                     "Content": None,
                     "RowIndex": b["RowIndex"],
                     "ColumnIndex": b["ColumnIndex"],
                     "RowSpan": b["RowSpan"],
                     "ColumnSpan": b["ColumnSpan"],
-                    "Childs": [],
+                    "Childs": b["Relationships"][0]["Ids"]
+                    if "Relationships" in b
+                    else [],
                 }
-                if "Relationships" in b:
-                    self.cells[b["Id"]]["Childs"] = b["Relationships"][0]["Ids"]
-            elif b["BlockType"] == "LINE":
-                self.lines[b["Id"]] = [b["Text"], b["Confidence"]]
-            elif b["BlockType"] == "WORD":
-                self.words[b["Id"]] = b["Text"]
+            elif block_type == "TABLE":
+                raw_tables[b["Id"]] = (
+                    b["Relationships"][0]["Ids"] if "Relationships" in b else []
+                )
         self._process_cells()
         self._process_tables(raw_tables)
         return True
 
     def _process_cells(self):
-        for idx, cell in self.cells.items():
-            content = ""
-            for cid in cell["Childs"]:
-                content += "{} ".format(self.words[cid])
-            # pylint: disable=unnecessary-dict-index-lookup
-            self.cells[idx]["Content"] = content
+        words = self.words
+        for cell in self.cells.values():
+            # Cell content is the words of the cell, each followed by a space.
+            cell["Content"] = "".join(
+                [words[cid] + " " for cid in cell["Childs"] if cid in words]
+            )
 
     def _process_tables(self, raw_tables):
         self.tables = {}
+        if not raw_tables:
+            return
+        tables = import_tables()
+        if not tables:
+            self.logger.info(
+                "Tables in the AWS response will be in a `dictionary` type, "
+                "because `RPA.Tables` library is not available in the scope."
+            )
         for idx, t in raw_tables.items():
             rows = {}
             for tid in t:
-                row = self.cells[tid]["RowIndex"]
-                col = self.cells[tid]["ColumnIndex"]
-                val = self.cells[tid]["Content"]
-                if row in rows.keys():
-                    rows[row][col] = val
-                else:
-                    rows[row] = {col: val}
-
-            tables = import_tables()
-            if not tables:
-                self.logger.info(
-                    "Tables in the AWS response will be in a `dictionary` type, "
-                    "because `RPA.Tables` library is not available in the scope."
-                )
+                cell = self.cells[tid]
+                row = rows.setdefault(cell["RowIndex"], {})
+                row[cell["ColumnIndex"]] = cell["Content"]
             data = [
-                [rows[col][idx] for idx in sorted(rows[col])] for col in sorted(rows)
+                [rows[row][col] for col in sorted(rows[row])] for row in sorted(rows)
             ]
             self.tables[idx] = tables().create_table(data) if tables else data
 
@@ -1024,6 +1552,9 @@ class ServiceTextract(AWSBase):
             - Form
             - Field
 
+        Only the blocks of the response are indexed here, the pages, lines,
+        tables and forms are built when they are first accessed.
+
         :param response: JSON response from AWS Textract service
         :return: `TextractDocument` object
 
@@ -1119,6 +1650,199 @@ class ServiceComprehend(AWSBase):
         return response
 
 
+SQS_BATCH_SIZE = 10  # the maximum of the SQS batch actions
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class SQSConsumer:
+    """Processes the messages of a SQS queue one by one, while a background
+    thread prefetches the next batch with long polling and another one keeps
+    extending the visibility timeout of the received, not yet handled messages.
+
+    Handled messages are deleted in batches. Failed ones are left alone, so they
+    become visible again once their visibility timeout expires (and are moved to
+    the dead-letter queue, if any, after too many receives). The prefetched
+    messages which are left unhandled are released back to the queue right away.
+    """
+
+    def __init__(
+        self,
+        client,
+        queue_url: str,
+        batch_size: int = SQS_BATCH_SIZE,
+        wait_time: int = 20,
+        visibility_timeout: int = 30,
+        prefetch: int = 1,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.client = client
+        self.queue_url = queue_url
+        self.batch_size = max(1, min(int(batch_size), SQS_BATCH_SIZE))
+        self.wait_time = int(wait_time)
+        self.visibility_timeout = max(1, int(visibility_timeout))
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._batches = queue.Queue(maxsize=max(1, int(prefetch)))
+        self._held: Dict[str, str] = {}  # message ID -> receipt handle
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def run(
+        self,
+        handler: Callable[[dict], Any],
+        max_messages: Optional[int] = None,
+        stop_when_empty: bool = True,
+    ) -> dict:
+        """Call `handler` with every message until `max_messages` were handled or,
+        with `stop_when_empty`, a long poll returned no messages.
+        """
+        threads = [
+            threading.Thread(target=self._prefetch, daemon=True),
+            threading.Thread(target=self._keep_invisible, daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        stats = {"processed": 0, "failed": 0}
+        try:
+            while max_messages is None or sum(stats.values()) < max_messages:
+                batch = self._batches.get()
+                if isinstance(batch, Exception):
+                    raise batch
+                if not batch:
+                    if stop_when_empty:
+                        break
+                    continue
+                self._handle_batch(batch, handler, stats, max_messages)
+        finally:
+            self._stopped.set()
+            # A receive in progress ends within the long poll, its messages
+            # are released by the prefetching thread before returning.
+            threads[0].join(timeout=self.wait_time + 5)
+            self._release_held()
+        return stats
+
+    def _handle_batch(self, batch, handler, stats, max_messages):
+        handled = []
+        try:
+            for message in batch:
+                if max_messages is not None and sum(stats.values()) >= max_messages:
+                    break
+                try:
+                    handler(message)
+                except Exception as err:  # pylint: disable=broad-except
+                    self.logger.warning(
+                        "Handling of message %s failed: %s", message["MessageId"], err
+                    )
+                    stats["failed"] += 1
+                    self._unhold(message)
+                else:
+                    stats["processed"] += 1
+                    handled.append(message)
+        finally:
+            self._delete(handled)
+
+    def _receive(self) -> list:
+        response = self.client.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=self.batch_size,
+            WaitTimeSeconds=self.wait_time,
+            VisibilityTimeout=self.visibility_timeout,
+            AttributeNames=["All"],
+            MessageAttributeNames=["All"],
+        )
+        return response.get("Messages", [])
+
+    def _put(self, item) -> bool:
+        # Gives up once stopped, instead of blocking on a full queue forever.
+        while not self._stopped.is_set():
+            try:
+                self._batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _prefetch(self):
+        while not self._stopped.is_set():
+            try:
+                messages = self._receive()
+            except Exception as err:  # pylint: disable=broad-except
+                self._put(err)
+                return
+            with self._lock:
+                for message in messages:
+                    self._held[message["MessageId"]] = message["ReceiptHandle"]
+            if not self._put(messages):
+                break
+        # Whatever arrived while stopping goes back to the queue.
+        self._release_held()
+
+    def _keep_invisible(self):
+        # Extends the timeout well before it expires, every half of it.
+        while not self._stopped.wait(self.visibility_timeout / 2):
+            with self._lock:
+                held = list(self._held.items())
+            for chunk in _chunks(held, SQS_BATCH_SIZE):
+                self._change_visibility(chunk, self.visibility_timeout)
+
+    def _change_visibility(self, held: list, timeout: int):
+        try:
+            response = self.client.change_message_visibility_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {
+                        "Id": str(idx),
+                        "ReceiptHandle": handle,
+                        "VisibilityTimeout": timeout,
+                    }
+                    for idx, (_, handle) in enumerate(held)
+                ],
+            )
+        except botocore_exceptions.ClientError as err:
+            self.logger.warning("Changing message visibility failed: %s", err)
+            return
+        for failure in response.get("Failed", []):
+            self.logger.warning(
+                "Changing visibility of message %s failed: %s",
+                held[int(failure["Id"])][0],
+                failure.get("Message"),
+            )
+
+    def _unhold(self, message: dict):
+        with self._lock:
+            self._held.pop(message["MessageId"], None)
+
+    def _release_held(self):
+        with self._lock:
+            held = list(self._held.items())
+            self._held.clear()
+        for chunk in _chunks(held, SQS_BATCH_SIZE):
+            self._change_visibility(chunk, 0)
+
+    def _delete(self, messages: List[dict]):
+        for message in messages:
+            self._unhold(message)
+        for chunk in _chunks(messages, SQS_BATCH_SIZE):
+            response = self.client.delete_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {"Id": str(idx), "ReceiptHandle": message["ReceiptHandle"]}
+                    for idx, message in enumerate(chunk)
+                ],
+            )
+            for failure in response.get("Failed", []):
+                self.logger.warning(
+                    "Deleting message %s failed: %s",
+                    chunk[int(failure["Id"])]["MessageId"],
+                    failure.get("Message"),
+                )
+
+
 class ServiceSQS(AWSBase):
     """Class for AWS SQS service"""
 
@@ -1153,12 +1877,16 @@ class ServiceSQS(AWSBase):
 
     @aws_dependency_required
     def send_message(
-        self, message: Optional[str] = None, message_attributes: Optional[dict] = None
+        self,
+        message: Optional[str] = None,
+        message_attributes: Optional[dict] = None,
+        delay_seconds: int = 10,
     ) -> dict:
         """Send message to the queue
 
         :param message: body of the message
         :param message_attributes: attributes of the message
+        :param delay_seconds: seconds the message stays invisible after sending
         :return: send message response as dict
         """
         required_param(message, "send_message")
@@ -1167,12 +1895,63 @@ class ServiceSQS(AWSBase):
             message_attributes = {}
         response = client.send_message(
             QueueUrl=self.queue_url,
-            DelaySeconds=10,
+            DelaySeconds=int(delay_seconds),
             MessageAttributes=message_attributes,
             MessageBody=message,
         )
         return response
 
+    @aws_dependency_required
+    def send_messages(
+        self,
+        messages: List[Union[str, dict]],
+        message_attributes: Optional[dict] = None,
+        delay_seconds: int = 0,
+    ) -> dict:
+        """Send messages to the queue in batches of 10
+
+        :param messages: message bodies, or dictionaries with the ``MessageBody``
+         and optionally any other `batch entry <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sqs/client/send_message_batch.html>`_
+         fields, like ``MessageAttributes`` or ``MessageGroupId``
+        :param message_attributes: attributes of the messages given as strings
+        :param delay_seconds: seconds the messages stay invisible after sending,
+         unless set per message
+        :return: dictionary with the ``Successful`` and ``Failed`` entries of all
+         the batches, the ``Id`` of an entry being the index of the message
+
+        .. code-block:: robotframework
+
+            *** Tasks ***
+            Queue Invoices
+                Init SQS Client    queue_url=${QUEUE_URL}
+                ${result}=    Send Messages    ${invoice_ids}
+                Should Be Empty    ${result}[Failed]
+        """  # noqa: E501
+        required_param(messages, "send_messages")
+        client = self._get_client_for_service("sqs")
+        entries = []
+        for idx, message in enumerate(messages):
+            entry = {"DelaySeconds": int(delay_seconds)}
+            if isinstance(message, dict):
+                entry.update(message)
+            else:
+                entry["MessageBody"] = message
+                if message_attributes:
+                    entry["MessageAttributes"] = message_attributes
+            entry["Id"] = str(idx)
+            entries.append(entry)
+
+        result = {"Successful": [], "Failed": []}
+        for chunk in _chunks(entries, SQS_BATCH_SIZE):
+            response = client.send_message_batch(QueueUrl=self.queue_url, Entries=chunk)
+            result["Successful"].extend(response.get("Successful", []))
+            result["Failed"].extend(response.get("Failed", []))
+        if result["Failed"]:
+            self.logger.warning(
+                "Sending %d of %d messages failed", len(result["Failed"]), len(entries)
+            )
+        return result
+
     @aws_dependency_required
     def receive_message(self) -> dict:
         """Receive message from queue
@@ -1185,6 +1964,46 @@ class ServiceSQS(AWSBase):
         )
         return response["Messages"][0] if "Messages" in response else None
 
+    @aws_dependency_required
+    def receive_messages(
+        self,
+        max_messages: int = 10,
+        wait_time: int = 20,
+        visibility_timeout: Optional[int] = None,
+    ) -> list:
+        """Receive messages from queue with long polling
+
+        Up to 10 messages are received per request, waiting for up to
+        ``wait_time`` seconds for the first one to arrive. Requests are repeated
+        until ``max_messages`` are received or a request returns none.
+
+        :param max_messages: maximum number of messages to receive
+        :param wait_time: seconds to wait for messages, from 0 to 20
+        :param visibility_timeout: seconds the received messages are hidden from
+         the other consumers, by default the one of the queue
+        :return: list of messages as dicts, with all their attributes
+        """
+        client = self._get_client_for_service("sqs")
+        params = {
+            "QueueUrl": self.queue_url,
+            "WaitTimeSeconds": int(wait_time),
+            "AttributeNames": ["All"],
+            "MessageAttributeNames": ["All"],
+        }
+        if visibility_timeout is not None:
+            params["VisibilityTimeout"] = int(visibility_timeout)
+
+        messages = []
+        while len(messages) < int(max_messages):
+            params["MaxNumberOfMessages"] = min(
+                int(max_messages) - len(messages), SQS_BATCH_SIZE
+            )
+            received = client.receive_message(**params).get("Messages", [])
+            if not received:
+                break
+            messages.extend(received)
+        return messages
+
     @aws_dependency_required
     def delete_message(self, receipt_handle: Optional[str] = None):
         """Delete message in the queue
@@ -1199,6 +2018,106 @@ class ServiceSQS(AWSBase):
         )
         return response
 
+    @aws_dependency_required
+    def delete_messages(self, messages: List[Union[str, dict]]) -> dict:
+        """Delete messages in the queue in batches of 10
+
+        :param messages: received messages, or their receipt handles
+        :return: dictionary with the ``Successful`` and ``Failed`` entries of all
+         the batches, the ``Id`` of an entry being the index of the message
+        """
+        required_param(messages, "delete_messages")
+        client = self._get_client_for_service("sqs")
+        entries = [
+            {
+                "Id": str(idx),
+                "ReceiptHandle": (
+                    message["ReceiptHandle"] if isinstance(message, dict) else message
+                ),
+            }
+            for idx, message in enumerate(messages)
+        ]
+
+        result = {"Successful": [], "Failed": []}
+        for chunk in _chunks(entries, SQS_BATCH_SIZE):
+            response = client.delete_message_batch(
+                QueueUrl=self.queue_url, Entries=chunk
+            )
+            result["Successful"].extend(response.get("Successful", []))
+            result["Failed"].extend(response.get("Failed", []))
+        return result
+
+    @aws_dependency_required
+    def consume_messages(
+        self,
+        handler: Union[str, Callable[[dict], Any]],
+        max_messages: Optional[int] = None,
+        stop_when_empty: bool = True,
+        wait_time: int = 20,
+        visibility_timeout: Optional[int] = None,
+        batch_size: int = 10,
+        prefetch: int = 1,
+    ) -> dict:
+        """Process the messages of the queue one by one with a keyword or a
+        Python function, deleting the successfully handled messages.
+
+        While a message is being handled, the next batch is prefetched in the
+        background with long polling, and the visibility timeout of the received
+        messages is extended for as long as they wait or are being handled, so
+        no other consumer gets them meanwhile.
+
+        A message whose handler fails is not deleted, but becomes visible again
+        once its visibility timeout expires, to be retried (or moved to the
+        dead-letter queue of the queue).
+
+        :param handler: name of the keyword or the function to call with each
+         message dictionary
+        :param max_messages: stop after handling this many messages
+        :param stop_when_empty: stop when no messages arrive during ``wait_time``
+        :param wait_time: seconds to wait for messages per poll, from 0 to 20
+        :param visibility_timeout: seconds the messages are hidden at a time and
+         extended by, by default the one of the queue
+        :param batch_size: messages received per poll, at most 10
+        :param prefetch: number of batches received in advance
+        :return: dictionary with the number of ``processed`` and ``failed``
+         messages
+
+        .. code-block:: robotframework
+
+            *** Keywords ***
+            Process Invoice
+                [Arguments]    ${message}
+                Log    ${message}[Body]
+
+            *** Tasks ***
+            Process Invoice Queue
+                Init SQS Client    queue_url=${QUEUE_URL}
+                ${stats}=    Consume Messages    Process Invoice
+                Log    Processed ${stats}[processed] messages
+        """
+        client = self._get_client_for_service("sqs")
+        if visibility_timeout is None:
+            attributes = client.get_queue_attributes(
+                QueueUrl=self.queue_url, AttributeNames=["VisibilityTimeout"]
+            )["Attributes"]
+            visibility_timeout = int(attributes["VisibilityTimeout"])
+        if isinstance(handler, str):
+            handler = partial(BuiltIn().run_keyword, handler)
+        consumer = SQSConsumer(
+            client,
+            self.queue_url,
+            batch_size=batch_size,
+            wait_time=wait_time,
+            visibility_timeout=visibility_timeout,
+            prefetch=prefetch,
+            logger=self.logger,
+        )
+        stats = consumer.run(handler, max_messages, stop_when_empty)
+        self.logger.info(
+            "Processed %d messages, %d failed", stats["processed"], stats["failed"]
+        )
+        return stats
+
     @aws_dependency_required
     def create_queue(self, queue_name: Optional[str] = None):
         """Create queue with name
@@ -1208,7 +2127,7 @@ class ServiceSQS(AWSBase):
         """
         required_param(queue_name, "create_queue")
         client = self._get_client_for_service("sqs")
-        response = client.create_queue(queue_name)
+        response = client.create_queue(QueueName=queue_name)
         return response
 
     @aws_dependency_required
@@ -1220,10 +2139,22 @@ class ServiceSQS(AWSBase):
         """
         required_param(queue_name, "delete_queue")
         client = self._get_client_for_service("sqs")
-        response = client.delete_queue(queue_name)
+        queue_url = client.get_queue_url(QueueName=queue_name)["QueueUrl"]
+        response = client.delete_queue(QueueUrl=queue_url)
         return response
 
 
+REDSHIFT_TAGGED_TYPES = {
+    "blobValue": bytes,
+    "booleanValue": bool,
+    "doubleValue": float,
+    "isNull": lambda a: None,
+    "longValue": int,
+    "stringValue": str,
+    "SDK_UNKNOWN_MEMBER": lambda a: "UNKNOWN_DATA_MEMBER",
+}
+
+
 class ServiceRedshiftData(AWSBase):
     """Class for AWS Redshift Data API Service."""
 
@@ -1444,12 +2375,36 @@ class ServiceRedshiftData(AWSBase):
             Defaults to 40.
         """
         client = self._get_client_for_service("redshift-data")
+        finished_statement = self._wait_for_redshift_statement(
+            client, statement_id, timeout
+        )
+        if not finished_statement["HasResultSet"]:
+            return finished_statement.get("ResultRows", 0)
+
+        tables = import_tables()
+        if not tables:
+            self.logger.info(
+                "Tables in the AWS response will be in a `dictionary` type, "
+                "because `RPA.Tables` library is not available in the scope."
+            )
+        column_names, rows = [], []
+        for column_names, page_rows in self._iterate_redshift_result_pages(
+            client, statement_id
+        ):
+            rows.extend(page_rows)
+        if tables:
+            return tables().create_table(rows, columns=column_names)
+        return [dict(zip(column_names, row)) for row in rows]
+
+    def _wait_for_redshift_statement(
+        self, client, statement_id: str, timeout: int = 40
+    ) -> dict:
         try:
             statement_waiter = self._create_waiter_for_results(
                 client, delay=2, max_attempts=int(timeout / 2)
             )
             statement_waiter.wait(Id=statement_id)
-        except WaiterError as e:
+        except botocore_exceptions.WaiterError as e:
             error_message = (
                 e.last_response.get("Error", "No error details available")
                 if hasattr(e.last_response, "get")
@@ -1471,26 +2426,136 @@ class ServiceRedshiftData(AWSBase):
             "Statement finished, total rows affected: "
             + str(finished_statement.get("ResultRows", "NONE"))
         )
-        if finished_statement["HasResultSet"]:
-            paginator = client.get_paginator("get_statement_result")
-            full_result = paginator.paginate(Id=statement_id).build_full_result()
-
-            tables = import_tables()
-            if not tables:
-                self.logger.info(
-                    "Tables in the AWS response will be in a `dictionary` type, "
-                    "because `RPA.Tables` library is not available in the scope."
-                )
-            column_names = [
-                m.get("name") for m in full_result.get("ColumnMetadata", {})
-            ]
-            data = [
-                {c: self._parse_tagged_union(f) for c, f in zip(column_names, row)}
-                for row in full_result.get("Records", [])
+        return finished_statement
+
+    def _iterate_redshift_result_pages(
+        self, client, statement_id: str
+    ) -> Generator[Tuple[List[str], List[list]], None, None]:
+        """Yields the column names and the parsed rows of every result page,
+        fetching the next page only when the previous one was consumed.
+        """
+        paginator = client.get_paginator("get_statement_result")
+        column_names = None
+        parse = self._parse_tagged_union
+        for page in paginator.paginate(Id=statement_id):
+            if column_names is None:
+                column_names = [m.get("name") for m in page.get("ColumnMetadata", [])]
+            yield column_names, [
+                [parse(field) for field in record] for record in page.get("Records", [])
             ]
-            return tables().create_table(data) if tables else data
-        else:
-            return finished_statement.get("ResultRows", 0)
+
+    @aws_dependency_required
+    def iterate_redshift_statement_results(
+        self, statement_id: str, timeout: int = 40, as_columns: bool = False
+    ) -> Generator[Union[SqlTable, List[Dict], Dict[str, list]], None, None]:
+        """Iterate over the results of a SQL statement previously submitted
+        to Redshift one result page at a time, waiting for the statement to
+        finish first. See ``Get Redshift Statement Results`` for the details.
+
+        Only one page of results is held in memory at a time, and the next one
+        is requested only once the previous one was processed, so even results
+        too large for ``Get Redshift Statement Results`` can be handled in chunks.
+
+        :param statement_id: The statement id to use to retrieve results.
+        :param timeout: An integer used to calculate the maximum wait.
+            Defaults to 40.
+        :param as_columns: Yield the pages as dictionaries of column names to
+            lists of values, instead of tables (or lists of dictionaries if
+            ``RPA.Tables`` is not available).
+        :return: Generator of result pages, nothing if the statement
+            has no tabular results.
+
+        **Robot framework example:**
+
+        .. code-block:: robotframework
+
+            *** Tasks ***
+            Process Orders
+                ${id}=    Execute Redshift Statement Asyncronously
+                ...    select * from orders
+                ${pages}=    Iterate Redshift Statement Results    ${id}
+                FOR    ${table}    IN    @{pages}
+                    Process Order Batch    ${table}
+                END
+        """
+        client = self._get_client_for_service("redshift-data")
+        finished_statement = self._wait_for_redshift_statement(
+            client, statement_id, timeout
+        )
+        if not finished_statement["HasResultSet"]:
+            return
+
+        tables = None if as_columns else import_tables()
+        for column_names, rows in self._iterate_redshift_result_pages(
+            client, statement_id
+        ):
+            if as_columns:
+                yield {
+                    name: [row[idx] for row in rows]
+                    for idx, name in enumerate(column_names)
+                }
+            elif tables:
+                yield tables().create_table(rows, columns=column_names)
+            else:
+                yield [dict(zip(column_names, row)) for row in rows]
+
+    @aws_dependency_required
+    def export_redshift_statement_results(
+        self,
+        statement_id: str,
+        path: str,
+        timeout: int = 40,
+        delimiter: str = ",",
+        header: bool = True,
+        encoding: str = "utf-8",
+    ) -> int:
+        """Write the results of a SQL statement previously submitted to
+        Redshift into a CSV file page by page, as they are fetched, without
+        collecting them in memory.
+
+        :param statement_id: The statement id to use to retrieve results.
+        :param path: The CSV file to write, overwritten if it exists.
+        :param timeout: An integer used to calculate the maximum wait.
+            Defaults to 40.
+        :param delimiter: The field delimiter of the CSV file.
+        :param header: Write the column names as the first line.
+        :param encoding: The encoding of the CSV file.
+        :return: The number of rows written.
+
+        **Robot framework example:**
+
+        .. code-block:: robotframework
+
+            *** Tasks ***
+            Export Orders
+                ${id}=    Execute Redshift Statement Asyncronously
+                ...    select * from orders
+                ${rows}=    Export Redshift Statement Results
+                ...    ${id}    ${OUTPUT_DIR}${/}orders.csv
+        """
+        client = self._get_client_for_service("redshift-data")
+        finished_statement = self._wait_for_redshift_statement(
+            client, statement_id, timeout
+        )
+        if not finished_statement["HasResultSet"]:
+            raise RedshiftDatabaseError(
+                f"Statement '{statement_id}' has no tabular results to export"
+            )
+
+        row_count = 0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", newline="", encoding=encoding) as stream:
+            writer = csv.writer(stream, delimiter=delimiter)
+            for column_names, rows in self._iterate_redshift_result_pages(
+                client, statement_id
+            ):
+                if header and row_count == 0:
+                    writer.writerow(column_names)
+                    header = False
+                writer.writerows(rows)
+                row_count += len(rows)
+        self.logger.info("Exported %d rows into: %s", row_count, path)
+        return row_count
 
     def create_redshift_statement_parameters(self, **params) -> List[Dict[str, str]]:
         r"""Returns a formatted dictionary to be used in
@@ -1518,20 +2583,10 @@ class ServiceRedshiftData(AWSBase):
         return [{"name": k, "value": v} for (k, v) in params.items()]
 
     def _parse_tagged_union(self, tagged_union: dict):
-        TAGGED_TYPES = {
-            "blobValue": bytes,
-            "booleanValue": bool,
-            "doubleValue": float,
-            "isNull": lambda a: None,
-            "longValue": int,
-            "stringValue": str,
-            "SDK_UNKNOWN_MEMBER": lambda a: "UNKNOWN_DATA_MEMBER",
-        }
+        # A field holds a single member, with the type of the value as its key.
         for item_key, item_value in tagged_union.items():
-            try:
-                output = TAGGED_TYPES[item_key](item_value)
-            except KeyError:
-                output = "UNKNOWN_DATA_MEMBER"
+            converter = REDSHIFT_TAGGED_TYPES.get(item_key)
+            output = converter(item_value) if converter else "UNKNOWN_DATA_MEMBER"
         return output
 
     def _create_waiter_for_results(
@@ -1539,7 +2594,7 @@ class ServiceRedshiftData(AWSBase):
         redshift_data_client,
         delay: int = 2,
         max_attempts: int = 20,
-    ) -> Waiter:
+    ) -> "botocore_waiter.Waiter":
         waiter_name = "StatementFinished"
         waiter_config = {
             "version": 2,
@@ -1589,8 +2644,10 @@ class ServiceRedshiftData(AWSBase):
                 }
             },
         }
-        return create_waiter_with_client(
-            waiter_name, WaiterModel(waiter_config), redshift_data_client
+        return botocore_waiter.create_waiter_with_client(
+            waiter_name,
+            botocore_waiter.WaiterModel(waiter_config),
+            redshift_data_client,
         )
 
     @aws_dependency_required
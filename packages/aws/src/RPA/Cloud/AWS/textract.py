@@ -1,9 +1,80 @@
 # pylint: skip-file
 # -*- coding: utf-8 -*-
-"""Top-level package for amazon-textract-response-parser."""
+"""Top-level package for amazon-textract-response-parser.
+
+The model is built lazily on top of a compact `BlockStore`: the response blocks
+are indexed once, while the words, lines, tables and forms (with their
+geometries) are created only when accessed.
+"""
+from array import array
+from bisect import bisect_left
+
+
+class BlockStore:
+    """Compact index over the blocks of one or more Textract responses.
+
+    Blocks are kept in a single list, addressed by their position. Block IDs map
+    to positions and the positions of each block type are kept in sorted integer
+    arrays, so the relationships are resolved only when needed.
+    """
+
+    __slots__ = ("_blocks", "_index", "_types", "_pages")
+
+    def __init__(self, responsePages):
+        self._blocks = []
+        self._index = {}
+        self._types = {}
+        self._pages = array("L")
+        for page in responsePages:
+            for block in page["Blocks"]:
+                if "BlockType" not in block:
+                    continue
+                position = len(self._blocks)
+                self._blocks.append(block)
+                if "Id" in block:
+                    self._index[block["Id"]] = position
+                blockType = block["BlockType"]
+                positions = self._types.get(blockType)
+                if positions is None:
+                    positions = self._types[blockType] = array("L")
+                positions.append(position)
+                if blockType == "PAGE":
+                    self._pages.append(position)
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def __getitem__(self, blockId):
+        return self._blocks[self._index[blockId]]
+
+    def __contains__(self, blockId):
+        return blockId in self._index
+
+    @property
+    def blocks(self):
+        return self._blocks
+
+    def get(self, blockId, default=None):
+        position = self._index.get(blockId)
+        return default if position is None else self._blocks[position]
+
+    def pageRanges(self):
+        """Yield the ``(start, end)`` block positions of every document page."""
+        ends = list(self._pages[1:]) + [len(self._blocks)]
+        return zip(self._pages, ends)
+
+    def positionsOfType(self, blockType, start=0, end=None):
+        """Positions of the blocks of the given type within ``[start, end)``."""
+        positions = self._types.get(blockType)
+        if not positions:
+            return ()
+        end = len(self._blocks) if end is None else end
+        return positions[bisect_left(positions, start) : bisect_left(positions, end)]
 
 
 class BoundingBox:
+    __slots__ = ("_width", "_height", "_left", "_top")
+
     def __init__(self, width, height, left, top):
         self._width = width
         self._height = height
@@ -33,6 +104,8 @@ class BoundingBox:
 
 
 class Polygon:
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x, y):
         self._x = x
         self._y = y
@@ -50,21 +123,17 @@ class Polygon:
 
 
 class Geometry:
+    __slots__ = ("_boundingBox", "_polygon")
+
     def __init__(self, geometry):
         boundingBox = geometry["BoundingBox"]
-        polygon = geometry["Polygon"]
-        bb = BoundingBox(
+        self._boundingBox = BoundingBox(
             boundingBox["Width"],
             boundingBox["Height"],
             boundingBox["Left"],
             boundingBox["Top"],
         )
-        pgs = []
-        for pg in polygon:
-            pgs.append(Polygon(pg["X"], pg["Y"]))
-
-        self._boundingBox = bb
-        self._polygon = pgs
+        self._polygon = [Polygon(pg["X"], pg["Y"]) for pg in geometry["Polygon"]]
 
     def __repr__(self):
         s = "BoundingBox: {}".format(str(self._boundingBox))
@@ -79,215 +148,154 @@ class Geometry:
         return self._polygon
 
 
-class Word:
-    def __init__(self, block, blockMap):
-        self._block = block
-        self._confidence = block["Confidence"]
-        self._geometry = Geometry(block["Geometry"])
-        self._id = block["Id"]
-        self._text = ""
-        if block["Text"]:
-            self._text = block["Text"]
+class _Block:
+    """Common wrapper of a response block, the geometry is created on access."""
 
-    def __repr__(self):
-        return self._text
+    __slots__ = ("_block", "_geometry")
+
+    def __init__(self, block):
+        self._block = block
+        self._geometry = None
 
     @property
     def confidence(self):
-        return self._confidence
+        return self._block["Confidence"]
 
     @property
     def geometry(self):
+        if self._geometry is None:
+            self._geometry = Geometry(self._block["Geometry"])
         return self._geometry
 
     @property
     def id(self):
-        return self._id
-
-    @property
-    def text(self):
-        return self._text
+        return self._block["Id"]
 
     @property
     def block(self):
         return self._block
 
 
-class Line:
-    def __init__(self, block, blockMap):
+class Word(_Block):
+    __slots__ = ()
 
-        self._block = block
-        self._confidence = block["Confidence"]
-        self._geometry = Geometry(block["Geometry"])
-        self._id = block["Id"]
-
-        self._text = ""
-        if block["Text"]:
-            self._text = block["Text"]
-
-        self._words = []
-        if "Relationships" in block and block["Relationships"]:
-            for rs in block["Relationships"]:
-                if rs["Type"] == "CHILD":
-                    for cid in rs["Ids"]:
-                        if blockMap[cid]["BlockType"] == "WORD":
-                            self._words.append(Word(blockMap[cid], blockMap))
+    def __init__(self, block, blockMap=None):
+        super().__init__(block)
 
     def __repr__(self):
-        return self._text
+        return self.text
 
     @property
-    def confidence(self):
-        return self._confidence
+    def text(self):
+        return self._block.get("Text") or ""
 
-    @property
-    def geometry(self):
-        return self._geometry
 
-    @property
-    def id(self):
-        return self._id
+class Line(_Block):
+    __slots__ = ("_blockMap", "_words")
+
+    def __init__(self, block, blockMap):
+        super().__init__(block)
+        self._blockMap = blockMap
+        self._words = None
+
+    def __repr__(self):
+        return self.text
 
     @property
     def words(self):
+        if self._words is None:
+            self._words = [
+                Word(child)
+                for child in _related(self._block, self._blockMap)
+                if child["BlockType"] == "WORD"
+            ]
         return self._words
 
     @property
     def text(self):
-        return self._text
-
-    @property
-    def block(self):
-        return self._block
-
+        return self._block.get("Text") or ""
 
-class SelectionElement:
-    def __init__(self, block, blockMap):
-        self._confidence = block["Confidence"]
-        self._geometry = Geometry(block["Geometry"])
-        self._id = block["Id"]
-        self._selectionStatus = block["SelectionStatus"]
 
-    @property
-    def confidence(self):
-        return self._confidence
+class SelectionElement(_Block):
+    __slots__ = ()
 
-    @property
-    def geometry(self):
-        return self._geometry
-
-    @property
-    def id(self):
-        return self._id
+    def __init__(self, block, blockMap=None):
+        super().__init__(block)
 
     @property
     def selectionStatus(self):
-        return self._selectionStatus
+        return self._block["SelectionStatus"]
 
 
-class FieldKey:
-    def __init__(self, block, children, blockMap):
-        self._block = block
-        self._confidence = block["Confidence"]
-        self._geometry = Geometry(block["Geometry"])
-        self._id = block["Id"]
-        self._text = ""
-        self._content = []
-
-        t = []
+class _FieldPart(_Block):
+    """Key or value of a form field, made of the given child blocks."""
 
-        for eid in children:
-            wb = blockMap[eid]
-            if wb["BlockType"] == "WORD":
-                w = Word(wb, blockMap)
-                self._content.append(w)
-                t.append(w.text)
+    __slots__ = ("_children", "_blockMap", "_content")
 
-        if t:
-            self._text = " ".join(t)
+    def __init__(self, block, children, blockMap):
+        super().__init__(block)
+        self._children = children
+        self._blockMap = blockMap
+        self._content = None
 
     def __repr__(self):
-        return self._text
+        return self.text
 
-    @property
-    def confidence(self):
-        return self._confidence
-
-    @property
-    def geometry(self):
-        return self._geometry
-
-    @property
-    def id(self):
-        return self._id
+    def _childBlocks(self):
+        for eid in self._children:
+            yield self._blockMap[eid]
 
     @property
     def content(self):
+        if self._content is None:
+            self._content = [
+                Word(child)
+                for child in self._childBlocks()
+                if child["BlockType"] == "WORD"
+            ]
         return self._content
 
     @property
     def text(self):
-        return self._text
-
-    @property
-    def block(self):
-        return self._block
+        return " ".join(
+            child.get("Text") or ""
+            for child in self._childBlocks()
+            if child["BlockType"] == "WORD"
+        )
 
 
-class FieldValue:
-    def __init__(self, block, children, blockMap):
-        self._block = block
-        self._confidence = block["Confidence"]
-        self._geometry = Geometry(block["Geometry"])
-        self._id = block["Id"]
-        self._text = ""
-        self._content = []
-
-        t = []
-
-        for eid in children:
-            wb = blockMap[eid]
-            if wb["BlockType"] == "WORD":
-                w = Word(wb, blockMap)
-                self._content.append(w)
-                t.append(w.text)
-            elif wb["BlockType"] == "SELECTION_ELEMENT":
-                se = SelectionElement(wb, blockMap)
-                self._content.append(se)
-                self._text = se.selectionStatus
-
-        if t:
-            self._text = " ".join(t)
-
-    def __repr__(self):
-        return self._text
+class FieldKey(_FieldPart):
+    __slots__ = ()
 
-    @property
-    def confidence(self):
-        return self._confidence
-
-    @property
-    def geometry(self):
-        return self._geometry
 
-    @property
-    def id(self):
-        return self._id
+class FieldValue(_FieldPart):
+    __slots__ = ()
 
     @property
     def content(self):
+        if self._content is None:
+            self._content = [
+                _wrapCellChild(child)
+                for child in self._childBlocks()
+                if child["BlockType"] in ("WORD", "SELECTION_ELEMENT")
+            ]
         return self._content
 
     @property
     def text(self):
-        return self._text
-
-    @property
-    def block(self):
-        return self._block
+        words = []
+        status = ""
+        for child in self._childBlocks():
+            if child["BlockType"] == "WORD":
+                words.append(child.get("Text") or "")
+            elif child["BlockType"] == "SELECTION_ELEMENT":
+                status = child["SelectionStatus"]
+        return " ".join(words) if words else status
 
 
 class Field:
+    __slots__ = ("_key", "_value")
+
     def __init__(self, block, blockMap):
         self._key = None
         self._value = None
@@ -319,6 +327,8 @@ class Field:
 
 
 class Form:
+    __slots__ = ("_fields", "_fieldsMap")
+
     def __init__(self):
         self._fields = []
         self._fieldsMap = {}
@@ -349,77 +359,57 @@ class Form:
         return results
 
 
-class Cell:
+class Cell(_Block):
+    __slots__ = ("_blockMap", "_content")
+
     def __init__(self, block, blockMap):
-        self._block = block
-        self._confidence = block["Confidence"]
-        self._rowIndex = block["RowIndex"]
-        self._columnIndex = block["ColumnIndex"]
-        self._rowSpan = block["RowSpan"]
-        self._columnSpan = block["ColumnSpan"]
-        self._geometry = Geometry(block["Geometry"])
-        self._id = block["Id"]
-        self._content = []
-        self._text = ""
-        if "Relationships" in block and block["Relationships"]:
-            for rs in block["Relationships"]:
-                if rs["Type"] == "CHILD":
-                    for cid in rs["Ids"]:
-                        blockType = blockMap[cid]["BlockType"]
-                        if blockType == "WORD":
-                            w = Word(blockMap[cid], blockMap)
-                            self._content.append(w)
-                            self._text = self._text + w.text + " "
-                        elif blockType == "SELECTION_ELEMENT":
-                            se = SelectionElement(blockMap[cid], blockMap)
-                            self._content.append(se)
-                            self._text = self._text + se.selectionStatus + ", "
+        super().__init__(block)
+        self._blockMap = blockMap
+        self._content = None
 
     def __repr__(self):
-        return self._text
-
-    @property
-    def confidence(self):
-        return self._confidence
+        return self.text
 
     @property
     def rowIndex(self):
-        return self._rowIndex
+        return self._block["RowIndex"]
 
     @property
     def columnIndex(self):
-        return self._columnIndex
+        return self._block["ColumnIndex"]
 
     @property
     def rowSpan(self):
-        return self._rowSpan
+        return self._block["RowSpan"]
 
     @property
     def columnSpan(self):
-        return self._columnSpan
-
-    @property
-    def geometry(self):
-        return self._geometry
-
-    @property
-    def id(self):
-        return self._id
+        return self._block["ColumnSpan"]
 
     @property
     def content(self):
+        if self._content is None:
+            self._content = [
+                _wrapCellChild(child)
+                for child in _related(self._block, self._blockMap)
+                if child["BlockType"] in ("WORD", "SELECTION_ELEMENT")
+            ]
         return self._content
 
     @property
     def text(self):
-        return self._text
-
-    @property
-    def block(self):
-        return self._block
+        parts = []
+        for child in _related(self._block, self._blockMap):
+            if child["BlockType"] == "WORD":
+                parts.append((child.get("Text") or "") + " ")
+            elif child["BlockType"] == "SELECTION_ELEMENT":
+                parts.append(child["SelectionStatus"] + ", ")
+        return "".join(parts)
 
 
 class Row:
+    __slots__ = ("_cells",)
+
     def __init__(self):
         self._cells = []
 
@@ -431,103 +421,83 @@ class Row:
         return self._cells
 
 
-class Table:
-    def __init__(self, block, blockMap):
+class Table(_Block):
+    __slots__ = ("_blockMap", "_rows")
 
-        self._block = block
-
-        self._confidence = block["Confidence"]
-        self._geometry = Geometry(block["Geometry"])
-
-        self._id = block["Id"]
-        self._rows = []
-
-        ri = 1
-        row = Row()
-        cell = None
-        if "Relationships" in block and block["Relationships"]:
-            for rs in block["Relationships"]:
-                if rs["Type"] == "CHILD":
-                    for cid in rs["Ids"]:
-                        cell = Cell(blockMap[cid], blockMap)
-                        if cell.rowIndex > ri:
-                            self._rows.append(row)
-                            row = Row()
-                            ri = cell.rowIndex
-                        row.cells.append(cell)
-                    if row and row.cells:
-                        self._rows.append(row)
+    def __init__(self, block, blockMap):
+        super().__init__(block)
+        self._blockMap = blockMap
+        self._rows = None
 
     def __repr__(self):
-        return str(self._rows)
-
-    @property
-    def confidence(self):
-        return self._confidence
-
-    @property
-    def geometry(self):
-        return self._geometry
-
-    @property
-    def id(self):
-        return self._id
+        return str(self.rows)
 
     @property
     def rows(self):
+        if self._rows is None:
+            self._rows = []
+            ri = 1
+            row = Row()
+            for child in _related(self._block, self._blockMap):
+                cell = Cell(child, self._blockMap)
+                if cell.rowIndex > ri:
+                    self._rows.append(row)
+                    row = Row()
+                    ri = cell.rowIndex
+                row.cells.append(cell)
+            if row.cells:
+                self._rows.append(row)
         return self._rows
 
-    @property
-    def block(self):
-        return self._block
-
 
 class Page:
-    def __init__(self, blocks, blockMap):
-        self._blocks = blocks
-        self._text = ""
-        self._lines = []
-        self._form = Form()
-        self._tables = []
-        self._content = []
-
-        self._parse(blockMap)
+    __slots__ = (
+        "_store",
+        "_start",
+        "_end",
+        "_items",
+        "_lines",
+        "_tables",
+        "_form",
+        "_geometry",
+    )
+
+    def __init__(self, store, start, end):
+        self._store = store
+        self._start = start
+        self._end = end
+        # Wrapped blocks by their position, shared by `content` and the
+        #  per type accessors.
+        self._items = {}
+        self._lines = None
+        self._tables = None
+        self._form = None
+        self._geometry = None
 
     def __repr__(self):
-        return str(self._content)
-
-    def _parse(self, blockMap):
-        for item in self._blocks:
-            if item["BlockType"] == "PAGE":
-                self._geometry = Geometry(item["Geometry"])
-                self._id = item["Id"]
-            elif item["BlockType"] == "LINE":
-                line = Line(item, blockMap)
-                self._lines.append(line)
-                self._content.append(line)
-                self._text = self._text + line.text + "\n"
-            elif item["BlockType"] == "TABLE":
-                t = Table(item, blockMap)
-                self._tables.append(t)
-                self._content.append(t)
-            elif item["BlockType"] == "KEY_VALUE_SET":
-                if "KEY" in item["EntityTypes"]:
-                    f = Field(item, blockMap)
-                    if f.key:
-                        self._form.addField(f)
-                        self._content.append(f)
-                        # TODO. report error if key can't be found
-                        # print(
-                        #     "WARNING: Detected K/V where key does not have content.
-                        # Excluding key from output."
-                        # )
-                        # print(f)
-                        # print(item)
+        return str(self.content)
+
+    def _build(self, blockType, factory):
+        items = []
+        blocks = self._store.blocks
+        for position in self._store.positionsOfType(blockType, self._start, self._end):
+            item = self._items.get(position)
+            if item is None:
+                item = self._items[position] = factory(blocks[position], self._store)
+            items.append(item)
+        return items
+
+    def _fields(self):
+        fields = []
+        for field in self._build("KEY_VALUE_SET", _buildField):
+            if field is not None and field.key:
+                fields.append(field)
+        return fields
 
     def getLinesInReadingOrder(self):
         columns = []
         lines = []
-        for item in self._lines:
+        for item in self.lines:
             column_found = False
             for index, column in enumerate(columns):
                 bbox_left = item.geometry.boundingBox.left
@@ -559,104 +529,102 @@ class Page:
         return lines
 
     def getTextInReadingOrder(self):
-        lines = self.getLinesInReadingOrder()
-        text = ""
-        for line in lines:
-            text = text + line[1] + "\n"
-        return text
+        return "".join(line[1] + "\n" for line in self.getLinesInReadingOrder())
 
     @property
     def blocks(self):
-        return self._blocks
+        return self._store.blocks[self._start : self._end]
 
     @property
     def text(self):
-        return self._text
+        return "".join(line.text + "\n" for line in self.lines)
 
     @property
     def lines(self):
+        if self._lines is None:
+            self._lines = self._build("LINE", Line)
         return self._lines
 
     @property
     def form(self):
+        if self._form is None:
+            self._form = Form()
+            for field in self._fields():
+                self._form.addField(field)
         return self._form
 
     @property
     def tables(self):
+        if self._tables is None:
+            self._tables = self._build("TABLE", Table)
         return self._tables
 
     @property
     def content(self):
-        return self._content
+        items = {id(item) for item in self.lines + self.tables + self.form.fields}
+        return [item for _, item in sorted(self._items.items()) if id(item) in items]
 
     @property
     def geometry(self):
+        if self._geometry is None:
+            self._geometry = Geometry(self._store.blocks[self._start]["Geometry"])
         return self._geometry
 
     @property
     def id(self):
-        return self._id
+        return self._store.blocks[self._start]["Id"]
 
 
 class TextractDocument:
+    __slots__ = ("_responsePages", "_store", "_pages")
+
     def __init__(self, responsePages):
         if not isinstance(responsePages, list):
-            rps = []
-            rps.append(responsePages)
-            responsePages = rps
+            responsePages = [responsePages]
 
         self._responsePages = responsePages
-        self._pages = []
-
-        self._parse()
+        self._store = BlockStore(responsePages)
+        self._pages = [
+            Page(self._store, start, end) for start, end in self._store.pageRanges()
+        ]
 
     def __repr__(self):
         return str(self._pages)
 
-    def _parseDocumentPagesAndBlockMap(self):
-        blockMap = {}
-
-        documentPages = []
-        documentPage = None
-        for page in self._responsePages:
-            for block in page["Blocks"]:
-                if "BlockType" in block and "Id" in block:
-                    blockMap[block["Id"]] = block
-
-                if block["BlockType"] == "PAGE":
-                    if documentPage:
-                        documentPages.append({"Blocks": documentPage})
-                    documentPage = []
-                    documentPage.append(block)
-                else:
-                    documentPage.append(block)
-        if documentPage:
-            documentPages.append({"Blocks": documentPage})
-        return documentPages, blockMap
-
-    def _parse(self):
-        (
-            self._responseDocumentPages,
-            self._blockMap,
-        ) = self._parseDocumentPagesAndBlockMap()
-        for documentPage in self._responseDocumentPages:
-            page = Page(documentPage["Blocks"], self._blockMap)
-            self._pages.append(page)
-
     @property
     def blocks(self):
         return self._responsePages
 
+    @property
+    def blockStore(self):
+        return self._store
+
     @property
     def pageBlocks(self):
-        return self._responseDocumentPages
+        return [{"Blocks": page.blocks} for page in self._pages]
 
     @property
     def pages(self):
         return self._pages
 
     def getBlockById(self, blockId):
-        block = None
-        if self._blockMap and blockId in self._blockMap:
-            block = self._blockMap[blockId]
-        return block
+        return self._store.get(blockId)
+
+
+def _related(block, blockMap):
+    for relationship in block.get("Relationships") or ():
+        if relationship["Type"] == "CHILD":
+            for cid in relationship["Ids"]:
+                yield blockMap[cid]
+
+
+def _wrapCellChild(block):
+    if block["BlockType"] == "WORD":
+        return Word(block)
+    return SelectionElement(block)
+
+
+def _buildField(block, blockMap):
+    if "KEY" not in block["EntityTypes"]:
+        return None
+    return Field(block, blockMap)
@@ -1,6 +1,19 @@
+import subprocess
+import sys
+
 from RPA.Cloud.AWS import AWS
 
 
 def test_init():
     lib = AWS()
     assert lib
+
+
+def test_boto3_imported_lazily():
+    code = (
+        "import sys\n"
+        "from RPA.Cloud.AWS import AWS\n"
+        "AWS()\n"
+        "assert 'boto3' not in sys.modules and 'botocore' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -100,3 +100,81 @@ def test_execute_statement(redshift):
     print("RETURNED TABLE:")
     print(tables)
     assert tables[0]["City"] == "Vancouver"
+
+
+@pytest.fixture
+def stubbed_redshift_data(aws_credentials):
+    from botocore.stub import Stubber
+    from RPA.Cloud.AWS import AWS
+
+    aws = AWS()
+    client = boto3.client("redshift-data", region_name=DEFAULT_REGION)
+    aws._set_service("redshift-data", client)
+    with Stubber(client) as stubber:
+        yield aws, stubber
+
+
+def add_statement_results(stubber, pages):
+    finished = {"Id": "stmt-1", "Status": "FINISHED", "HasResultSet": True}
+    stubber.add_response("describe_statement", finished, {"Id": "stmt-1"})
+    stubber.add_response(
+        "describe_statement", {**finished, "ResultRows": 3}, {"Id": "stmt-1"}
+    )
+    for idx, records in enumerate(pages):
+        response = {
+            "ColumnMetadata": [{"name": "id"}, {"name": "city"}],
+            "Records": records,
+            "TotalNumRows": 3,
+        }
+        expected = {"Id": "stmt-1"}
+        if idx:
+            expected["NextToken"] = f"token-{idx}"
+        if idx < len(pages) - 1:
+            response["NextToken"] = f"token-{idx + 1}"
+        stubber.add_response("get_statement_result", response, expected)
+
+
+PAGES = [
+    [
+        [{"longValue": 1}, {"stringValue": "Vancouver"}],
+        [{"longValue": 2}, {"isNull": True}],
+    ],
+    [[{"longValue": 3}, {"stringValue": "Helsinki"}]],
+]
+
+
+def test_get_statement_results(stubbed_redshift_data):
+    aws, stubber = stubbed_redshift_data
+    add_statement_results(stubber, PAGES)
+
+    table = aws.get_redshift_statement_results("stmt-1")
+
+    assert table.columns == ["id", "city"]
+    assert table.get_column("city", as_list=True) == ["Vancouver", None, "Helsinki"]
+
+
+def test_iterate_statement_results(stubbed_redshift_data):
+    aws, stubber = stubbed_redshift_data
+    add_statement_results(stubber, PAGES)
+
+    pages = aws.iterate_redshift_statement_results("stmt-1", as_columns=True)
+
+    assert next(pages) == {"id": [1, 2], "city": ["Vancouver", None]}
+    # The second page is requested only when needed.
+    assert len(stubber._queue) == 1
+    assert list(pages) == [{"id": [3], "city": ["Helsinki"]}]
+    stubber.assert_no_pending_responses()
+
+
+def test_export_statement_results(stubbed_redshift_data, tmp_path):
+    aws, stubber = stubbed_redshift_data
+    add_statement_results(stubber, PAGES)
+    path = tmp_path / "out" / "cities.csv"
+
+    assert aws.export_redshift_statement_results("stmt-1", str(path)) == 3
+    assert path.read_text().splitlines() == [
+        "id,city",
+        "1,Vancouver",
+        "2,",
+        "3,Helsinki",
+    ]
@@ -0,0 +1,169 @@
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from RPA.Cloud.AWS import AWS, MB, calculate_s3_etag
+
+
+BUCKET = "rpa-test-bucket"
+REGION = "eu-west-1"
+
+
+@pytest.fixture
+def library(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        lib = AWS(region=REGION)
+        lib.init_s3_client()
+        lib.create_bucket(
+            BUCKET, CreateBucketConfiguration={"LocationConstraint": REGION}
+        )
+        yield lib
+
+
+@pytest.fixture
+def local_files(tmp_path):
+    root = tmp_path / "invoices"
+    (root / "2024").mkdir(parents=True)
+    for idx in range(5):
+        (root / "2024" / f"invoice-{idx}.txt").write_text(f"invoice {idx}")
+    (root / "summary.txt").write_text("summary")
+    return root
+
+
+def statuses(results):
+    return {result.key: result.status for result in results}
+
+
+def test_upload_and_download_files(library, local_files, tmp_path):
+    paths = [str(path) for path in sorted(local_files.rglob("invoice-*.txt"))]
+
+    assert library.upload_files(BUCKET, paths + ["missing.txt"], workers=3) == 5
+
+    results = library.download_files(
+        BUCKET,
+        ["invoice-0.txt", "invoice-1.txt", "nope.txt"],
+        tmp_path / "downloads",
+        return_results=True,
+    )
+    assert [result.status for result in results] == [
+        "downloaded",
+        "downloaded",
+        "failed",
+    ]
+    assert (tmp_path / "downloads" / "invoice-1.txt").read_text() == "invoice 1"
+
+
+def test_sync_directory_to_s3(library, local_files):
+    results = library.sync_directory_to_s3(BUCKET, local_files, prefix="backup/")
+    assert set(statuses(results).values()) == {"uploaded"}
+    assert "backup/2024/invoice-3.txt" in statuses(results)
+
+    (local_files / "summary.txt").write_text("summarx")  # same size
+    (local_files / "2024" / "invoice-0.txt").unlink()
+    results = library.sync_directory_to_s3(
+        BUCKET, local_files, prefix="backup", delete=True
+    )
+    result_statuses = statuses(results)
+    assert result_statuses.pop("backup/summary.txt") == "uploaded"
+    assert result_statuses.pop("backup/2024/invoice-0.txt") == "deleted"
+    assert set(result_statuses.values()) == {"skipped"}
+
+    keys = [item["Key"] for item in library.list_files(BUCKET)]
+    assert len(keys) == 5
+
+
+def test_sync_s3_to_directory(library, local_files, tmp_path):
+    library.sync_directory_to_s3(BUCKET, local_files)
+    target = tmp_path / "copy"
+    (target / "2024").mkdir(parents=True)
+    (target / "2024" / "invoice-1.txt").write_text("invoice 1")
+    (target / "stale.txt").write_text("stale")
+
+    results = library.sync_s3_to_directory(BUCKET, target, delete=True)
+
+    result_statuses = statuses(results)
+    assert result_statuses.pop("2024/invoice-1.txt") == "skipped"
+    assert result_statuses.pop("stale.txt") == "deleted"
+    assert set(result_statuses.values()) == {"downloaded"}
+    assert (target / "summary.txt").read_text() == "summary"
+    assert not (target / "stale.txt").exists()
+
+
+def test_sync_s3_to_directory_refuses_traversal(library, tmp_path):
+    client = library._get_client_for_service("s3")
+    for key in ["data/../../escaped.txt", "data//etc/passwd", "data/ok.txt"]:
+        client.put_object(Bucket=BUCKET, Key=key, Body=b"x")
+    target = tmp_path / "sync" / "copy"
+    target.mkdir(parents=True)
+    (target / "local.txt").write_text("local")
+
+    results = library.sync_s3_to_directory(BUCKET, target, prefix="data", delete=True)
+
+    assert statuses(results) == {
+        "data/../../escaped.txt": "failed",
+        "data//etc/passwd": "failed",
+        "data/ok.txt": "downloaded",
+        "data/local.txt": "deleted",
+    }
+    assert not (tmp_path / "escaped.txt").exists()
+    assert not (tmp_path / "sync" / "escaped.txt").exists()
+    assert (target / "ok.txt").read_bytes() == b"x"
+
+
+def test_multipart_etag(library, tmp_path):
+    library.set_s3_transfer_config(
+        multipart_threshold=5 * MB, multipart_chunksize=5 * MB
+    )
+    path = tmp_path / "big.bin"
+    path.write_bytes(os.urandom(6 * MB))
+
+    library.upload_file(BUCKET, str(path))
+
+    etag = boto3.client("s3", region_name=REGION).head_object(
+        Bucket=BUCKET, Key="big.bin"
+    )["ETag"]
+    assert etag.strip('"') == calculate_s3_etag(path, 5 * MB)
+    assert etag.strip('"').endswith("-2")
+    results = library.sync_directory_to_s3(BUCKET, tmp_path)
+    assert statuses(results) == {"big.bin": "skipped"}
+
+
+@pytest.fixture
+def many_objects(library):
+    client = library._get_client_for_service("s3")
+    keys = [f"{folder}/{idx:03}.txt" for folder in "abc" for idx in range(25)]
+    keys.append("top.txt")
+    for key in keys:
+        client.put_object(Bucket=BUCKET, Key=key, Body=b"x")
+    return keys
+
+
+def test_iterate_files(library, many_objects):
+    requests = []
+    client = library._get_client_for_service("s3")
+    client.meta.events.register(
+        "provide-client-params.s3.ListObjectsV2",
+        lambda params, **_: requests.append(params["MaxKeys"]),
+    )
+
+    files = library.iterate_files(BUCKET, limit=25, page_size=10)
+
+    assert not requests  # nothing fetched before iterating
+    assert [item["Key"] for item in files] == sorted(many_objects)[:25]
+    assert requests == [10, 10, 5]
+
+    assert len(library.list_files(BUCKET, limit=30)) == 30
+    assert len(list(library.iterate_files(BUCKET, prefix="b/"))) == 25
+
+
+def test_iterate_files_in_parallel(library, many_objects):
+    files = library.iterate_files(BUCKET, workers=3, page_size=10)
+    assert sorted(item["Key"] for item in files) == sorted(many_objects)
+
+    files = list(library.iterate_files(BUCKET, workers=3, page_size=10, limit=12))
+    assert len(files) == 12
+    assert files[0]["Key"] == "top.txt"
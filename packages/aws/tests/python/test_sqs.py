@@ -0,0 +1,86 @@
+import time
+
+import pytest
+from moto import mock_aws
+
+from RPA.Cloud.AWS import AWS
+
+
+REGION = "eu-west-1"
+
+
+@pytest.fixture
+def library(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        lib = AWS(region=REGION)
+        lib.init_sqs_client()
+        lib.queue_url = lib.create_queue("rpa-test-queue")["QueueUrl"]
+        yield lib
+
+
+def test_send_receive_delete_batches(library):
+    result = library.send_messages(
+        [f"invoice-{idx}" for idx in range(23)]
+        + [{"MessageBody": "urgent", "DelaySeconds": 0}]
+    )
+    assert len(result["Successful"]) == 24
+    assert not result["Failed"]
+
+    messages = library.receive_messages(max_messages=15, wait_time=1)
+    assert len(messages) == 15
+    assert all("ApproximateReceiveCount" in msg["Attributes"] for msg in messages)
+
+    result = library.delete_messages(
+        messages[:5] + [msg["ReceiptHandle"] for msg in messages[5:]]
+    )
+    assert len(result["Successful"]) == 15
+
+    rest = library.receive_messages(max_messages=50, wait_time=1)
+    bodies = {msg["Body"] for msg in messages + rest}
+    assert len(rest) == 9
+    assert bodies == {f"invoice-{idx}" for idx in range(23)} | {"urgent"}
+
+
+def test_consume_messages(library):
+    library.send_messages([str(idx) for idx in range(25)])
+    handled = []
+
+    def handler(message):
+        if message["Body"] == "13":
+            raise ValueError("broken invoice")
+        handled.append(message["Body"])
+
+    stats = library.consume_messages(handler, wait_time=1, visibility_timeout=30)
+
+    assert stats == {"processed": 24, "failed": 1}
+    assert sorted(handled, key=int) == [str(idx) for idx in range(25) if idx != 13]
+    # The failed message is retried only after its visibility timeout.
+    assert library.receive_messages(wait_time=0) == []
+
+
+def test_consume_messages_extends_visibility(library):
+    library.send_message("slow", delay_seconds=0)
+    visible = []
+
+    def handler(message):
+        time.sleep(2.5)
+        # Without the extensions, the message would be visible again by now.
+        visible.extend(library.receive_messages(wait_time=0, visibility_timeout=0))
+
+    stats = library.consume_messages(handler, wait_time=1, visibility_timeout=1)
+
+    assert stats == {"processed": 1, "failed": 0}
+    assert visible == []
+
+
+def test_consume_messages_releases_prefetched(library):
+    library.send_messages(["first", "second"])
+
+    stats = library.consume_messages(
+        lambda message: None, max_messages=1, wait_time=1, batch_size=1
+    )
+
+    assert stats == {"processed": 1, "failed": 0}
+    assert len(library.receive_messages(wait_time=0)) == 1
@@ -0,0 +1,197 @@
+import itertools
+import tracemalloc
+
+import pytest
+
+from RPA.Cloud.AWS import AWS
+from RPA.Cloud.AWS.textract import TextractDocument, Word
+
+
+GEOMETRY = {
+    "BoundingBox": {"Width": 0.2, "Height": 0.05, "Left": 0.1, "Top": 0.1},
+    "Polygon": [{"X": 0.1, "Y": 0.1}, {"X": 0.3, "Y": 0.1}, {"X": 0.3, "Y": 0.15}],
+}
+
+
+def make_response(pages=1, lines=3, rows=2, columns=2, fields=2):
+    """Builds an ``AnalyzeDocument`` like response, with the same block layout
+    (and block order) as a recorded Textract response has.
+    """
+    counter = itertools.count()
+    blocks = []
+
+    def block(block_type, children=(), **extra):
+        new = {
+            "BlockType": block_type,
+            "Id": f"id-{next(counter)}",
+            "Confidence": 99.5,
+            "Geometry": GEOMETRY,
+            **extra,
+        }
+        if children:
+            new["Relationships"] = [
+                {"Type": "CHILD", "Ids": [child["Id"] for child in children]}
+            ]
+        return new
+
+    for page_number in range(1, pages + 1):
+        page_blocks = []
+        words = []
+
+        def word(text, page_number=page_number):
+            new = block("WORD", Text=text, Page=page_number)
+            words.append(new)
+            return new
+
+        for line in range(lines):
+            texts = [f"p{page_number}", f"line{line}", "text"]
+            children = [word(text) for text in texts]
+            page_blocks.append(block("LINE", children, Text=" ".join(texts)))
+        cells = []
+        for row, column in itertools.product(range(rows), range(columns)):
+            children = [word(f"r{row}"), word(f"c{column}")]
+            if row == column == 0:
+                children.append(block("SELECTION_ELEMENT", SelectionStatus="SELECTED"))
+                words.append(children[-1])
+            cells.append(
+                block(
+                    "CELL",
+                    children,
+                    RowIndex=row + 1,
+                    ColumnIndex=column + 1,
+                    RowSpan=1,
+                    ColumnSpan=1,
+                )
+            )
+        page_blocks.append(block("TABLE", cells))
+        page_blocks.extend(cells)
+        for field in range(fields):
+            value = block(
+                "KEY_VALUE_SET", [word(f"value{field}")], EntityTypes=["VALUE"]
+            )
+            key = block(
+                "KEY_VALUE_SET",
+                [word("Invoice"), word(f"field{field}")],
+                EntityTypes=["KEY"],
+            )
+            key["Relationships"].append({"Type": "VALUE", "Ids": [value["Id"]]})
+            page_blocks.extend([key, value])
+        page = block("PAGE", page_blocks + words)
+        blocks.extend([page] + page_blocks + words)
+
+    return {"DocumentMetadata": {"Pages": pages}, "Blocks": blocks}
+
+
+def test_document_model():
+    response = make_response(pages=2)
+    document = TextractDocument(response)
+
+    assert len(document.pages) == 2
+    page = document.pages[1]
+    assert page.text == "p2 line0 text\np2 line1 text\np2 line2 text\n"
+    assert page.getTextInReadingOrder() == page.text
+    assert [word.text for word in page.lines[0].words] == ["p2", "line0", "text"]
+    assert page.lines[0].geometry.boundingBox.width == 0.2
+    assert len(page.lines[0].geometry.polygon) == 3
+
+    table = page.tables[0]
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [
+        ["r0 c0 SELECTED, ", "r0 c1 "],
+        ["r1 c0 ", "r1 c1 "],
+    ]
+    assert table.rows[0].cells[0].content[-1].selectionStatus == "SELECTED"
+
+    assert [field.key.text for field in page.form.fields] == [
+        "Invoice field0",
+        "Invoice field1",
+    ]
+    assert page.form.getFieldByKey("Invoice field1").value.text == "value1"
+    assert len(page.form.searchFieldsByKey("invoice")) == 2
+    assert page.content == page.lines + page.tables + page.form.fields
+
+    assert page.id == page.blocks[0]["Id"]
+    assert document.pageBlocks[0]["Blocks"][0] is response["Blocks"][0]
+    assert document.getBlockById(page.id)["BlockType"] == "PAGE"
+    assert document.getBlockById("missing") is None
+
+
+def test_document_model_across_responses():
+    response = make_response(pages=3)
+    blocks = response["Blocks"]
+    pages = [
+        {"Blocks": blocks[:10]},
+        {"Blocks": blocks[10:50]},
+        {"Blocks": blocks[50:]},
+    ]
+
+    document = TextractDocument(pages)
+
+    assert document.blocks is pages
+    assert [page.text for page in document.pages] == [
+        page.text for page in TextractDocument(response).pages
+    ]
+
+
+def test_document_model_is_lazy():
+    document = TextractDocument(make_response(pages=2))
+    page = document.pages[0]
+
+    assert page._lines is None and page._tables is None and page._form is None
+    line = page.lines[0]
+    assert line._words is None and line._geometry is None
+    assert page._tables is None  # only the lines are built
+    assert page.lines[0] is line
+    assert isinstance(line.words[0], Word)
+    assert line.words is line.words
+
+
+def test_parse_response_blocks():
+    library = AWS()
+    response = make_response(rows=2, columns=3)
+
+    assert library._parse_response_blocks(response)
+
+    cells = list(library.get_cells().values())
+    assert cells[0]["Content"] == "r0 c0 "
+    assert cells[0]["Childs"][:2] == [
+        block_id
+        for block_id, text in library.get_words().items()
+        if text in ("r0", "c0")
+    ][:2]
+    (table,) = library.get_tables().values()
+    assert table.get_row(0, as_list=True) == ["r0 c0 ", "r0 c1 ", "r0 c2 "]
+    assert len(library.lines) == 3
+
+
+def test_large_analysis_memory():
+    """Building the model of a 500 page asynchronous analysis only indexes its
+    blocks, the rest of the model is built page by page when accessed.
+    """
+    pages = 500
+    response = make_response(pages=pages, lines=40, rows=10, columns=5, fields=10)
+    block_count = len(response["Blocks"])
+
+    tracemalloc.start()
+    document = TextractDocument(response)
+    _, build_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cells = sum(
+        len(row.cells)
+        for page in document.pages
+        for table in page.tables
+        for row in table.rows
+    )
+    lines = sum(len(page.lines) for page in document.pages)
+    fields = sum(len(page.form.fields) for page in document.pages)
+    assert (cells, lines, fields) == (pages * 50, pages * 40, pages * 10)
+    # The index takes about 100 bytes per block, while the previous, eagerly
+    # built model took over 750. The bound leaves room for other platforms.
+    bytes_per_block = build_peak / block_count
+    assert bytes_per_block < 400, f"{bytes_per_block:.0f} bytes per block"
+
+
+@pytest.mark.parametrize("response", [{}, {"Blocks": []}])
+def test_empty_response(response):
+    assert AWS()._parse_response_blocks(response) is bool(response)
+    assert TextractDocument({"Blocks": []}).pages == []
@@ -5,6 +5,7 @@ import os
 import string
 import sys
 import time
+import types
 import unicodedata
 from typing import Any, Optional
 
@@ -101,6 +102,20 @@ def import_by_name(name: str, caller: str = None) -> Any:
     raise ValueError(f"No module/attribute with name: {name}")
 
 
+class LazyModule(types.ModuleType):
+    """Module placeholder which imports the named module on first attribute
+    access, keeping heavy dependencies out of a library's import time.
+
+    :param name: Import path of the module, e.g. openpyxl.utils
+    """
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        # Later lookups of already loaded names skip this method entirely.
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
 def interact(expression: Any = None, local: Optional[dict] = None):
     """Interrupts the execution with an interactive shell on `expression`."""
     if expression is not None and not expression:
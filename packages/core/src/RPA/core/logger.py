@@ -1,6 +1,7 @@
 import logging
+import re
 import warnings
-from typing import Union, List
+from typing import Dict, List, NamedTuple, Optional, Union
 
 try:
     from robot.libraries.BuiltIn import BuiltIn
@@ -21,6 +22,54 @@ def deprecation(message):
         logging.captureWarnings(False)
 
 
+class KeywordMatch(NamedTuple):
+    """Which of the registered keyword lists a keyword name matches."""
+
+    normalized: str
+    protect: bool
+    info_level: bool
+    mute: bool
+
+
+class KeywordMatcher:
+    """Matches keyword names against the registered (partial) names with one
+    compiled pattern per list, remembering the result for every name seen.
+    """
+
+    MAX_CACHED_NAMES = 65536
+
+    def __init__(
+        self, protected: List[str], info_level: List[str], muted: List[str]
+    ) -> None:
+        self._patterns = [
+            self._compile(names) for names in (protected, info_level, muted)
+        ]
+        self._cache: Dict[str, Optional[KeywordMatch]] = {}
+
+    @staticmethod
+    def _compile(names: List[str]) -> Optional[re.Pattern]:
+        if not names:
+            return None
+        return re.compile("|".join(re.escape(name) for name in names))
+
+    def match(self, name: str) -> Optional[KeywordMatch]:
+        """Return the lists matched by the keyword name, `None` if none of them."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        normalized = name.lower().replace(" ", "_")
+        flags = [
+            bool(pattern and pattern.search(normalized)) for pattern in self._patterns
+        ]
+        result = KeywordMatch(normalized, *flags) if any(flags) else None
+        if len(self._cache) >= self.MAX_CACHED_NAMES:
+            self._cache.clear()
+        self._cache[name] = result
+        return result
+
+
 class RobotLogListener:
     """`RobotLogListener` is a library for controlling logging during
     a Robot Framework execution using the listener API.
@@ -143,6 +192,10 @@ class RobotLogListener:
     KEYWORDS_TO_MUTE = []
     INFO_LEVEL_KEYWORDS = []
 
+    # Shared by all the instances, just like the lists above, and rebuilt after
+    #  any of them changes through the registering methods.
+    _matcher: Optional[KeywordMatcher] = None
+
     def __init__(self) -> None:
         self.ROBOT_LIBRARY_LISTENER = self
         self.logger = logging.getLogger(__name__)
@@ -166,6 +219,7 @@ class RobotLogListener:
             normalized = self._normalize(name)
             if normalized not in self.INFO_LEVEL_KEYWORDS:
                 self.INFO_LEVEL_KEYWORDS.append(normalized)
+        self._reset_matcher()
 
     def register_protected_keywords(self, names: Union[str, List] = None) -> None:
         """Register keywords that are not going to be logged into Robot Framework logs.
@@ -180,6 +234,7 @@ class RobotLogListener:
             normalized = self._normalize(name)
             if normalized not in self.KEYWORDS_TO_PROTECT:
                 self.KEYWORDS_TO_PROTECT.append(normalized)
+        self._reset_matcher()
 
     def mute_run_on_failure(
         self, keywords: Union[str, List] = None, optional_keyword_to_run: str = None
@@ -215,6 +270,7 @@ class RobotLogListener:
             normalized = self._normalize(keyword)
             if normalized not in self.KEYWORDS_TO_MUTE:
                 self.KEYWORDS_TO_MUTE.append(normalized)
+        self._reset_matcher()
 
         for library in ("RPA.Browser", "RPA.Browser.Selenium"):
             status, instance = BuiltIn().run_keyword_and_ignore_error(
@@ -232,16 +288,18 @@ class RobotLogListener:
         If `name` exists in the protected keywords list then log level is
         temporarily set to NONE.
         """
-        if not self._is_robot_running():
+        matcher = RobotLogListener._matcher or self._build_matcher()
+        match = matcher.match(name)
+        if match is None or not self._is_robot_running():
             return
 
-        normalized = self._normalize(name)
+        normalized = match.normalized
 
-        if any(name in normalized for name in self.KEYWORDS_TO_PROTECT):
+        if match.protect:
             self.logger.info("Protecting keyword: %s", name)
             old = BuiltIn().set_log_level("NONE")
             self.stack.append((normalized, old))
-        elif any(name in normalized for name in self.INFO_LEVEL_KEYWORDS):
+        elif match.info_level:
             current = BuiltIn().get_variable_value("${LOG_LEVEL}")
             if current not in ("WARN", "ERROR", "NONE"):
                 old = BuiltIn().set_log_level("INFO")
@@ -249,14 +307,13 @@ class RobotLogListener:
 
         # Run-on-failure
 
-        if self.muted_keyword:
+        if self.muted_keyword or not match.mute:
             return
 
         previous = {}
         for library, optional in self.muted_optionals:
-            if any(name in normalized for name in self.KEYWORDS_TO_MUTE):
-                keyword = library.register_keyword_to_run_on_failure(optional)
-                previous[library.__class__.__name__] = keyword
+            keyword = library.register_keyword_to_run_on_failure(optional)
+            previous[library.__class__.__name__] = keyword
 
         if previous:
             self.logger.debug("Muting failures before keyword: %s", name)
@@ -272,7 +329,7 @@ class RobotLogListener:
         If `name` exists in the protected keywords list then log level is
         restored back to level it was before settings to NONE.
         """
-        if not self._is_robot_running():
+        if not (self.stack or self.muted_keyword) or not self._is_robot_running():
             return
 
         normalized = self._normalize(name)
@@ -295,6 +352,23 @@ class RobotLogListener:
         self.muted_keyword = None
         self.muted_previous = {}
 
+    @staticmethod
+    def _reset_matcher() -> None:
+        """Forget the compiled keyword matcher, so it gets rebuilt from the
+        current keyword lists.
+
+        Needed only after modifying the lists directly instead of through the
+        registering methods.
+        """
+        RobotLogListener._matcher = None
+
+    def _build_matcher(self) -> KeywordMatcher:
+        matcher = KeywordMatcher(
+            self.KEYWORDS_TO_PROTECT, self.INFO_LEVEL_KEYWORDS, self.KEYWORDS_TO_MUTE
+        )
+        RobotLogListener._matcher = matcher
+        return matcher
+
     def _normalize(self, name: str) -> str:
         """Modifies keyword name for programmatic use.
 
@@ -1,40 +1,37 @@
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import util
-import inspect
 import os
+import sys
 from typing import Any
 
-IPYTHON_AVAILABLE = False
-# Define placeholder objects
-display = None
-Markdown = None
-FileLink = None
-FileLinks = None
-Image = None
-JSON = None
-Video = None
-Audio = None
-
-ipython_module = util.find_spec("IPython")
-if ipython_module:
-    # pylint: disable=C0415
-    from IPython.display import (  # pylint: disable=import-error
-        Audio,
-        display,
-        FileLink,
-        FileLinks,
-        Image,
-        JSON,
-        Markdown,
-        Video,
-    )
+# Checking for the package is cheap, while importing it isn't, so that happens only
+#  when something gets displayed within IPython for the first time.
+IPYTHON_AVAILABLE = util.find_spec("IPython") is not None
+
+
+@lru_cache(maxsize=None)
+def _running_in_ipython() -> bool:
+    """Tells once if the code runs within an IPython shell or kernel, which always
+    has the package imported already.
+    """
+    if not IPYTHON_AVAILABLE:
+        return False
+    ipython = sys.modules.get("IPython")
+    return bool(ipython and ipython.get_ipython())
 
-    IPYTHON_AVAILABLE = True
 
+@lru_cache(maxsize=None)
+def _load_display_objects() -> Any:
+    """Imports the IPython display objects once, when first displaying something."""
+    # pylint: disable=C0415,import-error
+    from IPython import display as ipython_display
 
-def _get_caller_prefix(calframe):
+    return ipython_display
+
+
+def _get_caller_prefix(function_name: str) -> str:
     keyword_name = (
-        calframe[1][3] if calframe[1][3] not in ["<module>", "<lambda>"] else None
+        function_name if function_name not in ["<module>", "<lambda>"] else None
     )
     if keyword_name:
         keyword_name = keyword_name.replace("_", " ").title()
@@ -45,16 +42,16 @@ def _get_caller_prefix(calframe):
 def print_precheck(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
-        if not IPYTHON_AVAILABLE:
-            return None
         output_level = os.getenv("RPA_NOTEBOOK_OUTPUT_LEVEL", "1")
-        if output_level == "0":
+        if output_level == "0" or not _running_in_ipython():
             return None
-        curframe = inspect.currentframe()
-        calframe = inspect.getouterframes(curframe, 2)
-        prefix = _get_caller_prefix(calframe)
+        ipython_display = _load_display_objects()
+        # Only the name of the calling function is needed, so there's no need to
+        #  inspect the whole stack along with its source code.
+        caller = sys._getframe(1)  # pylint: disable=protected-access
+        prefix = _get_caller_prefix(caller.f_code.co_name)
         if prefix != "":
-            display(Markdown(prefix))
+            ipython_display.display(ipython_display.Markdown(prefix))
         return f(*args, **kwargs)
 
     return wrapper
@@ -78,7 +75,8 @@ def notebook_print(arg=None, **kwargs) -> Any:
     output = _get_markdown(**kwargs)
 
     if output:
-        display(Markdown(output))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.Markdown(output))
 
 
 @print_precheck
@@ -88,7 +86,8 @@ def notebook_file(filepath):
     :param filepath: location of the file
     """
     if filepath:
-        display(FileLink(filepath))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.FileLink(filepath))
 
 
 @print_precheck
@@ -99,7 +98,8 @@ def notebook_dir(directory, recursive=False):
     :param recursive: if all subdirectories should be shown also, defaults to False
     """
     if directory:
-        display(FileLinks(directory, recursive=recursive))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.FileLinks(directory, recursive=recursive))
 
 
 @print_precheck
@@ -119,7 +119,8 @@ def notebook_table(table: Any, count: int = 20, columns=None):
         table = Tables().table_head(table, count=count)
     output = _get_table_output(table)
     if output:
-        display(Markdown(output))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.Markdown(output))
 
 
 @print_precheck
@@ -129,7 +130,8 @@ def notebook_image(image):
     :param image: path to the image file
     """
     if image:
-        display(Image(image))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.Image(image))
 
 
 @print_precheck
@@ -139,7 +141,8 @@ def notebook_video(video):
     :param video: path to the video file
     """
     if video:
-        display(Video(video))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.Video(video))
 
 
 @print_precheck
@@ -149,7 +152,8 @@ def notebook_audio(audio):
     :param audio: path to the audio file
     """
     if audio:
-        display(Audio(filename=audio))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.Audio(filename=audio))
 
 
 @print_precheck
@@ -159,7 +163,8 @@ def notebook_json(json_object):
     :param json_object: item to show
     """
     if json_object:
-        display(JSON(json_object))
+        ipython_display = _load_display_objects()
+        ipython_display.display(ipython_display.JSON(json_object))
 
 
 def _get_table_output(table):
@@ -0,0 +1,323 @@
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    from robot.libraries.BuiltIn import BuiltIn
+    from robot.running.context import EXECUTION_CONTEXTS
+except ModuleNotFoundError:
+    BuiltIn = None
+    EXECUTION_CONTEXTS = None
+
+
+class _KeywordStats:
+    """Aggregated timings of all the calls of one keyword."""
+
+    __slots__ = ("calls", "total_time", "self_time", "max_time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.max_time = 0.0
+
+
+class _Frame:
+    """A keyword call in progress."""
+
+    __slots__ = ("name", "start", "children_time")
+
+    def __init__(self, name: str, start: float) -> None:
+        self.name = name
+        self.start = start
+        self.children_time = 0.0
+
+
+class KeywordProfiler:
+    """`KeywordProfiler` measures where the time of a run goes, keyword by
+    keyword, using the Robot Framework listener API.
+
+    For every keyword it records the number of calls, the cumulative time (with
+    the called keywords) and the self time (without them). When a
+    ``slow_threshold`` in seconds is given, the Python stacks of the keywords
+    running longer than that are also sampled every ``sample_interval`` seconds,
+    pointing out the code behind the slow calls.
+
+    Once the (top-level) suite ends, the report is written into ``output_dir``
+    (the Robot Framework output directory by default):
+
+    - ``<name>.json``: the keyword statistics, slowest calls and stack samples
+    - ``<name>.folded``: the self times (in microseconds) per keyword stack, in
+      the folded format understood by flame graph tools like ``flamegraph.pl``
+      or `speedscope <https://www.speedscope.app>`_
+    - ``<name>-samples.folded``: the sampled stacks, when sampling is enabled
+
+    **Robot Framework**
+
+    Either as a listener for the whole run:
+
+    .. code-block:: bash
+
+        robot --listener RPA.KeywordProfiler:output:0.5 tasks.robot
+
+    or by importing it as a library:
+
+    .. code-block:: robotframework
+
+        *** Settings ***
+        Library         RPA.KeywordProfiler    slow_threshold=0.5
+
+    **Python**
+
+    .. code-block:: python
+
+        from RPA.core.profiler import KeywordProfiler
+
+        profiler = KeywordProfiler(output_dir="output")
+
+        @profiler.profile
+        def process_invoice(invoice):
+            with profiler.keyword("Read invoice"):
+                ...
+
+        for invoice in invoices:
+            process_invoice(invoice)
+        profiler.write_report()
+    """
+
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    ROBOT_LIBRARY_DOC_FORMAT = "REST"
+    ROBOT_LISTENER_API_VERSION = 2
+    ROBOT_AUTO_KEYWORDS = False
+
+    # Keyword types (of Robot Framework 4+) which are profiled, the control
+    #  structures are accounted within the keywords running them.
+    KEYWORD_TYPES = ("KEYWORD", "SETUP", "TEARDOWN")
+    MAX_SLOW_CALLS = 100
+
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        slow_threshold: Optional[Union[float, str]] = None,
+        sample_interval: Union[float, str] = 0.01,
+        name: str = "keyword-profile",
+    ) -> None:
+        self.ROBOT_LIBRARY_LISTENER = self
+        self.logger = logging.getLogger(__name__)
+        self.output_dir = output_dir
+        self.slow_threshold = (
+            float(slow_threshold) if slow_threshold not in (None, "") else None
+        )
+        self.sample_interval = float(sample_interval)
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._stacks: Dict[int, List[_Frame]] = {}
+        self._stats: Dict[str, _KeywordStats] = {}
+        self._folded: Counter = Counter()
+        self._samples: Counter = Counter()
+        self._slow_calls: List[dict] = []
+        self._started = time.perf_counter()
+        self._suite_depth = 0
+        self._sampler: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    # Listener interface.
+
+    def start_suite(self, name, attributes):  # pylint: disable=W0613
+        self._suite_depth += 1
+
+    def end_suite(self, name, attributes):  # pylint: disable=W0613
+        self._suite_depth -= 1
+        if self._suite_depth == 0:
+            self.write_report()
+
+    def start_keyword(self, name, attributes):
+        if attributes.get("type", "KEYWORD") in self.KEYWORD_TYPES:
+            self.start(name)
+
+    def end_keyword(self, name, attributes):
+        if attributes.get("type", "KEYWORD") in self.KEYWORD_TYPES:
+            self.end(name)
+
+    def close(self):
+        self._stop_sampler()
+
+    # Python interface.
+
+    def start(self, name: str) -> None:
+        """Mark the start of a keyword call in the current thread."""
+        stack = self._stacks.setdefault(threading.get_ident(), [])
+        stack.append(_Frame(name, time.perf_counter()))
+        if self.slow_threshold is not None and self._sampler is None:
+            self._start_sampler()
+
+    def end(self, name: str) -> None:
+        """Mark the end of the last started keyword call in the current thread."""
+        now = time.perf_counter()
+        stack = self._stacks.get(threading.get_ident())
+        if not stack or stack[-1].name != name:
+            self.logger.debug("Ignoring the end of an unknown keyword: %s", name)
+            return
+
+        path = self._folded_path(stack)
+        frame = stack.pop()
+        elapsed = now - frame.start
+        self_time = elapsed - frame.children_time
+        if stack:
+            stack[-1].children_time += elapsed
+
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _KeywordStats()
+            stats.calls += 1
+            stats.self_time += self_time
+            stats.max_time = max(stats.max_time, elapsed)
+            # Recursive calls are counted within the outermost one only.
+            if all(outer.name != name for outer in stack):
+                stats.total_time += elapsed
+            self._folded[path] += self_time
+            if self.slow_threshold is not None and elapsed >= self.slow_threshold:
+                self._slow_calls.append(
+                    {"name": name, "stack": path, "elapsed": round(elapsed, 6)}
+                )
+                self._slow_calls.sort(key=lambda call: -call["elapsed"])
+                del self._slow_calls[self.MAX_SLOW_CALLS :]
+
+    @contextmanager
+    def keyword(self, name: str):
+        """Profile the enclosed block as a keyword call with the given name."""
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def profile(self, func):
+        """Decorator profiling every call of the function as a keyword call."""
+        name = func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.keyword(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    # Stack sampling.
+
+    def _start_sampler(self) -> None:
+        self._sampler = threading.Thread(
+            target=self._sample, name="KeywordProfiler", daemon=True
+        )
+        self._sampler.start()
+
+    def _stop_sampler(self) -> None:
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self._stopped.clear()
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.sample_interval):
+            now = time.perf_counter()
+            frames = sys._current_frames()  # pylint: disable=protected-access
+            for thread_id, stack in list(self._stacks.items()):
+                stack = list(stack)
+                frame = frames.get(thread_id)
+                if not stack or frame is None:
+                    continue
+                if now - stack[-1].start < self.slow_threshold:
+                    continue
+                python_stack = ";".join(
+                    self._clean(f"{entry.name} ({Path(entry.filename).name})")
+                    for entry in traceback.extract_stack(frame)
+                )
+                with self._lock:
+                    self._samples[f"{self._folded_path(stack)};{python_stack}"] += 1
+
+    # Reporting.
+
+    @staticmethod
+    def _clean(name: str) -> str:
+        # Semicolons separate the frames in the folded format.
+        return name.replace(";", ",")
+
+    def _folded_path(self, stack: List[_Frame]) -> str:
+        return ";".join(self._clean(frame.name) for frame in stack)
+
+    def get_stats(self) -> dict:
+        """Return the profiling results recorded so far."""
+        with self._lock:
+            keywords = [
+                {
+                    "name": name,
+                    "calls": stats.calls,
+                    "total_time": round(stats.total_time, 6),
+                    "self_time": round(stats.self_time, 6),
+                    "mean_time": round(stats.total_time / stats.calls, 6),
+                    "max_time": round(stats.max_time, 6),
+                }
+                for name, stats in self._stats.items()
+            ]
+            samples = self._samples.most_common()
+            slow_calls = list(self._slow_calls)
+
+        keywords.sort(key=lambda keyword: -keyword["self_time"])
+        return {
+            "wall_time": round(time.perf_counter() - self._started, 6),
+            "keywords": keywords,
+            "slow_calls": slow_calls,
+            "samples": [{"stack": stack, "count": count} for stack, count in samples],
+        }
+
+    def _resolve_output_dir(self) -> Path:
+        if self.output_dir:
+            return Path(self.output_dir)
+        if BuiltIn is not None and EXECUTION_CONTEXTS.current is not None:
+            return Path(BuiltIn().get_variable_value("${OUTPUT_DIR}"))
+        return Path.cwd()
+
+    def write_report(self) -> Tuple[Path, ...]:
+        """Write the JSON and folded stacks reports, returning their paths."""
+        self._stop_sampler()
+        output_dir = self._resolve_output_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        json_path = output_dir / f"{self.name}.json"
+        json_path.write_text(json.dumps(self.get_stats(), indent=2), encoding="utf-8")
+        paths = [json_path]
+
+        with self._lock:
+            folded = dict(self._folded)
+            samples = dict(self._samples)
+        folded_path = output_dir / f"{self.name}.folded"
+        self._write_folded(
+            folded_path,
+            {stack: round(value * 1_000_000) for stack, value in folded.items()},
+        )
+        paths.append(folded_path)
+        if samples:
+            samples_path = output_dir / f"{self.name}-samples.folded"
+            self._write_folded(samples_path, samples)
+            paths.append(samples_path)
+
+        self.logger.info("Keyword profile written to: %s", json_path)
+        return tuple(paths)
+
+    @staticmethod
+    def _write_folded(path: Path, values: Dict[str, int]) -> None:
+        with open(path, "w", encoding="utf-8") as stream:
+            for stack, value in sorted(values.items()):
+                if value > 0:
+                    stream.write(f"{stack} {value}\n")
@@ -1,10 +1,15 @@
+import argparse
 import contextlib
 import functools
+import hashlib
+import json
 import logging
 import os
 import platform
 import requests
 import stat
+import tempfile
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
@@ -753,6 +758,78 @@ _DRIVER_PREFERENCE = {
 }
 
 _OPS_MANAGER = OperationSystemManager()
+# How long (in seconds) a webdriver resolved from the persistent index is trusted
+#  before the managers are queried again for a newer compatible one.
+DRIVER_INDEX_TTL = int(os.getenv("RPA_WEBDRIVER_INDEX_TTL", str(7 * 24 * 60 * 60)))
+
+
+def _file_checksum(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as stream:
+        for chunk in iter(functools.partial(stream.read, 1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DriverIndex:
+    """Persistent index of the downloaded webdrivers, mapping browser versions to
+    the driver binaries, so these can be resolved without any network call.
+
+    Entries expire after `ttl` seconds and are dropped when the binary on disk
+    doesn't match its recorded checksum anymore.
+    """
+
+    FILENAME = "index.json"
+
+    def __init__(self, root: Path, ttl: int = DRIVER_INDEX_TTL):
+        self.path = Path(root) / self.FILENAME
+        self.ttl = ttl
+
+    @staticmethod
+    def key(browser: str, browser_version: Optional[str]) -> str:
+        system = f"{platform.system()}-{platform.machine()}".lower()
+        return f"{browser.lower()}/{system}/{browser_version or 'latest'}"
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, Dict]):
+        # Write atomically, as multiple robots may share the same webdrivers root.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as stream:
+            json.dump(entries, stream, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached webdriver path for `key`, if still valid."""
+        entry = self._load().get(key)
+        if not entry:
+            return None
+        if time.time() - entry["timestamp"] > self.ttl:
+            LOGGER.debug("Indexed webdriver for %r expired", key)
+            return None
+        path = entry["path"]
+        try:
+            if _file_checksum(path) != entry["checksum"]:
+                LOGGER.warning("Indexed webdriver %r doesn't match its checksum", path)
+                return None
+        except OSError:
+            return None
+        return path
+
+    def set(self, key: str, path: str):
+        """Records the webdriver `path` downloaded for `key`."""
+        entries = self._load()
+        entries[key] = {
+            "path": str(path),
+            "checksum": _file_checksum(path),
+            "timestamp": time.time(),
+        }
+        self._save(entries)
 
 
 def _get_browser_order_from_env() -> Optional[List[str]]:
@@ -862,7 +939,18 @@ def _set_executable(path: str) -> None:
 
 
 def download(browser: str, root: Path = DRIVER_ROOT) -> str:
-    """Download a webdriver binary for the given browser and return the path to it."""
+    """Download a webdriver binary for the given browser and return the path to it.
+
+    A webdriver previously downloaded for the same browser version is resolved from
+    the persistent index in `root`, without querying any version endpoint.
+    """
+    index = DriverIndex(root)
+    key = index.key(_get_browser_lower(browser), get_browser_version(browser))
+    path = index.get(key)
+    if path:
+        LOGGER.info("Using cached webdriver: %s", path)
+        return path
+
     # Workaround for MS Edge webdrivers
     if browser.lower() == "edge":
         # Patch HTTP requests to redirect azureedge.net to microsoft.com
@@ -894,10 +982,30 @@ def download(browser: str, root: Path = DRIVER_ROOT) -> str:
 
     if platform.system() != "Windows":
         _set_executable(path)
+    index.set(key, path)
     LOGGER.info("Downloaded webdriver to: %s", path)
     return path
 
 
+def prefetch(browsers: Optional[List[str]] = None, root: Path = DRIVER_ROOT) -> Dict:
+    """Download and index the webdrivers of the installed browsers, so later
+    `download` calls resolve them offline. (e.g. when building a robot image)
+
+    Returns a mapping of browser names to webdriver paths for the browsers whose
+    webdriver could be downloaded.
+    """
+    paths = {}
+    for browser in browsers or get_browser_order():
+        if browser.lower() not in AVAILABLE_DRIVERS:
+            LOGGER.debug("No webdriver to download for %r", browser)
+            continue
+        try:
+            paths[browser] = download(browser, root=root)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning("Can't prefetch webdriver for %r due to: %s", browser, exc)
+    return paths
+
+
 def get_browser_version(browser: str, path: Optional[str] = None) -> Optional[str]:
     """Returns the detected browser version from OS in the absence of a given `path`."""
     browser_lower = _get_browser_lower(browser)
@@ -920,3 +1028,27 @@ def get_browser_version(browser: str, path: Optional[str] = None) -> Optional[st
         return None
 
     return _OPS_MANAGER.get_browser_version(browser_type, path=path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Download webdrivers ahead of time into the persistent cache."
+    )
+    parser.add_argument(
+        "browsers",
+        nargs="*",
+        help="browsers to download webdrivers for (defaults to the preferred ones)",
+    )
+    parser.add_argument(
+        "--root", type=Path, default=DRIVER_ROOT, help="webdrivers cache directory"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    paths = prefetch(args.browsers or None, root=args.root)
+    for browser, path in paths.items():
+        print(f"{browser}: {path}")
+
+
+if __name__ == "__main__":
+    main()
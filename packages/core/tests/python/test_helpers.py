@@ -0,0 +1,36 @@
+import sys
+
+import pytest
+
+from RPA.core.helpers import LazyModule
+
+
+@pytest.fixture
+def heavy_module(tmp_path, monkeypatch):
+    (tmp_path / "heavy_package").mkdir()
+    (tmp_path / "heavy_package" / "__init__.py").write_text("")
+    (tmp_path / "heavy_package" / "heavy.py").write_text(
+        "def compute(value):\n    return value * 2\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "heavy_package.heavy"
+    for name in ("heavy_package", "heavy_package.heavy"):
+        sys.modules.pop(name, None)
+
+
+def test_lazy_module_imports_on_access(heavy_module):
+    heavy = LazyModule(heavy_module)
+    assert heavy_module not in sys.modules
+
+    assert heavy.compute(21) == 42
+    assert heavy_module in sys.modules
+    assert heavy.compute is sys.modules[heavy_module].compute
+
+
+def test_lazy_module_missing(heavy_module):
+    missing = LazyModule("heavy_package.missing")
+
+    with pytest.raises(ModuleNotFoundError):
+        missing.compute(1)
+    with pytest.raises(AttributeError):
+        LazyModule(heavy_module).missing  # pylint: disable=expression-not-assigned
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from RPA.core import logger
 
@@ -16,3 +18,45 @@ def test_register_no_robot():
     lib = logger.RobotLogListener()
     lib.register_protected_keywords("Whatever")
     assert logger.RobotLogListener.KEYWORDS_TO_PROTECT[-1] == "whatever"
+
+
+def test_matcher_memoizes_names():
+    matcher = logger.KeywordMatcher(["rpa.robocorp.vault."], ["log_"], [])
+
+    assert matcher.match("Some Keyword") is None
+    assert "Some Keyword" in matcher._cache
+    match = matcher.match("RPA.Robocorp.Vault.Get Secret")
+    assert match == ("rpa.robocorp.vault.get_secret", True, False, False)
+    assert matcher.match("Log Many").info_level
+
+
+def test_matcher_rebuilt_on_register():
+    lib = logger.RobotLogListener()
+    lib.start_keyword("Rebuilt Matcher Keyword", {})
+    assert logger.RobotLogListener._matcher.match("Rebuilt Matcher Keyword") is None
+
+    lib.register_protected_keywords("Rebuilt Matcher")
+    assert logger.RobotLogListener._matcher is None
+    lib.start_keyword("Rebuilt Matcher Keyword", {})  # not running, does nothing
+    assert logger.RobotLogListener._matcher.match("Rebuilt Matcher Keyword").protect
+
+
+def test_protected_keyword_log_level(monkeypatch):
+    builtin = mock.MagicMock()
+    builtin.return_value.set_log_level.return_value = "TRACE"
+    monkeypatch.setattr(logger, "BuiltIn", builtin)
+    monkeypatch.setattr(logger.RobotLogListener, "_is_robot_running", lambda _: True)
+    lib = logger.RobotLogListener()
+    lib.register_protected_keywords("Protected Level Keyword")
+
+    lib.start_keyword("Unrelated", {})
+    lib.end_keyword("Unrelated", {})
+    assert not builtin.called
+
+    lib.start_keyword("Protected Level Keyword", {})
+    lib.end_keyword("Protected Level Keyword", {})
+    assert builtin.return_value.set_log_level.call_args_list == [
+        mock.call("NONE"),
+        mock.call("TRACE"),
+    ]
+    assert not lib.stack
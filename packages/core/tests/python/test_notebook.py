@@ -0,0 +1,64 @@
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+from RPA.core import notebook
+
+
+@pytest.fixture
+def ipython(monkeypatch):
+    """Fakes an IPython kernel with mocked display objects."""
+    display_module = types.ModuleType("IPython.display")
+    for name in ("Audio", "FileLink", "FileLinks", "Image", "JSON", "Video"):
+        setattr(display_module, name, mock.Mock(name=name))
+    display_module.display = mock.Mock(name="display")
+    display_module.Markdown = lambda text: f"markdown:{text}"
+    ipython_module = types.ModuleType("IPython")
+    ipython_module.display = display_module
+    ipython_module.get_ipython = mock.Mock(return_value=object())
+
+    monkeypatch.setitem(sys.modules, "IPython", ipython_module)
+    monkeypatch.setitem(sys.modules, "IPython.display", display_module)
+    monkeypatch.setattr(notebook, "IPYTHON_AVAILABLE", True)
+    monkeypatch.delenv("RPA_NOTEBOOK_OUTPUT_LEVEL", raising=False)
+    for cached in (notebook._running_in_ipython, notebook._load_display_objects):
+        cached.cache_clear()
+
+    yield ipython_module
+
+    for cached in (notebook._running_in_ipython, notebook._load_display_objects):
+        cached.cache_clear()
+
+
+def read_some_table():
+    notebook.notebook_print("done")
+
+
+def test_output_prefixed_with_caller(ipython):
+    read_some_table()
+
+    calls = ipython.display.display.call_args_list
+    assert calls[0] == mock.call("markdown:Output from **Read Some Table**")
+    assert "done" in calls[1].args[0]
+
+
+def test_output_disabled(ipython, monkeypatch):
+    monkeypatch.setenv("RPA_NOTEBOOK_OUTPUT_LEVEL", "0")
+
+    with mock.patch.object(notebook.sys, "_getframe") as getframe:
+        read_some_table()
+
+    assert not getframe.called
+    assert not ipython.display.display.called
+
+
+def test_no_output_outside_ipython(ipython):
+    ipython.get_ipython.return_value = None
+
+    read_some_table()
+    read_some_table()
+
+    assert not ipython.display.display.called
+    assert ipython.get_ipython.call_count == 1  # detected just once
@@ -0,0 +1,107 @@
+import json
+import time
+
+from RPA.core.profiler import KeywordProfiler
+
+
+def test_self_and_total_times(tmp_path):
+    profiler = KeywordProfiler(output_dir=tmp_path)
+
+    @profiler.profile
+    def outer():
+        inner()
+        time.sleep(0.02)
+
+    @profiler.profile
+    def inner():
+        time.sleep(0.01)
+
+    outer()
+    outer()
+    json_path, folded_path = profiler.write_report()
+
+    report = json.loads(json_path.read_text())
+    stats = {keyword["name"]: keyword for keyword in report["keywords"]}
+    outer_stats = stats["test_self_and_total_times.<locals>.outer"]
+    inner_stats = stats["test_self_and_total_times.<locals>.inner"]
+    assert outer_stats["calls"] == inner_stats["calls"] == 2
+    assert outer_stats["total_time"] >= 0.06
+    assert 0.04 <= outer_stats["self_time"] < outer_stats["total_time"]
+    assert inner_stats["self_time"] >= 0.02
+    assert [keyword["name"] for keyword in report["keywords"]][0] == outer_stats["name"]
+
+    lines = folded_path.read_text().splitlines()
+    assert len(lines) == 2
+    stack, value = lines[1].rsplit(" ", 1)
+    assert stack.count(";") == 1 and int(value) >= 20000
+
+
+def test_recursion_counted_once(tmp_path):
+    profiler = KeywordProfiler(output_dir=tmp_path)
+
+    with profiler.keyword("Retry"):
+        with profiler.keyword("Retry"):
+            time.sleep(0.01)
+
+    (keyword,) = profiler.get_stats()["keywords"]
+    assert keyword["calls"] == 2
+    assert keyword["total_time"] < 0.02  # not summing up the nested call
+
+
+def test_slow_calls_sampled(tmp_path):
+    profiler = KeywordProfiler(
+        output_dir=tmp_path, slow_threshold=0.01, sample_interval=0.005
+    )
+
+    def crunch_numbers():
+        end = time.perf_counter() + 0.1
+        while time.perf_counter() < end:
+            pass
+
+    with profiler.keyword("Fast"):
+        pass
+    with profiler.keyword("Slow; Keyword"):
+        crunch_numbers()
+    paths = profiler.write_report()
+
+    stats = profiler.get_stats()
+    assert [call["name"] for call in stats["slow_calls"]] == ["Slow; Keyword"]
+    assert stats["samples"]
+    assert all(
+        sample["stack"].startswith("Slow, Keyword;") for sample in stats["samples"]
+    )
+    assert any("crunch_numbers" in sample["stack"] for sample in stats["samples"])
+    assert paths[-1].name == "keyword-profile-samples.folded"
+
+
+def test_robot_listener(tmp_path):
+    from robot import run
+
+    suite = tmp_path / "suite.robot"
+    suite.write_text(
+        "*** Tasks ***\n"
+        "Task\n"
+        "    FOR    ${i}    IN RANGE    3\n"
+        "        Nested\n"
+        "    END\n"
+        "\n"
+        "*** Keywords ***\n"
+        "Nested\n"
+        "    Log    Hello\n"
+    )
+    profiler = KeywordProfiler()
+
+    run(
+        str(suite),
+        outputdir=str(tmp_path),
+        output="NONE",
+        log="NONE",
+        report="NONE",
+        listener=profiler,
+        stdout=None,
+    )
+
+    report = json.loads((tmp_path / "keyword-profile.json").read_text())
+    calls = {keyword["name"]: keyword["calls"] for keyword in report["keywords"]}
+    assert calls == {"Nested": 3, "BuiltIn.Log": 3}
+    assert "Nested;BuiltIn.Log" in (tmp_path / "keyword-profile.folded").read_text()
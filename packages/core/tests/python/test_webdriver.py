@@ -1,6 +1,7 @@
 import platform
 import os
 import re
+import time
 import unittest.mock as mock
 from pathlib import Path
 
@@ -12,12 +13,18 @@ from RPA.core import webdriver
 from . import RESULTS_DIR
 
 
+# Lookups into the persistent webdriver index are disabled for the download tests.
+INDEX_GET = webdriver.DriverIndex.get
+
+
 @pytest.fixture(autouse=True, scope="module")
 def disable_caching_enable_logging():
     with mock.patch(
         "webdriver_manager.core.driver_cache.DriverCacheManager.find_driver",
         new=mock.Mock(return_value=None),
-    ), mock.patch("RPA.core.webdriver.suppress_logging"):
+    ), mock.patch("RPA.core.webdriver.suppress_logging"), mock.patch(
+        "RPA.core.webdriver.DriverIndex.get", new=mock.Mock(return_value=None)
+    ):
         yield
 
 
@@ -68,6 +75,56 @@ def test_ie_download():
     assert "IEDriverServer.exe" in path
 
 
+@pytest.fixture
+def driver_index():
+    with mock.patch.object(webdriver.DriverIndex, "get", new=INDEX_GET):
+        yield
+
+
+def test_download_resolves_indexed_driver(tmp_path, driver_index):
+    driver = tmp_path / "chromedriver"
+    driver.write_bytes(b"driver")
+    index = webdriver.DriverIndex(tmp_path)
+    with mock.patch.object(webdriver, "get_browser_version", return_value="120.0.1"):
+        key = index.key("chrome", "120.0.1")
+        index.set(key, str(driver))
+        with mock.patch.object(webdriver, "_to_manager") as to_manager:
+            path = webdriver.download("Chrome", root=tmp_path)
+
+    assert path == str(driver)
+    to_manager.assert_not_called()
+
+
+def test_driver_index_invalidation(tmp_path, driver_index):
+    driver = tmp_path / "geckodriver"
+    driver.write_bytes(b"driver")
+    index = webdriver.DriverIndex(tmp_path, ttl=60)
+    key = index.key("firefox", None)
+    assert index.get(key) is None
+
+    index.set(key, str(driver))
+    assert webdriver.DriverIndex(tmp_path).get(key) == str(driver)
+
+    driver.write_bytes(b"tampered")
+    assert index.get(key) is None
+
+    index.set(key, str(driver))
+    with mock.patch("RPA.core.webdriver.time.time", return_value=time.time() + 61):
+        assert index.get(key) is None
+
+
+def test_prefetch_skips_failures(tmp_path):
+    def download(browser, root):
+        if browser == "Firefox":
+            raise webdriver.UnknownDriverError("no driver")
+        return f"{root}/{browser.lower()}driver"
+
+    with mock.patch.object(webdriver, "download", side_effect=download):
+        paths = webdriver.prefetch(["Chrome", "Firefox", "Safari"], root=tmp_path)
+
+    assert paths == {"Chrome": f"{tmp_path}/chromedriver"}
+
+
 @pytest.mark.parametrize("browser", ["Chrome", "Firefox", "Edge", "Ie"])
 def test_get_browser_version(browser):
     version = webdriver.get_browser_version(browser)
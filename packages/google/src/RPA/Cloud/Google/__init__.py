@@ -111,6 +111,7 @@ class Google(
 
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     ROBOT_LIBRARY_DOC_FORMAT = "REST"
+    ROBOT_LISTENER_API_VERSION = 2
 
     def __init__(
         self,
@@ -128,6 +129,7 @@ class Google(
          defaults to "serviceaccount"
         """
         self.logger = logging.getLogger(__name__)
+        self.ROBOT_LIBRARY_LISTENER = self
         self.service_account_file = service_account
         self.robocorp_vault_name = vault_name
         self.robocorp_vault_secret_key = vault_secret_key
@@ -1,17 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import mimetypes
+import os
 from pathlib import Path
 import shutil
+import threading
 import time
 from typing import Dict, List, Optional
 
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, build_http
 
 from . import keyword, UpdateAction
 from .enums import DriveRole, DriveType, to_drive_role, to_drive_type
 
 
+# Size of the ranges in which files are downloaded, and how many times
+#  a failed chunk request is retried.
+DRIVE_CHUNK_SIZE = 10 * 1024 * 1024
+DRIVE_NUM_RETRIES = 3
+DRIVE_FOLDER_MIMETYPE = "application/vnd.google-apps.folder"
+
+
 class GoogleDriveError(Exception):
     """Raised with errors in Drive API"""
 
@@ -27,6 +39,11 @@ class DriveKeywords:
     def __init__(self, ctx):
         self.ctx = ctx
         self.drive_service = None
+        self._drive_worker_local = threading.local()
+        # Resolved folders and file metadata, by key: (expiry time, value).
+        self.drive_cache_ttl = 300.0
+        self._drive_cache = {}
+        self._drive_cache_lock = threading.Lock()
 
     @keyword(tags=["init", "drive"])
     def init_drive(
@@ -63,8 +80,71 @@ class DriveKeywords:
             use_robocorp_vault=use_robocorp_vault,
             token_file=token_file,
         )
+        self.clear_drive_cache()
         return self.drive_service
 
+    @keyword(tags=["drive"])
+    def set_drive_cache_ttl(self, ttl: float = 300.0) -> None:
+        """Set how long the resolved folders and file metadata are cached
+
+        Folder names and paths given to the Drive keywords are resolved into
+        folder ids, which are cached for the session together with the file
+        metadata returned by the searches. The cached entries are dropped when
+        the files are created, moved, updated or deleted with the library.
+
+        :param ttl: time in seconds the entries are kept, `0` disables the cache,
+         defaults to 300
+
+        Example:
+
+        .. code-block:: robotframework
+
+            Set Drive Cache TTL    60
+        """
+        self.drive_cache_ttl = float(ttl)
+        if self.drive_cache_ttl <= 0:
+            self.clear_drive_cache()
+
+    @keyword(tags=["drive"])
+    def clear_drive_cache(self) -> None:
+        """Clear the cached folders and file metadata
+
+        Needed only when the Drive is modified outside of the library within
+        the cache time to live, see ``Set Drive Cache TTL``.
+        """
+        with self._drive_cache_lock:
+            self._drive_cache.clear()
+
+    def _get_cached(self, key):
+        with self._drive_cache_lock:
+            entry = self._drive_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._drive_cache[key]
+                return None
+            return entry[1]
+
+    def _set_cached(self, key, value):
+        if self.drive_cache_ttl > 0:
+            expires = time.monotonic() + self.drive_cache_ttl
+            with self._drive_cache_lock:
+                self._drive_cache[key] = (expires, value)
+
+    def _invalidate_drive_cache(self, file_ids):
+        file_ids = set(file_ids)
+        with self._drive_cache_lock:
+            known_files = [
+                self._drive_cache.pop(("file", file_id), (None, None))[1]
+                for file_id in file_ids
+            ]
+            if all(item and not item["is_folder"] for item in known_files):
+                return
+            # Moving or deleting a folder changes the folders under it as well.
+            for key in list(self._drive_cache):
+                if key[0] in ("folder", "path"):
+                    del self._drive_cache[key]
+
     @keyword(tags=["drive"])
     def upload_drive_file(
         self,
@@ -89,6 +169,52 @@ class DriveKeywords:
             ${file2_id}=  Upload Drive File  newdata.json  new_folder  make_dir=True
             ${file3_id}=  Upload Drive File  data.json  overwrite=True
         """
+        folder_id = self._get_upload_folder_id(folder, make_dir)
+        filepath = self._get_upload_path(filename)
+        return self._upload_into_folder(
+            filepath, folder_id, overwrite, self.drive_service
+        )
+
+    @keyword(tags=["drive"])
+    def upload_drive_files(
+        self,
+        filenames: List[str],
+        folder: str = None,
+        overwrite: bool = False,
+        make_dir: bool = False,
+        workers: int = 4,
+    ) -> List:
+        """Upload several files into the same Drive folder concurrently
+
+        The files are uploaded like with ``Upload Drive File``, by ``workers``
+        threads having their own Drive connections.
+
+        :param filenames: names of the files to upload
+        :param folder: target folder for upload
+        :param overwrite: set to `True` if already existing files should be
+         overwritten
+        :param make_dir: set to `True` if folder should be created if it does not exist
+        :param workers: number of files uploaded at the same time, defaults to 4
+        :return: list of uploaded file ids, in the order of the given files
+
+        Example:
+
+        .. code-block:: robotframework
+
+            ${files}=    List Files In Directory    invoices    absolute=True
+            ${ids}=    Upload Drive Files    ${files}    invoices    make_dir=True
+        """
+        folder_id = self._get_upload_folder_id(folder, make_dir)
+        paths = [self._get_upload_path(filename) for filename in filenames]
+
+        def upload(filepath):
+            return self._upload_into_folder(
+                filepath, folder_id, overwrite, self._get_worker_drive_service()
+            )
+
+        return self._run_drive_workers(upload, paths, workers)
+
+    def _get_upload_folder_id(self, folder, make_dir):
         folder_id = self.get_drive_folder_id(folder)
         if folder_id is None and make_dir:
             folder = self.create_drive_directory(folder)
@@ -97,7 +223,9 @@ class DriveKeywords:
             raise GoogleDriveError(
                 "Target folder '%s' does not exist or could not be created" % folder
             )
+        return folder_id
 
+    def _get_upload_path(self, filename):
         filepath = Path(filename)
         if filepath.is_dir():
             raise GoogleDriveError(
@@ -105,10 +233,14 @@ class DriveKeywords:
             )
         elif not filepath.is_file():
             raise GoogleDriveError("Filename '%s' does not exist" % filename)
+        return filepath
 
+    def _upload_into_folder(self, filepath, folder_id, overwrite, service):
         query_string = f"name = '{filepath.name}' and '{folder_id}' in parents"
         self.ctx.logger.debug("Upload query_string: '%s'" % query_string)
-        target_file = self.search_drive_files(query=query_string, recurse=True)
+        target_file = self._list_drive_files(
+            {"fields": "*", "q": query_string}, service
+        )
         guess_mimetype = mimetypes.guess_type(str(filepath.absolute()))
         file_mimetype = guess_mimetype[0] if guess_mimetype else "*/*"
         media = MediaFileUpload(
@@ -121,8 +253,8 @@ class DriveKeywords:
         }
         self.ctx.logger.debug("Upload file_metadata: '%s'" % file_metadata)
         if len(target_file) == 1 and overwrite:
-            self.ctx.logger.info("Overwriting file '%s' with new content", filename)
-            return self._file_update(target_file, media)
+            self.ctx.logger.info("Overwriting file '%s' with new content", filepath)
+            return self._file_update(target_file, media, service)
         elif len(target_file) == 1 and not overwrite:
             self.ctx.logger.warn("Not uploading new copy of file '%s'", filepath.name)
             return target_file[0]["id"]
@@ -133,12 +265,13 @@ class DriveKeywords:
             )
             return None
         else:
-            return self._file_create(file_metadata, media)
+            return self._file_create(file_metadata, media, service)
 
-    def _file_create(self, file_metadata, media):
+    def _file_create(self, file_metadata, media, service=None):
+        service = service or self.drive_service
         try:
             result = (
-                self.drive_service.files()
+                service.files()
                 .create(
                     body=file_metadata,
                     media_body=media,
@@ -150,10 +283,12 @@ class DriveKeywords:
         except HttpError as err:
             raise GoogleDriveError(str(err)) from err
 
-    def _file_update(self, target_file, media):
+    def _file_update(self, target_file, media, service=None):
+        service = service or self.drive_service
+        self._invalidate_drive_cache([target_file[0]["id"]])
         try:
             result = (
-                self.drive_service.files()
+                service.files()
                 .update(fileId=target_file[0]["id"], media_body=media, fields="id")
                 .execute()
             )
@@ -161,20 +296,49 @@ class DriveKeywords:
         except HttpError as err:
             raise GoogleDriveError(str(err)) from err
 
-    def _download_with_fileobject(self, file_object):
+    def _download_with_fileobject(self, file_object, service=None):
+        service = service or self.drive_service
         try:
-            request = self.drive_service.files().get_media(fileId=file_object["id"])
+            request = service.files().get_media(fileId=file_object["id"])
         except HttpError as err:
             raise GoogleDriveError(str(err)) from err
-        fh = BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-        while done is False:
-            _, done = downloader.next_chunk()
-        fh.seek(0)
-        with open(file_object["name"], "wb") as f:
+        # The chunks are streamed into a partial file, which replaces the target
+        #  file only once the whole file has been downloaded.
+        target = Path(file_object["name"])
+        partial = target.with_name(f"{target.name}.part")
+        try:
+            with open(partial, "wb") as f:
+                downloader = MediaIoBaseDownload(f, request, chunksize=DRIVE_CHUNK_SIZE)
+                done = False
+                while done is False:
+                    _, done = downloader.next_chunk(num_retries=DRIVE_NUM_RETRIES)
+            os.replace(partial, target)
+        except HttpError as err:
+            raise GoogleDriveError(str(err)) from err
+        finally:
+            if partial.exists():
+                partial.unlink()
+
+    def _get_worker_drive_service(self):
+        """Drive service of the current thread, as the HTTP connections of a
+        service can't be shared between threads.
+        """
+        local = self._drive_worker_local
+        if getattr(local, "base_service", None) is not self.drive_service:
             # pylint: disable=protected-access
-            shutil.copyfileobj(fh, f, length=downloader._total_size)
+            http = build_http()
+            credentials = getattr(self.drive_service._http, "credentials", None)
+            if credentials is not None:
+                http = AuthorizedHttp(credentials, http=http)
+            local.service = build_from_document(self.drive_service._rootDesc, http=http)
+            local.base_service = self.drive_service
+        return local.service
+
+    def _run_drive_workers(self, func, items, workers):
+        if int(workers) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=int(workers)) as executor:
+            return list(executor.map(func, items))
 
     @keyword(tags=["drive"])
     def download_drive_files(
@@ -184,17 +348,24 @@ class DriveKeywords:
         source: str = None,
         limit: int = None,
         timeout: float = None,
+        workers: int = 1,
     ) -> List:
         """Download files specified by file dictionary or query string
 
-        Parameters `start`, `limit` and `timeout` are used only when
+        Parameters `start`, `limit`, `timeout` and `workers` are used only when
         downloading files defined by `query` parameter.
 
+        The files are streamed in chunks straight into the target files. With
+        ``workers`` greater than 1, that many files are downloaded at the same
+        time, each thread using its own Drive connection. On ``timeout`` the
+        downloads already running are completed, but no new ones are started.
+
         :param file_dict: file dictionary returned by `Search Drive Files`
         :param query: drive query string to find target files, defaults to None
         :param source: source directory where query is executed
         :param limit: maximum amount of files that are downloaded, defaults to None
         :param timeout: maximum allowed time in seconds for download process
+        :param workers: number of files downloaded at the same time, defaults to 1
         :return: list of downloaded files
 
         Example:
@@ -210,7 +381,11 @@ class DriveKeywords:
 
             ${folder_id}=   Get Drive Folder Id   datafolder
             Download Drive Files  query=name contains '.json' and '${folder_id}' in parents
+            Download Drive Files  query='${folder_id}' in parents  workers=8
         """  # noqa: E501
+        if query and int(workers) > 1:
+            filelist = self.search_drive_files(query, source=source)
+            return self._download_concurrently(filelist, limit, timeout, workers)
         if query:
             filelist = self.search_drive_files(query, source=source)
             files_downloaded = []
@@ -239,6 +414,31 @@ class DriveKeywords:
             return [file_dict]
         return []
 
+    def _download_concurrently(self, filelist, limit, timeout, workers):
+        if limit and len(filelist) > int(limit):
+            self.ctx.logger.info(
+                "Drive download limit %s reached. Downloading only the first files.",
+                limit,
+            )
+            filelist = filelist[: int(limit)]
+        deadline = time.time() + float(timeout) if timeout else None
+
+        def download(file_object):
+            if deadline and time.time() > deadline:
+                return None
+            self._download_with_fileobject(
+                file_object, self._get_worker_drive_service()
+            )
+            return file_object["name"]
+
+        files_downloaded = self._run_drive_workers(download, filelist, workers)
+        if None in files_downloaded:
+            self.ctx.logger.info(
+                "Drive download timeout %s seconds reached. Stopped the download.",
+                timeout,
+            )
+        return [name for name in files_downloaded if name is not None]
+
     @keyword(tags=["drive"])
     def update_drive_file(
         self,
@@ -278,6 +478,7 @@ class DriveKeywords:
         target_files = self._get_target_file(
             file_id, file_dict, query, multiple_ok, source
         )
+        self._invalidate_drive_cache(target_files)
         update_count = 0
         for tf in target_files:
             self._drive_files_update(tf, action)
@@ -364,6 +565,7 @@ class DriveKeywords:
             ...            multiple_ok=True
         """  # noqa: E501
         target_files = self._get_target_file(file_id, file_dict, query, multiple_ok)
+        self._invalidate_drive_cache(target_files)
 
         delete_count = 0
         for tf in target_files:
@@ -383,8 +585,15 @@ class DriveKeywords:
     ) -> str:
         """Get file id for the folder
 
-        :param folder: name of the folder to identify, by default returns drive's
-         `root` folder id
+        The ``folder`` can be given either as a name, which needs to be unique
+        within the Drive (or the ``parent_folder``), or as a path like
+        ``invoices/2024/march``, which is resolved folder by folder starting from
+        the Drive's `root` folder (or the ``parent_folder``).
+
+        Resolved folders are cached, see ``Set Drive Cache TTL``.
+
+        :param folder: name or path of the folder to identify, by default returns
+         drive's `root` folder id
         :param parent_folder: can be used to narrow search by giving parent
          folder name
         :param details: on True will return folder dictionary, on False (default)
@@ -397,30 +606,75 @@ class DriveKeywords:
 
             ${root_id}=    Get Drive Folder Id   # returns Drive root folder id
             ${folder_id}=  Get Drive Folder Id  subdir
+            ${folder_id}=  Get Drive Folder Id  invoices/2024/march
         """
-        mime_folder_type = "application/vnd.google-apps.folder"
-        drive_file = None
         if folder is None:
+            drive_file = self._get_drive_root()
+        elif "/" in folder.strip("/"):
+            drive_file = self._get_drive_folder_by_path(folder, parent_folder)
+        else:
+            drive_file = self._get_drive_folder_by_name(
+                folder.strip("/"), parent_folder
+            )
+        if drive_file:
+            return drive_file if details else drive_file.get("id", None)
+        return None
+
+    def _get_drive_root(self):
+        drive_file = self._get_cached(("folder", None, None))
+        if drive_file is None:
             try:
                 drive_file = (
                     self.drive_service.files().get(fileId="root", fields="id").execute()
                 )
             except HttpError as err:
                 raise GoogleDriveError(str(err)) from err
-        else:
-            query_string = f"name = '{folder}' AND mimeType = '{mime_folder_type}'"
-            parameters = {"query": query_string, "recurse": True}
-            if parent_folder:
-                parameters["source"] = parent_folder
-            folders = self.search_drive_files(**parameters)
-            if len(folders) == 1:
-                drive_file = folders[0]  # .get("id", None)
-            else:
-                self.ctx.logger.info(
-                    "Found %s directories with name '%s'" % (len(folders), folder)
-                )
-        if drive_file:
-            return drive_file if details else drive_file.get("id", None)
+            self._set_cached(("folder", None, None), drive_file)
+        return drive_file
+
+    def _get_drive_folder_by_name(self, folder, parent_folder):
+        drive_file = self._get_cached(("folder", parent_folder, folder))
+        if drive_file is not None:
+            return drive_file
+        query_string = f"name = '{folder}' AND mimeType = '{DRIVE_FOLDER_MIMETYPE}'"
+        parameters = {"query": query_string, "recurse": True}
+        if parent_folder:
+            parameters["source"] = parent_folder
+        folders = self.search_drive_files(**parameters)
+        if len(folders) == 1:
+            self._set_cached(("folder", parent_folder, folder), folders[0])
+            return folders[0]
+        self.ctx.logger.info(
+            "Found %s directories with name '%s'" % (len(folders), folder)
+        )
+        return None
+
+    def _get_drive_folder_by_path(self, path, parent_folder=None):
+        drive_file = self.get_drive_folder_id(parent_folder, details=True)
+        for name in filter(None, path.split("/")):
+            if drive_file is None:
+                break
+            drive_file = self._get_drive_subfolder(drive_file["id"], name)
+        return drive_file
+
+    def _get_drive_subfolder(self, parent_id, name):
+        drive_file = self._get_cached(("path", parent_id, name))
+        if drive_file is not None:
+            return drive_file
+        query_string = (
+            f"name = '{name}' and mimeType = '{DRIVE_FOLDER_MIMETYPE}' "
+            f"and '{parent_id}' in parents"
+        )
+        folders = self._list_drive_files(
+            {"fields": "*", "q": query_string}, self.drive_service
+        )
+        if len(folders) == 1:
+            self._set_cached(("path", parent_id, name), folders[0])
+            return folders[0]
+        self.ctx.logger.info(
+            "Found %s directories with name '%s' in folder '%s'"
+            % (len(folders), name, parent_id)
+        )
         return None
 
     @keyword(tags=["drive"])
@@ -469,6 +723,7 @@ class DriveKeywords:
             raise GoogleDriveError(
                 "Unable to find target folder: '%s'" % (target if target else "root")
             )
+        self._invalidate_drive_cache(tf["id"] for tf in target_files)
         for tf in target_files:
             file = (
                 self.drive_service.files()
@@ -537,19 +792,22 @@ class DriveKeywords:
             ${files}=  Search Drive Files   query=name contains '.yaml'  recurse=True
             ${files}=  Search Drive Files   query=name contains '.yaml'  source=datadirectory
         """  # noqa: E501
+        parameters = self._set_search_parameters(query, source, recurse)
+        return self._list_drive_files(parameters, self.drive_service)
+
+    def _list_drive_files(self, parameters, service):
         page_token = None
         filelist = []
 
-        parameters = self._set_search_parameters(query, source, recurse)
-
         while True:
             if page_token:
                 parameters["pageToken"] = page_token
             try:
                 self.ctx.logger.debug("Searching with parameters: '%s'" % parameters)
-                response = self.drive_service.files().list(**parameters).execute()
+                response = service.files().list(**parameters).execute()
                 for file_details in response.get("files", []):
                     file_dict = self._drive_file_details_into_file_dict(file_details)
+                    self._set_cached(("file", file_dict["id"]), file_dict)
                     filelist.append(file_dict)
                 page_token = response.get("nextPageToken", None)
                 if page_token is None:
@@ -629,7 +887,11 @@ class DriveKeywords:
     ) -> Dict:
         """Create new directory to Google Drive
 
-        :param folder: name for the new directory
+        With a path like ``invoices/2024/march`` as the ``folder``, the missing
+        folders of the path are created, starting from the Drive's `root` folder
+        (or the ``parent_folder``).
+
+        :param folder: name or path for the new directory
         :param parent_folder: top level directory for new directory
         :return: dictionary containing folder ID and folder URL
 
@@ -640,9 +902,12 @@ class DriveKeywords:
             ${folder}=  Create Drive Directory   example-folder
             Log To Console    Google Drive folder ID: ${folder}[id]
             Log To Console    Google Drive folder URL:  ${folder}[url]
+            ${folder}=  Create Drive Directory   invoices/2024/march
         """
-        if not folder or len(folder) == 0:
+        if not folder or len(folder.strip("/")) == 0:
             raise GoogleDriveError("Can't create Drive directory with empty name")
+        if "/" in folder.strip("/"):
+            return self._create_drive_directory_path(folder, parent_folder)
 
         folder_id = self.get_drive_folder_id(folder, parent_folder=parent_folder)
         if folder_id:
@@ -651,13 +916,34 @@ class DriveKeywords:
             )
             return self._folder_response(folder_id)
 
-        file_metadata = {
-            "name": folder,
-            "mimeType": "application/vnd.google-apps.folder",
-        }
-
+        parent_folder_id = None
         if parent_folder:
             parent_folder_id = self.get_drive_folder_id(parent_folder)
+        return self._folder_response(
+            self._create_drive_folder(folder.strip("/"), parent_folder_id)
+        )
+
+    def _create_drive_directory_path(self, path, parent_folder):
+        drive_file = self.get_drive_folder_id(parent_folder, details=True)
+        if drive_file is None:
+            raise GoogleDriveError(
+                "Parent folder '%s' does not exist" % (parent_folder or "root")
+            )
+        folder_id = drive_file["id"]
+        for name in filter(None, path.split("/")):
+            drive_file = self._get_drive_subfolder(folder_id, name)
+            if drive_file is None:
+                folder_id = self._create_drive_folder(name, folder_id)
+            else:
+                folder_id = drive_file["id"]
+        return self._folder_response(folder_id)
+
+    def _create_drive_folder(self, name, parent_folder_id=None):
+        file_metadata = {
+            "name": name,
+            "mimeType": DRIVE_FOLDER_MIMETYPE,
+        }
+        if parent_folder_id:
             file_metadata["parents"] = [parent_folder_id]
         try:
             added_folder = (
@@ -665,9 +951,14 @@ class DriveKeywords:
                 .create(body=file_metadata, fields="id")
                 .execute()
             )
-            return self._folder_response(added_folder["id"])
         except HttpError as err:
             raise GoogleDriveError(str(err)) from err
+        # A cached folder with the same name might not be unique anymore.
+        with self._drive_cache_lock:
+            for key in list(self._drive_cache):
+                if key[0] == "folder" and key[2] == name:
+                    del self._drive_cache[key]
+        return added_folder["id"]
 
     def _folder_response(self, folder_id):
         return {
@@ -1041,6 +1332,8 @@ class DriveKeywords:
     def get_drive_file_by_id(self, file_id: str, suppress_errors: bool = False) -> Dict:
         """Get file dictionary by its file id.
 
+        The file metadata is cached, see ``Set Drive Cache TTL``.
+
         :param file_id: id of the file in the Google Drive
         :param suppress_errors: on True will log warning message instead of
          raising an exception, defaults to False (exception is raised)
@@ -1052,12 +1345,15 @@ class DriveKeywords:
 
             ${file_dict}=  Get Drive File By ID    file_id=${FILE_ID}
         """
-        response = None
+        response = self._get_cached(("file", file_id))
+        if response is not None:
+            return response
         try:
             raw_response = (
                 self.drive_service.files().get(fileId=file_id, fields="*").execute()
             )
             response = self._drive_file_details_into_file_dict(raw_response)
+            self._set_cached(("file", file_id), response)
         except HttpError as err:
             if suppress_errors:
                 self.ctx.logger.warn(str(err))
@@ -1,8 +1,10 @@
 import base64
 import mimetypes
 import os
+import time
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from email.mime.application import MIMEApplication
 from email.mime.audio import MIMEAudio
@@ -16,6 +18,15 @@ from googleapiclient import errors
 from . import keyword
 
 
+# Gmail accepts at most 100 calls in one batch request.
+GMAIL_BATCH_SIZE = 100
+# Attachments downloaded with one batch request, in total bytes.
+GMAIL_BATCH_BYTES = 20 * 1024 * 1024
+GMAIL_NUM_RETRIES = 3
+GMAIL_RETRY_STATUSES = (429, 500, 503)
+GMAIL_METADATA_HEADERS = ["From", "To", "Subject", "Date"]
+
+
 def get_size_format(b, factor=1024, suffix="B"):
     """
     Scale bytes to its proper byte format
@@ -48,6 +59,7 @@ class GmailKeywords:
     def __init__(self, ctx):
         self.ctx = ctx
         self.gmail_service = None
+        self.gmail_history_id = None
 
     @keyword(tags=["init", "gmail"])
     def init_gmail(
@@ -210,7 +222,7 @@ class GmailKeywords:
                 message_dict["date"] = value
         return message_dict
 
-    def handle_mimetypes(self, parsed_parts, part, msg, folder_name):
+    def handle_mimetypes(self, parsed_parts, part, msg, folder_name, attachments=None):
         filename = part.get("filename")
         mimetype = part.get("mimeType")
         body = part.get("body")
@@ -243,6 +255,15 @@ class GmailKeywords:
                             % (filename, get_size_format(filesize))
                         )
                         attachment_id = body.get("attachmentId")
+                        filepath = os.path.join(folder_name, filename)
+                        if attachments is not None:
+                            # downloaded later on, with batch requests
+                            entry = {"attachment": filepath, "id": attachment_id}
+                            parsed_parts.append(entry)
+                            attachments.append(
+                                (parsed_parts, entry, msg["id"], filesize)
+                            )
+                            continue
                         attachment = (
                             self.gmail_service.users()
                             .messages()
@@ -255,7 +276,6 @@ class GmailKeywords:
                             .execute()
                         )
                         data = attachment.get("data")
-                        filepath = os.path.join(folder_name, filename)
                         if data:
                             parsed_parts.append(
                                 {"attachment": filepath, "id": attachment_id}
@@ -273,9 +293,21 @@ class GmailKeywords:
         max_results: int = None,
         include_json: bool = False,
         include_spam: bool = False,
+        include_body: bool = True,
+        incremental: bool = False,
+        history_id: str = None,
     ):
         """List messages
 
+        The messages and their attachments are fetched with batch requests,
+        up to 100 messages per request.
+
+        With `incremental` only the messages added after the previous
+        incremental listing are returned. The first listing returns all the
+        matching messages, like without `incremental`. The point where the
+        listing continues is kept in the library, or given with `history_id`
+        (see ``Get Gmail History Id``) when the robot runs again.
+
         :param user_id: user's email address. The special value me can
          be used to indicate the authenticated user.
         :param query: message query
@@ -285,6 +317,13 @@ class GmailKeywords:
         :param max_results: maximum number of message to return
         :param include_json: include original response json
         :param include_spam: include messages from SPAM and TRASH
+        :param include_body: fetch the message bodies and save the attachments,
+         otherwise only the headers (`from`, `to`, `subject` and `date`) are
+         fetched, default True
+        :param incremental: list only the messages added since the previous
+         incremental listing, default False
+        :param history_id: mailbox history id to continue the incremental
+         listing from, implies `incremental`
         :return: messages
 
         Example:
@@ -298,44 +337,216 @@ class GmailKeywords:
             FOR    ${msg}    IN    @{messages}
                 Log Many    ${msg}
             END
+
+            # Only the messages which arrived since the previous run
+            ${messages}=    List Messages    me    has:attachment
+            ...    include_body=False
+            ...    history_id=${PREVIOUS_HISTORY_ID}
+            ${history_id}=    Get Gmail History Id
         """
         parameters = self.set_list_parameters(
             user_id, query, label_ids, max_results, include_spam
         )
         folder_name = Path(folder_name) if folder_name else Path().absolute()
+        incremental = incremental or bool(history_id)
+        history_id = history_id or (self.gmail_history_id if incremental else None)
         messages = []
         try:
-            response = (
-                self.gmail_service.users().messages().list(**parameters).execute()
-            )
-            message_ids = [
-                m["id"] for m in response["messages"] if "messages" in response.keys()
-            ]
-            for message_id in message_ids:
+            message_ids = None
+            if history_id:
+                message_ids, history_id = self._list_new_message_ids(
+                    user_id, parameters, history_id
+                )
+            if message_ids is None:
+                if incremental:
+                    # The current history id, taken before listing so that
+                    # no message gets skipped by the next incremental listing.
+                    history_id = (
+                        self.gmail_service.users()
+                        .getProfile(userId=user_id)
+                        .execute()["historyId"]
+                    )
                 response = (
-                    self.gmail_service.users()
-                    .messages()
-                    .get(userId=user_id, id=message_id)
-                    .execute()
+                    self.gmail_service.users().messages().list(**parameters).execute()
                 )
+                message_ids = [m["id"] for m in response.get("messages", [])]
+
+            responses = self._get_gmail_messages(user_id, message_ids, include_body)
+            attachments = []
+            for message_id in message_ids:
+                response = responses[message_id]
                 payload = response["payload"]
                 message_dict = self.set_headers_to_message_dict(
                     payload, message_id, response
                 )
                 if include_json:
                     message_dict["json"] = response
-                parts = payload.get("parts")
-                parsed_parts = self.parse_parts(
-                    message_id, response, parts, folder_name
-                )
+                parsed_parts = []
+                if include_body:
+                    parts = payload.get("parts")
+                    parsed_parts = self.parse_parts(
+                        message_id, response, parts, folder_name, attachments
+                    )
                 message_dict["parts"] = parsed_parts
                 messages.append(message_dict)
+            self._save_gmail_attachments(user_id, attachments)
         except errors.HttpError as he:
             self.ctx.logger.warning(str(he))
             raise he
+        if incremental:
+            self.gmail_history_id = history_id
         return messages
 
-    def parse_parts(self, msg_id, msg, parts, folder_name):
+    @keyword(tags=["gmail"])
+    def get_gmail_history_id(self) -> Optional[str]:
+        """Get the mailbox history id of the latest incremental ``List Messages``
+
+        Store the id to continue the incremental listing from it, when the
+        robot runs the next time.
+
+        :return: history id, or None if there has not been an incremental listing
+
+        Example:
+
+        .. code-block:: robotframework
+
+            ${history_id}=    Get Gmail History Id
+        """
+        return self.gmail_history_id
+
+    def _list_new_message_ids(self, user_id, parameters, start_history_id):
+        """Returns the ids of the messages added after the given history id,
+        matching the list parameters, and the current history id.
+
+        The ids are None if the history id is too old to continue from.
+        """
+        history = self.gmail_service.users().history()
+        added = set()
+        request = history.list(
+            userId=user_id,
+            startHistoryId=start_history_id,
+            historyTypes=["messageAdded"],
+            maxResults=500,
+        )
+        try:
+            while request is not None:
+                response = request.execute()
+                for record in response.get("history", []):
+                    for message in record.get("messagesAdded", []):
+                        added.add(message["message"]["id"])
+                history_id = response["historyId"]
+                request = history.list_next(request, response)
+        except errors.HttpError as he:
+            if he.resp.status != 404:
+                raise
+            self.ctx.logger.warning(
+                "History id %s has expired, listing all messages", start_history_id
+            )
+            return None, None
+
+        # The new messages are filtered with the query by listing the matching
+        # messages, which come newest first, until the first older one.
+        messages = self.gmail_service.users().messages()
+        max_results = parameters.get("maxResults") or len(added)
+        message_ids = []
+        request = messages.list(**parameters) if added else None
+        while request is not None and len(message_ids) < max_results:
+            response = request.execute()
+            for message in response.get("messages", []):
+                if message["id"] not in added or len(message_ids) >= max_results:
+                    return message_ids, history_id
+                message_ids.append(message["id"])
+            request = messages.list_next(request, response)
+        return message_ids, history_id
+
+    def _get_gmail_messages(self, user_id, message_ids, include_body=True) -> Dict:
+        parameters = {"userId": user_id}
+        if not include_body:
+            parameters["format"] = "metadata"
+            parameters["metadataHeaders"] = GMAIL_METADATA_HEADERS
+        messages = self.gmail_service.users().messages()
+        return self._execute_gmail_batch(
+            {
+                message_id: messages.get(id=message_id, **parameters)
+                for message_id in message_ids
+            }
+        )
+
+    def _save_gmail_attachments(self, user_id, attachments):
+        requests = {}
+        sizes = {}
+        for idx, (_, entry, message_id, size) in enumerate(attachments):
+            requests[str(idx)] = (
+                self.gmail_service.users()
+                .messages()
+                .attachments()
+                .get(id=entry["id"], userId=user_id, messageId=message_id)
+            )
+            sizes[str(idx)] = size or 0
+        responses = self._execute_gmail_batch(requests, sizes)
+        for idx, (parsed_parts, entry, _, _) in enumerate(attachments):
+            data = responses[str(idx)].get("data")
+            if not data:
+                parsed_parts.remove(entry)
+                continue
+            with open(entry["attachment"], "wb") as f:
+                f.write(base64.urlsafe_b64decode(data))
+
+    def _execute_gmail_batch(self, requests: Dict, sizes: Dict = None) -> Dict:
+        """Executes the requests with batch requests, returns the responses
+        by the request ids.
+
+        The batches are limited by the total size of the responses, if the
+        sizes are given. Rate limited requests are retried.
+        """
+        responses = {}
+
+        def callback(attempt, retries, request_id, response, exception):
+            if exception is None:
+                responses[request_id] = response
+            elif (
+                isinstance(exception, errors.HttpError)
+                and exception.resp.status in GMAIL_RETRY_STATUSES
+                and attempt < GMAIL_NUM_RETRIES
+            ):
+                retries.append(request_id)
+            else:
+                raise exception
+
+        pending = list(requests)
+        for attempt in range(GMAIL_NUM_RETRIES + 1):
+            retries = []
+            for batch_ids in self._split_gmail_batches(pending, sizes or {}):
+                batch = self.gmail_service.new_batch_http_request(
+                    callback=partial(callback, attempt, retries)
+                )
+                for request_id in batch_ids:
+                    batch.add(requests[request_id], request_id=request_id)
+                batch.execute()
+            if not retries:
+                break
+            self.ctx.logger.info("Retrying %d rate limited requests", len(retries))
+            time.sleep(2**attempt)
+            pending = retries
+        return responses
+
+    @staticmethod
+    def _split_gmail_batches(request_ids: List, sizes: Dict):
+        batch_ids, batch_size = [], 0
+        for request_id in request_ids:
+            size = sizes.get(request_id, 0)
+            if batch_ids and (
+                len(batch_ids) >= GMAIL_BATCH_SIZE
+                or batch_size + size > GMAIL_BATCH_BYTES
+            ):
+                yield batch_ids
+                batch_ids, batch_size = [], 0
+            batch_ids.append(request_id)
+            batch_size += size
+        if batch_ids:
+            yield batch_ids
+
+    def parse_parts(self, msg_id, msg, parts, folder_name, attachments=None):
         """
         Utility function that parses the content of an email partition
         """
@@ -352,7 +563,9 @@ class GmailKeywords:
                 if part.get("parts"):
                     # recursively call this function when we see that a part
                     # has parts inside
-                    self.parse_parts(None, msg, part.get("parts"), folder_name)
-                self.handle_mimetypes(parsed_parts, part, msg, folder_name)
+                    self.parse_parts(
+                        None, msg, part.get("parts"), folder_name, attachments
+                    )
+                self.handle_mimetypes(parsed_parts, part, msg, folder_name, attachments)
 
         return parsed_parts
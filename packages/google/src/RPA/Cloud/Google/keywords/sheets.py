@@ -1,14 +1,27 @@
+import importlib
 from typing import Dict, List, Optional
 
 from . import keyword
 
 
+def import_table():
+    """Try to import the Table class of RPA.Tables library"""
+    try:
+        module = importlib.import_module("RPA.Tables")
+        return getattr(module, "Table")
+    except ModuleNotFoundError:
+        return None
+
+
 class SheetsKeywords:
     """Keywords for Google Sheets operations"""
 
     def __init__(self, ctx):
         self.ctx = ctx
         self.sheets_service = None
+        # Queued value updates by spreadsheet: (value input option, value range).
+        self.sheets_write_buffer_size = 100
+        self._sheets_write_buffer = {}
 
     @keyword(tags=["init", "sheets"])
     def init_sheets(
@@ -109,6 +122,7 @@ class SheetsKeywords:
             ${result}=  Insert Sheet Values   ${SPREADSHEET_ID}  A:B  ${values}
             ${result}=  Insert Sheet Values   ${SPREADSHEET_ID}  A:B  ${values}  ROWS
         """
+        self._flush_sheet_values(spreadsheet_id)
         resource = {"majorDimension": major_dimension, "values": values}
         return (
             self.sheets_service.spreadsheets()
@@ -166,6 +180,7 @@ class SheetsKeywords:
             ...   ${row}
             ...   ROWS
         """
+        self._flush_sheet_values(spreadsheet_id)
         resource = {"majorDimension": major_dimension, "values": values}
         return (
             self.sheets_service.spreadsheets()
@@ -217,9 +232,248 @@ class SheetsKeywords:
             "valueRenderOption": value_render_option,
             "dateTimeRenderOption": datetime_render_option,
         }
-
+        self._flush_sheet_values(spreadsheet_id)
         return self.sheets_service.spreadsheets().values().get(**parameters).execute()
 
+    @keyword(tags=["sheets"])
+    def queue_sheet_values(
+        self,
+        spreadsheet_id: str,
+        sheet_range: str,
+        values: list,
+        major_dimension: str = "COLUMNS",
+        value_input_option: str = "USER_ENTERED",
+    ) -> None:
+        """Queue values to be updated into sheet cells
+
+        Works like ``Update Sheet Values``, but the updates are collected into
+        a buffer and sent together in ``batchUpdate`` requests, using a single
+        request for many ranges instead of one request per range.
+
+        The queued updates of a spreadsheet are sent when the buffer gets full
+        (see ``Set Sheets Write Buffer Size``), before the other keywords read or
+        change the same spreadsheet and with ``Flush Sheet Values``. Updates
+        still queued when the suite ends are sent then, and a warning is logged
+        if sending them fails.
+
+        :param spreadsheet_id: target spreadsheet
+        :param sheet_range: target sheet range
+        :param values: list of values to insert into sheet
+        :param major_dimension: major dimension of the values, default `COLUMNS`
+        :param value_input_option: controls whether input strings are parsed or not,
+         default `USER_ENTERED`
+
+        **Examples**
+
+        **Python**
+
+        .. code-block:: python
+
+            for row, invoice in enumerate(invoices, start=2):
+                GOOGLE.queue_sheet_values(
+                    spreadsheet_id, f"D{row}:E{row}", [invoice.status], "ROWS"
+                )
+            GOOGLE.flush_sheet_values(spreadsheet_id)
+
+        **Robot Framework**
+
+        .. code-block:: robotframework
+
+            FOR    ${row}    IN RANGE    2    ${ROW_COUNT}
+                Queue Sheet Values    ${SPREADSHEET_ID}    D${row}    ${{[["done"]]}}
+            END
+            Flush Sheet Values    ${SPREADSHEET_ID}
+        """
+        buffer = self._sheets_write_buffer.setdefault(spreadsheet_id, [])
+        buffer.append(
+            (
+                value_input_option,
+                {
+                    "range": sheet_range,
+                    "majorDimension": major_dimension,
+                    "values": values,
+                },
+            )
+        )
+        if len(buffer) >= self.sheets_write_buffer_size:
+            self._flush_sheet_values(spreadsheet_id)
+
+    @keyword(tags=["sheets"])
+    def flush_sheet_values(self, spreadsheet_id: str = None) -> List:
+        """Send the updates queued with ``Queue Sheet Values``
+
+        :param spreadsheet_id: spreadsheet whose updates are sent, by default
+         the updates of all the spreadsheets are sent
+        :return: list of ``batchUpdate`` operation results
+
+        **Examples**
+
+        **Robot Framework**
+
+        .. code-block:: robotframework
+
+            ${results}=    Flush Sheet Values
+        """
+        spreadsheet_ids = (
+            [spreadsheet_id] if spreadsheet_id else list(self._sheets_write_buffer)
+        )
+        results = []
+        for target_id in spreadsheet_ids:
+            results.extend(self._flush_sheet_values(target_id))
+        return results
+
+    @keyword(tags=["sheets"])
+    def set_sheets_write_buffer_size(self, size: int = 100) -> None:
+        """Set how many updates ``Queue Sheet Values`` collects for a spreadsheet
+        before sending them
+
+        :param size: number of queued ranges, defaults to 100
+        """
+        self.sheets_write_buffer_size = max(int(size), 1)
+
+    def _end_suite(self, *_):
+        """Robot Framework listener method, called when the suite ends."""
+        self._flush_queued_sheet_values()
+
+    def _close(self):
+        """Robot Framework listener method, called when the library goes out of
+        scope."""
+        self._flush_queued_sheet_values()
+
+    def _flush_queued_sheet_values(self):
+        if not self._sheets_write_buffer:
+            return
+        try:
+            self.flush_sheet_values()
+        except Exception as err:  # pylint: disable=broad-except
+            pending = sum(len(buffer) for buffer in self._sheets_write_buffer.values())
+            self.ctx.logger.warning(
+                "%s queued sheet value updates were not sent: %s", pending, err
+            )
+
+    def _flush_sheet_values(self, spreadsheet_id: str) -> List:
+        buffer = self._sheets_write_buffer.pop(spreadsheet_id, [])
+        results = []
+        try:
+            while buffer:
+                # Consecutive updates with the same input option are sent together.
+                value_input_option = buffer[0][0]
+                count = 1
+                while count < len(buffer) and buffer[count][0] == value_input_option:
+                    count += 1
+                body = {
+                    "valueInputOption": value_input_option,
+                    "data": [data for _, data in buffer[:count]],
+                }
+                self.ctx.logger.debug(
+                    "Updating %s ranges of spreadsheet %s", count, spreadsheet_id
+                )
+                results.append(
+                    self.sheets_service.spreadsheets()
+                    .values()
+                    .batchUpdate(spreadsheetId=spreadsheet_id, body=body)
+                    .execute()
+                )
+                buffer = buffer[count:]
+        finally:
+            if buffer:
+                # Keep the updates which were not sent in the queue.
+                self._sheets_write_buffer[spreadsheet_id] = buffer
+        return results
+
+    @keyword(tags=["sheets"])
+    def batch_get_sheet_values(
+        self,
+        spreadsheet_id: str,
+        sheet_ranges: List[str],
+        value_render_option: str = "UNFORMATTED_VALUE",
+        datetime_render_option: str = "FORMATTED_STRING",
+        as_table: bool = False,
+        header: bool = False,
+    ) -> List:
+        """Get values from several ranges of the spreadsheet with one request
+
+        :param spreadsheet_id: target spreadsheet
+        :param sheet_ranges: list of target sheet ranges
+        :param value_render_option: how values should be represented
+         in the output defaults to "UNFORMATTED_VALUE"
+        :param datetime_render_option: how dates, times, and durations should be
+         represented in the output, defaults to "FORMATTED_STRING"
+        :param as_table: return the values of the ranges as `RPA.Tables.Table`
+         objects, defaults to False (list of value ranges as returned by the API)
+        :param header: with ``as_table``, use the first row of the range as the
+         column names, defaults to False
+        :return: list of value ranges or tables, in the order of the ranges
+
+        **Examples**
+
+        **Python**
+
+        .. code-block:: python
+
+            customers, orders = GOOGLE.batch_get_sheet_values(
+                spreadsheet_id,
+                ["Customers!A1:D", "Orders!A1:F"],
+                as_table=True,
+                header=True,
+            )
+
+        **Robot Framework**
+
+        .. code-block:: robotframework
+
+            ${ranges}=    Create List    Customers!A1:D    Orders!A1:F
+            ${tables}=    Batch Get Sheet Values    ${SPREADSHEET_ID}    ${ranges}
+            ...    as_table=True    header=True
+        """
+        value_ranges = self._batch_get_sheet_values(
+            spreadsheet_id, sheet_ranges, value_render_option, datetime_render_option
+        )
+        if not as_table:
+            return value_ranges
+        return [
+            self._values_to_table(value_range.get("values", []), header)
+            for value_range in value_ranges
+        ]
+
+    def _batch_get_sheet_values(
+        self,
+        spreadsheet_id,
+        sheet_ranges,
+        value_render_option="UNFORMATTED_VALUE",
+        datetime_render_option="FORMATTED_STRING",
+    ):
+        self._flush_sheet_values(spreadsheet_id)
+        result = (
+            self.sheets_service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=list(sheet_ranges),
+                valueRenderOption=value_render_option,
+                dateTimeRenderOption=datetime_render_option,
+            )
+            .execute()
+        )
+        return result.get("valueRanges", [])
+
+    def _values_to_table(self, rows, header):
+        table = import_table()
+        if table is None:
+            raise ModuleNotFoundError(
+                "RPA.Tables library is required to return the values as tables"
+            )
+        columns = None
+        if header and rows:
+            columns, rows = rows[0], rows[1:]
+        width = max([len(columns or [])] + [len(row) for row in rows])
+        rows = [list(row) + [None] * (width - len(row)) for row in rows]
+        if columns is not None:
+            columns = list(columns) + [
+                self.to_column_letter(idx + 1) for idx in range(len(columns), width)
+            ]
+        return table(rows, columns=columns)
+
     @keyword(tags=["sheets"])
     def get_all_sheet_values(
         self,
@@ -272,7 +526,7 @@ class SheetsKeywords:
         target_column = self.to_column_letter(found_sheet["columns"])
         rows = found_sheet["rows"]
         parameters["range"] = f"{sheet_title}!A1:{target_column}{rows}"
-
+        self._flush_sheet_values(spreadsheet_id)
         return self.sheets_service.spreadsheets().values().get(**parameters).execute()
 
     @keyword(tags=["sheets"])
@@ -297,6 +551,7 @@ class SheetsKeywords:
 
             ${result}=  Clear Sheet Values  ${SPREADSHEET_ID}  A1:C1
         """
+        self._flush_sheet_values(spreadsheet_id)
         return (
             self.sheets_service.spreadsheets()
             .values()
@@ -338,6 +593,8 @@ class SheetsKeywords:
         body = {
             "destination_spreadsheet_id": target_spreadsheet_id,
         }
+        self._flush_sheet_values(spreadsheet_id)
+        self._flush_sheet_values(target_spreadsheet_id)
         return (
             self.sheets_service.spreadsheets()
             .sheets()
@@ -381,6 +638,7 @@ class SheetsKeywords:
         :param spreadsheet_id: ID of the spreadsheet
         :return: operation result as an dictionary
         """
+        self._flush_sheet_values(spreadsheet_id)
         return (
             self.sheets_service.spreadsheets()
             .get(spreadsheetId=spreadsheet_id)
@@ -653,6 +911,7 @@ class SheetsKeywords:
             ${body}=    Evaluate    {"requests": {"deleteSheet": {"sheetId": "333555666"}}}
             ${result}=    Generic Spreadsheet Batch Update    ${SPREADSHEET_ID}    ${body}
         """  # noqa: E501
+        self._flush_sheet_values(spreadsheet_id)
         return (
             self.sheets_service.spreadsheets()
             .batchUpdate(
@@ -670,27 +929,32 @@ class SheetsKeywords:
         :param sheet_name: name of the sheet, or leave None for all sheets
         :return: tables arranged by sheets
         """
+        sheets = self.get_spreadsheet_basic_information(spreadsheet_id)["sheets"]
         if sheet_name:
-            sheets = [sheet_name]
-        else:
-            result = self.get_spreadsheet_basic_information(spreadsheet_id)
-            sheets = [sheet["title"] for sheet in result["sheets"]]
+            sheets = [sheet for sheet in sheets if sheet["title"] == sheet_name]
+            if len(sheets) != 1:
+                raise KeyError(f"Sheet {sheet_name} not found")
 
+        # Values of all the sheets are fetched with a single request.
+        value_ranges = self._batch_get_sheet_values(
+            spreadsheet_id,
+            [
+                f"{sheet['title']}!A1:"
+                f"{self.to_column_letter(sheet['columns'])}{sheet['rows']}"
+                for sheet in sheets
+            ],
+        )
         tables = {}
-        for sheet in sheets:
-            tables[sheet] = self._detect_tables_in_sheet(spreadsheet_id, sheet)
+        for sheet, value_range in zip(sheets, value_ranges):
+            sheet = sheet["title"]
+            tables[sheet] = self._detect_tables_in_rows(value_range.get("values", []))
             self.ctx.logger.info(
                 f"found {len(tables[sheet])} table(s) in sheet: {sheet}"
             )
 
         return tables
 
-    def _detect_tables_in_sheet(self, spreadsheet_id: str, sheet_name: str):
-        result = self.get_all_sheet_values(spreadsheet_id, sheet_name)
-        rows = []
-        if "values" in result.keys():
-            rows = result["values"]
-
+    def _detect_tables_in_rows(self, rows: List):
         # Identify header rows and their columns.
         areas = self._identify_header_rows_and_columns(rows)
         return self._combine_areas(areas)
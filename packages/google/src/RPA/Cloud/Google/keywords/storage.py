@@ -1,10 +1,19 @@
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
+from google.api_core import exceptions
 from google.cloud import storage
 
 from . import keyword
 
 
+STORAGE_WORKERS = 8
+# Cloud Storage accepts at most 100 calls in one batch request.
+STORAGE_BATCH_SIZE = 100
+STORAGE_PAGE_SIZE = 1000
+
+
 class StorageKeywords:
     """Class for Google Cloud Storage API
      and Google Cloud Storage JSON API
@@ -17,6 +26,7 @@ class StorageKeywords:
     def __init__(self, ctx):
         self.ctx = ctx
         self.storage_service = None
+        self.storage_workers = STORAGE_WORKERS
 
     @keyword(tags=["init", "storage"])
     def init_storage(
@@ -114,13 +124,34 @@ class StorageKeywords:
         return list(self.storage_service.list_buckets())
 
     @keyword(tags=["storage"])
-    def delete_storage_files(self, bucket_name: str, files: Any) -> List:
+    def set_storage_workers(self, workers: int = STORAGE_WORKERS) -> None:
+        """Set the number of files uploaded or downloaded at the same time
+
+        :param workers: number of concurrent transfers, default 8
+
+        **Examples**
+
+        **Robot Framework**
+
+        .. code-block:: robotframework
+
+            Set Storage Workers    16
+        """
+        self.storage_workers = max(1, int(workers))
+
+    @keyword(tags=["storage"])
+    def delete_storage_files(
+        self, bucket_name: str, files: Any, return_results: bool = False
+    ) -> Union[List, bool]:
         """Delete files in the bucket
 
-        Files need to be object name in the bucket.
+        Files need to be object name in the bucket. The files are deleted
+        with batch requests, up to 100 files per request.
 
         :param bucket_name: name as string
         :param files: single file, list of files or comma separated list of files
+        :param return_results: return the result (with the `name`, `status`
+         and `error`) of each file instead
         :return: list of files which could not be deleted
 
          **Examples**
@@ -134,21 +165,56 @@ class StorageKeywords:
         if not isinstance(files, list):
             files = files.split(",")
         bucket = self.get_storage_bucket(bucket_name)
-        notfound = []
-        for filename in files:
-            filename = filename.strip()
-            blob = bucket.get_blob(filename)
-            if blob:
-                blob.delete()
-            else:
-                notfound.append(filename)
+        results = []
+        for idx in range(0, len(files), STORAGE_BATCH_SIZE):
+            names = [name.strip() for name in files[idx : idx + STORAGE_BATCH_SIZE]]
+            results.extend(
+                self._delete_storage_batch(bucket, names, not return_results)
+            )
+        if return_results:
+            return results
+        notfound = [
+            result["name"] for result in results if result["status"] != "deleted"
+        ]
         return notfound if len(notfound) > 0 else True
 
+    def _delete_storage_batch(
+        self, bucket, names: List[str], raise_errors: bool
+    ) -> List[Dict]:
+        # The failed calls are not raised, their responses are checked below.
+        batch = self.storage_service.batch(raise_exception=False)
+        with batch:
+            for name in names:
+                bucket.delete_blob(name)
+
+        # Deletes return no futures and the context manager drops the return
+        # value of Batch.finish, so the responses are read from the batch.
+        responses = batch._responses  # pylint: disable=protected-access
+        results = []
+        for name, response in zip(names, responses):
+            result = {"name": name, "status": "deleted", "error": None}
+            if response.status_code == 404:
+                result["status"] = "not found"
+            elif not 200 <= response.status_code < 300:
+                error = exceptions.from_http_response(response)
+                if raise_errors:
+                    raise error
+                result.update(status="failed", error=str(error))
+                self.ctx.logger.warning(
+                    "Deleting object %s failed with error: %s", name, error
+                )
+            results.append(result)
+        return results
+
     @keyword(tags=["storage"])
-    def list_storage_files(self, bucket_name: str) -> List:
+    def list_storage_files(self, bucket_name: str, prefix: str = None) -> List:
         """List files in the bucket
 
+        Use ``Iterate Storage Files`` instead with buckets having a lot of
+        files, as it does not hold all of them in the memory.
+
         :param bucket_name: name as string
+        :param prefix: list only the files starting with the prefix
         :return: list of object names in the bucket
 
         **Examples**
@@ -162,12 +228,47 @@ class StorageKeywords:
                 Log  ${file}
             END
         """
-        bucket = self.get_storage_bucket(bucket_name)
-        all_blobs = bucket.list_blobs()
-        sorted_blobs = sorted(blob.name for blob in all_blobs)
-        return [
-            {"name": name, "uri": f"gs://{bucket_name}/{name}"} for name in sorted_blobs
-        ]
+        return sorted(
+            self.iterate_storage_files(bucket_name, prefix),
+            key=lambda item: item["name"],
+        )
+
+    @keyword(tags=["storage"])
+    def iterate_storage_files(
+        self,
+        bucket_name: str,
+        prefix: str = None,
+        page_size: int = STORAGE_PAGE_SIZE,
+    ) -> Iterator[Dict]:
+        """Iterate over the files in the bucket
+
+        The files are listed page by page while iterating, in the order of
+        their names.
+
+        :param bucket_name: name as string
+        :param prefix: list only the files starting with the prefix
+        :param page_size: number of files listed with one request, default 1000
+        :return: generator of files, with the `name` and `uri` of the file
+
+        **Examples**
+
+        **Robot Framework**
+
+        .. code-block:: robotframework
+
+            ${files}=   Iterate Storage Files  ${BUCKET_NAME}   prefix=invoices/
+            FOR  ${file}  IN   @{files}
+                Log  ${file}[uri]
+            END
+        """
+        blobs = self.storage_service.list_blobs(
+            bucket_name,
+            prefix=prefix,
+            page_size=int(page_size),
+            fields="items(name),nextPageToken",
+        )
+        for blob in blobs:
+            yield {"name": blob.name, "uri": f"gs://{bucket_name}/{blob.name}"}
 
     @keyword(tags=["storage"])
     def upload_storage_file(
@@ -194,14 +295,27 @@ class StorageKeywords:
             blob.upload_from_file(f)
 
     @keyword(tags=["storage"])
-    def upload_storage_files(self, bucket_name: str, files: dict) -> None:
+    def upload_storage_files(
+        self,
+        bucket_name: str,
+        files: dict,
+        workers: Optional[int] = None,
+        return_results: bool = False,
+    ) -> Optional[List[Dict]]:
         """Upload files into a bucket
 
+        The files are uploaded concurrently, see ``Set Storage Workers``.
+
         Example `files`:
         `files = {"mytestimg": "image1.png", "mydoc": "google.pdf"}`
 
         :param bucket_name: name as string
         :param files: dictionary of object names and filepaths
+        :param workers: number of files uploaded at the same time, by default
+         the one set with ``Set Storage Workers`` (8)
+        :param return_results: return the result (with the `name`, `filename`,
+         `status` and `error`) of each file, instead of raising an error on the
+         first failed upload
 
         **Examples**
 
@@ -217,20 +331,42 @@ class StorageKeywords:
         if not isinstance(files, dict):
             raise ValueError("files needs to be an dictionary")
         bucket = self.get_storage_bucket(bucket_name)
-        for target_name, filename in files.items():
-            blob = bucket.blob(target_name)
-            blob.upload_from_filename(filename)
+        transfers = [
+            partial(
+                self._transfer_storage_file,
+                bucket.blob(target_name).upload_from_filename,
+                {"name": target_name, "filename": filename},
+                "uploaded",
+                return_results,
+            )
+            for target_name, filename in files.items()
+        ]
+        results = self._run_storage_transfers(transfers, workers)
+        return results if return_results else None
 
     @keyword(tags=["storage"])
-    def download_storage_files(self, bucket_name: str, files: Any) -> List:
+    def download_storage_files(
+        self,
+        bucket_name: str,
+        files: Any,
+        workers: Optional[int] = None,
+        return_results: bool = False,
+    ) -> List:
         """Download files from a bucket
 
+        The files are downloaded concurrently, see ``Set Storage Workers``.
+
         Example `files`:
         `files = {"mytestimg": "image1.png", "mydoc": "google.pdf"}`
 
         :param bucket_name: name as string
         :param files: list of object names or dictionary of
             object names and target files
+        :param workers: number of files downloaded at the same time, by default
+         the one set with ``Set Storage Workers`` (8)
+        :param return_results: return the result (with the `name`, `filename`,
+         `status` and `error`) of each file, instead of raising an error on the
+         first failed download
         :return: list of files which could not be downloaded
 
         **Examples**
@@ -243,33 +379,63 @@ class StorageKeywords:
         """
         if isinstance(files, str):
             files = files.split(",")
+        if not isinstance(files, dict):
+            files = {filename.strip(): filename.strip() for filename in files}
         bucket = self.get_storage_bucket(bucket_name)
-        notfound = []
-        if isinstance(files, dict):
-            for object_name, filename in files.items():
-                blob = bucket.get_blob(object_name)
-                if blob:
-                    with open(filename, "wb") as f:
-                        blob.download_to_file(f)
-                        self.ctx.logger.info(
-                            "Downloaded object %s from Google to filepath %s",
-                            object_name,
-                            filename,
-                        )
-                else:
-                    notfound.append(object_name)
+        transfers = [
+            partial(
+                self._transfer_storage_file,
+                bucket.blob(object_name).download_to_filename,
+                {"name": object_name, "filename": filename},
+                "downloaded",
+                return_results,
+            )
+            for object_name, filename in files.items()
+        ]
+        results = self._run_storage_transfers(transfers, workers)
+        if return_results:
+            return results
+        return [
+            result["name"] for result in results if result["status"] != "downloaded"
+        ]
+
+    def _transfer_storage_file(
+        self, transfer: Callable, result: Dict, status: str, return_results: bool
+    ) -> Dict:
+        result.update(status="failed", error=None)
+        try:
+            transfer(result["filename"])
+        except Exception as err:  # pylint: disable=broad-except
+            if isinstance(err, exceptions.NotFound) and status == "downloaded":
+                result["status"] = "not found"
+            elif not return_results:
+                raise
+            result["error"] = str(err)
+        else:
+            result["status"] = status
+            self.ctx.logger.info(
+                "%s object %s, filepath %s",
+                status.capitalize(),
+                result["name"],
+                result["filename"],
+            )
+        return result
+
+    def _run_storage_transfers(
+        self, transfers: List[Callable[[], Dict]], workers: Optional[int] = None
+    ) -> List[Dict]:
+        workers = min(max(1, int(workers or self.storage_workers)), len(transfers))
+        if workers <= 1:
+            results = [transfer() for transfer in transfers]
         else:
-            for filename in files:
-                filename = filename.strip()
-                blob = bucket.get_blob(filename)
-                if blob:
-                    with open(filename, "wb") as f:
-                        blob.download_to_file(f)
-                        self.ctx.logger.info(
-                            "Downloaded object %s from Google to filepath %s",
-                            filename,
-                            filename,
-                        )
-                else:
-                    notfound.append(filename)
-        return notfound
+            # The client is thread-safe, so all the workers share the same one.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda transfer: transfer(), transfers))
+        for result in results:
+            if result["status"] == "failed":
+                self.ctx.logger.warning(
+                    "Transfer of object %s failed with error: %s",
+                    result["name"],
+                    result["error"],
+                )
+        return results
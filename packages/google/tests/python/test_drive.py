@@ -0,0 +1,251 @@
+import itertools
+import json
+import logging
+import re
+import threading
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import httplib2
+import pytest
+from googleapiclient.discovery import build
+
+from RPA.Cloud.Google.keywords import drive
+from RPA.Cloud.Google.keywords.drive import DriveKeywords, GoogleDriveError
+
+
+class FakeDriveHttp:
+    """Minimal in-memory Drive API backend for the ``googleapiclient`` requests."""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def request(self, uri, method="GET", body=None, headers=None, **_):
+        return self.backend.handle(uri, method, body, headers or {})
+
+
+class FakeDrive:
+    def __init__(self):
+        self.files = {}
+        self.ids = itertools.count()
+        self.threads = set()
+        self.range_requests = []
+        self.list_queries = []
+        self.lock = threading.Lock()
+
+    def http(self):
+        return FakeDriveHttp(self)
+
+    def add_file(self, name, content=b"", parent="root", mime_type="text/plain"):
+        file_id = f"file-{next(self.ids)}"
+        self.files[file_id] = {
+            "name": name,
+            "content": content,
+            "parents": [parent],
+            "mimeType": mime_type,
+        }
+        return file_id
+
+    def add_folder(self, name, parent="root"):
+        return self.add_file(name, parent=parent, mime_type=drive.DRIVE_FOLDER_MIMETYPE)
+
+    def details(self, file_id):
+        item = self.files[file_id]
+        return {
+            "id": file_id,
+            "name": item["name"],
+            "parents": item["parents"],
+            "mimeType": item["mimeType"],
+        }
+
+    @staticmethod
+    def matches(item, query):
+        conditions = {
+            f"name = '{item['name']}'",
+            f"mimeType = '{item['mimeType']}'",
+        } | {f"'{parent}' in parents" for parent in item["parents"]}
+        return all(
+            condition in conditions
+            for condition in re.split(" and ", query, flags=re.IGNORECASE)
+        )
+
+    @staticmethod
+    def response(content, status=200, **headers):
+        if not isinstance(content, bytes):
+            content = json.dumps(content).encode()
+        return httplib2.Response({"status": status, **headers}), content
+
+    def handle(self, uri, method, body, headers):
+        with self.lock:
+            self.threads.add(threading.get_ident())
+        url = urlparse(uri)
+        params = parse_qs(url.query)
+        path = url.path
+
+        if path.startswith("/upload/drive/v3/files") and method == "POST":
+            metadata = json.loads(body)
+            location = f"https://upload.fake/{metadata['name']}?parent="
+            location += metadata["parents"][0]
+            return self.response({}, location=location)
+        if url.netloc == "upload.fake":
+            content = body.read() if hasattr(body, "read") else body
+            file_id = self.add_file(path.strip("/"), content, params["parent"][0])
+            return self.response({"id": file_id})
+
+        if path == "/drive/v3/files" and method == "POST":
+            metadata = json.loads(body)
+            file_id = self.add_file(
+                metadata["name"],
+                parent=metadata.get("parents", ["root"])[0],
+                mime_type=metadata["mimeType"],
+            )
+            return self.response({"id": file_id})
+        match = re.match(r"^/drive/v3/files/([^/]+)$", path)
+        if match and method == "DELETE":
+            del self.files[match.group(1)]
+            return self.response(b"", 204)
+        if match and method == "PATCH":
+            item = self.files[match.group(1)]
+            item["parents"] = params.get("addParents", item["parents"])
+            return self.response(self.details(match.group(1)))
+        if match and params.get("alt") == ["media"]:
+            content = self.files[match.group(1)]["content"]
+            start, end = map(int, headers["range"][len("bytes=") :].split("-"))
+            with self.lock:
+                self.range_requests.append((match.group(1), start, end))
+            chunk = content[start : end + 1]
+            content_range = f"bytes {start}-{start + len(chunk) - 1}/{len(content)}"
+            return self.response(chunk, 206, **{"content-range": content_range})
+        if match and match.group(1) == "root":
+            return self.response({"id": "root"})
+        if match:
+            return self.response(self.details(match.group(1)))
+        if path == "/drive/v3/files" and method == "GET":
+            query = params.get("q", [""])[0]
+            with self.lock:
+                self.list_queries.append(query)
+            files = [
+                self.details(file_id)
+                for file_id, item in list(self.files.items())
+                if self.matches(item, query)
+            ]
+            return self.response({"files": files})
+        raise AssertionError(f"Unexpected request: {method} {uri}")
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = FakeDrive()
+    monkeypatch.setattr(drive, "build_http", backend.http)
+    monkeypatch.setattr(drive, "DRIVE_CHUNK_SIZE", 1000)
+    return backend
+
+
+@pytest.fixture
+def library(backend, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    lib = DriveKeywords(SimpleNamespace(logger=logging.getLogger(__name__)))
+    lib.drive_service = build(
+        "drive", "v3", http=backend.http(), static_discovery=True
+    )
+    return lib
+
+
+def test_download_drive_files_streams_in_chunks(library, backend, tmp_path):
+    file_id = backend.add_file("report.bin", bytes(range(256)) * 10)
+
+    assert library.download_drive_files(query="name = 'report.bin'") == [
+        "report.bin"
+    ]
+
+    assert (tmp_path / "report.bin").read_bytes() == bytes(range(256)) * 10
+    assert not (tmp_path / "report.bin.part").exists()
+    assert backend.range_requests == [
+        (file_id, 0, 999),
+        (file_id, 1000, 1999),
+        (file_id, 2000, 2999),
+    ]
+
+
+def test_download_drive_files_concurrently(library, backend, tmp_path):
+    for idx in range(10):
+        backend.add_file(f"invoice-{idx}.txt", f"invoice {idx}".encode() * 200)
+
+    files = library.download_drive_files(query="'root' in parents", workers=4)
+
+    assert files == [f"invoice-{idx}.txt" for idx in range(10)]
+    assert (tmp_path / "invoice-7.txt").read_bytes() == b"invoice 7" * 200
+    assert len(backend.threads) > 1
+
+    files = library.download_drive_files(
+        query="'root' in parents", workers=4, limit=3
+    )
+    assert files == ["invoice-0.txt", "invoice-1.txt", "invoice-2.txt"]
+
+
+def test_upload_drive_files(library, backend, tmp_path):
+    paths = []
+    for idx in range(6):
+        path = tmp_path / f"upload-{idx}.txt"
+        path.write_text(f"upload {idx}")
+        paths.append(str(path))
+
+    ids = library.upload_drive_files(paths, workers=3)
+
+    assert len(set(ids)) == 6
+    assert [backend.files[file_id]["name"] for file_id in ids] == [
+        f"upload-{idx}.txt" for idx in range(6)
+    ]
+    assert backend.files[ids[4]]["content"] == b"upload 4"
+    # Already existing files are not uploaded again.
+    assert library.upload_drive_files(paths[:2], workers=2) == ids[:2]
+
+    with pytest.raises(GoogleDriveError):
+        library.upload_drive_files([str(tmp_path / "missing.txt")])
+
+
+def test_folder_path_cache(library, backend):
+    invoices = backend.add_folder("invoices")
+    year = backend.add_folder("2024", parent=invoices)
+    march = backend.add_folder("march", parent=year)
+
+    assert library.get_drive_folder_id("invoices/2024/march") == march
+    assert library.get_drive_folder_id("/invoices/2024/") == year
+    assert library.get_drive_folder_id("march", parent_folder="invoices/2024") == march
+    assert library.get_drive_folder_id("invoices") == invoices
+    queries = len(backend.list_queries)
+    assert queries == 5
+
+    for _ in range(3):
+        assert library.get_drive_folder_id("invoices/2024/march") == march
+        assert library.get_drive_folder_id("invoices") == invoices
+    assert len(backend.list_queries) == queries
+
+    assert library.get_drive_folder_id("invoices/2025") is None
+    library.set_drive_cache_ttl(0)
+    assert library.get_drive_folder_id("invoices") == invoices
+    assert len(backend.list_queries) == queries + 2
+
+
+def test_folder_cache_invalidation(library, backend):
+    backend.add_folder("invoices")
+
+    created = library.create_drive_directory("invoices/2024/march")
+    assert library.get_drive_folder_id("invoices/2024/march") == created["id"]
+    assert library.create_drive_directory("invoices/2024/march") == created
+
+    # Another folder with a cached name makes the name ambiguous.
+    other = library.create_drive_directory("march", parent_folder="invoices")
+    assert other != created
+    assert library.get_drive_folder_id("march") is None
+
+    year = library.get_drive_folder_id("invoices/2024")
+    library.delete_drive_file(file_id=year)
+    assert library.get_drive_folder_id("invoices/2024/march") is None
+
+    file_id = backend.add_file("report.txt")
+    assert library.get_drive_file_by_id(file_id)["parents"] == ["root"]
+    library.move_drive_file(file_id=file_id, target="invoices")
+    assert library.get_drive_file_by_id(file_id)["parents"] == [
+        library.get_drive_folder_id("invoices")
+    ]
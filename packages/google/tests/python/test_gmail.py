@@ -0,0 +1,250 @@
+import base64
+import json
+import logging
+import re
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import httplib2
+import pytest
+from googleapiclient.discovery import build
+
+from RPA.Cloud.Google.keywords import gmail
+from RPA.Cloud.Google.keywords.gmail import GmailKeywords
+
+
+def encode(data):
+    return base64.urlsafe_b64encode(data).decode()
+
+
+class FakeGmailHttp:
+    """Minimal in-memory Gmail API backend, answering single and batch requests."""
+
+    def __init__(self):
+        self.messages = []  # newest first
+        self.history = []
+        self.history_id = 1000
+        self.requests = []
+        self.batches = []
+        self.rate_limited = set()
+
+    def add_message(self, subject, attachment=None):
+        message_id = f"msg-{len(self.messages)}"
+        self.history_id += 1
+        parts = [
+            {
+                "mimeType": "text/plain",
+                "filename": "",
+                "headers": [],
+                "body": {"data": encode(f"Body of {subject}".encode())},
+            }
+        ]
+        if attachment:
+            parts.append(
+                {
+                    "mimeType": "application/pdf",
+                    "filename": "invoice.pdf",
+                    "headers": [
+                        {
+                            "name": "Content-Disposition",
+                            "value": 'attachment; filename="invoice.pdf"',
+                        }
+                    ],
+                    "body": {"attachmentId": f"att-{message_id}", "size": 3},
+                }
+            )
+        self.messages.insert(
+            0,
+            {
+                "id": message_id,
+                "historyId": str(self.history_id),
+                "labelIds": ["INBOX"],
+                "payload": {
+                    "headers": [
+                        {"name": "From", "value": "billing@robocorp.com"},
+                        {"name": "Subject", "value": subject},
+                    ],
+                    "parts": parts,
+                },
+                "attachment": attachment,
+            },
+        )
+        self.history.append((self.history_id, message_id))
+        return message_id
+
+    @staticmethod
+    def response(content, status=200):
+        return httplib2.Response({"status": status}), json.dumps(content).encode()
+
+    def request(self, uri, method="GET", body=None, headers=None, **_):
+        url = urlparse(uri)
+        if url.path == "/batch":
+            return self.batch(body, headers)
+        status, content = self.handle(url.path, parse_qs(url.query))
+        return self.response(content, status)
+
+    def handle(self, path, params):
+        self.requests.append((path, params))
+        if path == "/gmail/v1/users/me/profile":
+            return 200, {"historyId": str(self.history_id)}
+        if path == "/gmail/v1/users/me/history":
+            start = int(params["startHistoryId"][0])
+            if start < 1000:
+                return 404, {"error": {"code": 404, "message": "Not found"}}
+            added = [
+                {"messagesAdded": [{"message": {"id": message_id}}]}
+                for history_id, message_id in self.history
+                if history_id > start
+            ]
+            return 200, {"history": added, "historyId": str(self.history_id)}
+        if path == "/gmail/v1/users/me/messages":
+            query = params.get("q", [""])[0]
+            found = [
+                {"id": message["id"]}
+                for message in self.messages
+                if query in message["payload"]["headers"][1]["value"]
+            ]
+            start = int(params.get("pageToken", ["0"])[0])
+            end = start + int(params.get("maxResults", ["2"])[0])
+            content = {"messages": found[start:end]}
+            if end < len(found):
+                content["nextPageToken"] = str(end)
+            return 200, content
+        match = re.match(r"^/gmail/v1/users/me/messages/([^/]+)$", path)
+        if match:
+            (message,) = [m for m in self.messages if m["id"] == match.group(1)]
+            message = {
+                key: value for key, value in message.items() if key != "attachment"
+            }
+            if params.get("format") == ["metadata"]:
+                message["payload"] = {"headers": message["payload"]["headers"]}
+            return 200, message
+        match = re.match(r"^/gmail/v1/users/me/messages/([^/]+)/attachments/", path)
+        if match:
+            (message,) = [m for m in self.messages if m["id"] == match.group(1)]
+            return 200, {"data": encode(message["attachment"]), "size": 3}
+        raise AssertionError(f"Unexpected request: {path}")
+
+    def batch(self, body, headers):
+        boundary = headers["content-type"].split('boundary="')[1].rstrip('"')
+        requests = []
+        responses = []
+        for part in body.split(f"--{boundary}")[1:-1]:
+            content_id = re.search(r"Content-ID: <(.+)>", part).group(1)
+            uri = re.search(r"\nGET (\S+) HTTP/1.1", part).group(1)
+            url = urlparse(uri)
+            requests.append(url.path)
+            if url.path in self.rate_limited:
+                self.rate_limited.remove(url.path)
+                status, content = 429, {"error": {"code": 429}}
+            else:
+                status, content = self.handle(url.path, parse_qs(url.query))
+            responses.append(
+                f"--batch\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n\r\n"
+                f"{json.dumps(content)}\r\n"
+            )
+        self.batches.append(requests)
+        content = "".join(responses) + "--batch--"
+        response = httplib2.Response(
+            {"status": 200, "content-type": 'multipart/mixed; boundary="batch"'}
+        )
+        return response, content.encode()
+
+
+@pytest.fixture
+def http():
+    return FakeGmailHttp()
+
+
+@pytest.fixture
+def library(http, monkeypatch):
+    monkeypatch.setattr(gmail.time, "sleep", lambda seconds: None)
+    lib = GmailKeywords(SimpleNamespace(logger=logging.getLogger(__name__)))
+    lib.gmail_service = build("gmail", "v1", http=http, static_discovery=True)
+    return lib
+
+
+def test_list_messages_with_batch_requests(library, http, tmp_path, monkeypatch):
+    monkeypatch.setattr(gmail, "GMAIL_BATCH_SIZE", 3)
+    for idx in range(5):
+        http.add_message(f"invoice {idx}", attachment=b"pdf" if idx % 2 else None)
+
+    messages = library.list_messages(
+        "me", "invoice", folder_name=tmp_path, max_results=10
+    )
+
+    assert [message["subject"] for message in messages] == [
+        f"invoice {idx}" for idx in reversed(range(5))
+    ]
+    assert messages[1]["parts"] == [
+        {"text/plain": "Body of invoice 3"},
+        {
+            "attachment": str(tmp_path / "msg-3" / "invoice.pdf"),
+            "id": "att-msg-3",
+        },
+    ]
+    assert (tmp_path / "msg-1" / "invoice.pdf").read_bytes() == b"pdf"
+    # the message list, then the messages and the attachments in batches
+    assert http.requests[0][0] == "/gmail/v1/users/me/messages"
+    assert [len(batch) for batch in http.batches] == [3, 2, 2]
+    assert all("/attachments/" in path for path in http.batches[-1])
+
+
+def test_list_messages_metadata_only(library, http, tmp_path):
+    http.add_message("invoice", attachment=b"pdf")
+    http.rate_limited.add("/gmail/v1/users/me/messages/msg-0")
+
+    (message,) = library.list_messages(
+        "me", "invoice", folder_name=tmp_path, include_body=False
+    )
+
+    assert message == {
+        "id": "msg-0",
+        "label_ids": ["INBOX"],
+        "from": "billing@robocorp.com",
+        "subject": "invoice",
+        "parts": [],
+    }
+    assert not list(tmp_path.iterdir())
+    _, params = http.requests[-1]
+    assert params["format"] == ["metadata"]
+    assert params["metadataHeaders"] == gmail.GMAIL_METADATA_HEADERS
+    # the rate limited request was retried
+    assert len(http.batches) == 2
+
+
+def test_list_messages_incremental(library, http, tmp_path):
+    http.add_message("invoice 0")
+    http.add_message("reminder 1")
+
+    messages = library.list_messages("me", "invoice", tmp_path, incremental=True)
+    assert [message["subject"] for message in messages] == ["invoice 0"]
+    history_id = library.get_gmail_history_id()
+    assert history_id == "1002"
+
+    assert library.list_messages("me", "invoice", tmp_path, incremental=True) == []
+    for idx in range(2, 7):
+        http.add_message(f"invoice {idx}" if idx != 4 else "reminder 4")
+
+    messages = library.list_messages("me", "invoice", tmp_path, incremental=True)
+    assert [message["subject"] for message in messages] == [
+        "invoice 6",
+        "invoice 5",
+        "invoice 3",
+        "invoice 2",
+    ]
+    assert library.get_gmail_history_id() == "1007"
+    assert library.list_messages("me", "invoice", tmp_path, incremental=True) == []
+
+    # continuing from a stored history id, in another library instance
+    other = GmailKeywords(library.ctx)
+    other.gmail_service = library.gmail_service
+    messages = other.list_messages("me", "invoice", tmp_path, history_id=history_id)
+    assert len(messages) == 4
+
+    # an expired history id falls back to listing all the messages
+    messages = other.list_messages("me", "invoice", tmp_path, history_id="900")
+    assert len(messages) == 2  # the default page size of the fake backend
+    assert other.get_gmail_history_id() == "1007"
@@ -0,0 +1,175 @@
+import json
+import logging
+from types import SimpleNamespace
+from urllib.parse import parse_qs, unquote, urlparse
+
+import httplib2
+import pytest
+from googleapiclient.discovery import build
+
+from RPA.Cloud.Google.keywords.sheets import SheetsKeywords
+
+
+SPREADSHEET = "spreadsheet-1"
+SHEET_VALUES = {
+    "Customers": [["Name", "City"], ["Alice", "Oslo"], ["Bob"]],
+    "Orders": [["Id", "", "Total"], [1, "", 10.5], [2, "", 3]],
+}
+
+
+class FakeSheetsHttp:
+    """Records the Sheets API requests, answering with ``SHEET_VALUES``."""
+
+    def __init__(self):
+        self.requests = []
+        self.unavailable = False
+
+    @staticmethod
+    def response(content, status=200):
+        return httplib2.Response({"status": status}), json.dumps(content).encode()
+
+    def request(self, uri, method="GET", body=None, headers=None, **_):
+        url = urlparse(uri)
+        path = unquote(url.path)
+        params = parse_qs(url.query)
+        self.requests.append((method, path.split(":")[-1], params, body))
+
+        if self.unavailable:
+            return self.response({"error": {"code": 503}}, 503)
+        if path.endswith("values:batchUpdate"):
+            data = json.loads(body)["data"]
+            return self.response({"totalUpdatedRanges": len(data)})
+        if path.endswith("values:batchGet"):
+            return self.response(
+                {
+                    "valueRanges": [
+                        {"range": name, "values": SHEET_VALUES[name.split("!")[0]]}
+                        for name in params["ranges"]
+                    ]
+                }
+            )
+        if path.endswith(f"spreadsheets/{SPREADSHEET}:batchUpdate"):
+            return self.response({"spreadsheetId": SPREADSHEET, "replies": [{}]})
+        if path.endswith(f"spreadsheets/{SPREADSHEET}"):
+            sheets = [
+                {
+                    "properties": {
+                        "title": title,
+                        "sheetId": idx,
+                        "gridProperties": {"rowCount": 1000, "columnCount": 26},
+                    }
+                }
+                for idx, title in enumerate(SHEET_VALUES)
+            ]
+            return self.response(
+                {
+                    "spreadsheetId": SPREADSHEET,
+                    "spreadsheetUrl": "https://sheets.fake",
+                    "properties": {"title": "Invoices"},
+                    "sheets": sheets,
+                }
+            )
+        if "/values/" in path:
+            return self.response({"values": []})
+        raise AssertionError(f"Unexpected request: {method} {uri}")
+
+
+@pytest.fixture
+def http():
+    return FakeSheetsHttp()
+
+
+@pytest.fixture
+def library(http):
+    lib = SheetsKeywords(SimpleNamespace(logger=logging.getLogger(__name__)))
+    lib.sheets_service = build("sheets", "v4", http=http, static_discovery=True)
+    return lib
+
+
+def test_queue_sheet_values(library, http):
+    library.set_sheets_write_buffer_size(3)
+    for row in range(1, 5):
+        library.queue_sheet_values(SPREADSHEET, f"A{row}", [[row]], "ROWS")
+    library.queue_sheet_values(SPREADSHEET, "B1", [["=A1"]], value_input_option="RAW")
+
+    # The buffer got full once, the rest is sent before reading the values.
+    assert len(http.requests) == 1
+    library.get_sheet_values(SPREADSHEET, "A1:B6")
+
+    updates = [json.loads(body) for _, _, _, body in http.requests if body]
+    assert [
+        (update["valueInputOption"], [data["range"] for data in update["data"]])
+        for update in updates
+    ] == [
+        ("USER_ENTERED", ["A1", "A2", "A3"]),
+        ("USER_ENTERED", ["A4"]),
+        ("RAW", ["B1"]),
+    ]
+    assert updates[1]["data"][0] == {
+        "range": "A4",
+        "majorDimension": "ROWS",
+        "values": [[4]],
+    }
+    assert library.flush_sheet_values() == []
+
+
+def test_queued_sheet_values_sent_before_sheet_changes(library, http):
+    library.queue_sheet_values(SPREADSHEET, "Orders!A4", [[3]], "ROWS")
+
+    library.rename_sheet(SPREADSHEET, "Orders", "Archived orders")
+    library.queue_sheet_values(SPREADSHEET, "Archived orders!A5", [[4]], "ROWS")
+    library.delete_sheet(SPREADSHEET, "Customers")
+
+    assert [request for _, request, _, _ in http.requests] == [
+        "batchUpdate",  # Orders!A4
+        f"/v4/spreadsheets/{SPREADSHEET}",
+        "batchUpdate",  # rename
+        "batchUpdate",  # Archived orders!A5
+        f"/v4/spreadsheets/{SPREADSHEET}",
+        "batchUpdate",  # delete
+    ]
+    assert "updateSheetProperties" in http.requests[2][3]
+    assert "deleteSheet" in http.requests[5][3]
+
+
+def test_queued_sheet_values_sent_when_suite_ends(library, http, caplog):
+    library.queue_sheet_values(SPREADSHEET, "A1", [[1]])
+    library._end_suite("Suite", {})
+    assert len(http.requests) == 1
+    library._close()
+    assert len(http.requests) == 1
+
+    http.unavailable = True
+    library.queue_sheet_values(SPREADSHEET, "A2", [[2]])
+    library.queue_sheet_values(SPREADSHEET, "A3", [[3]], value_input_option="RAW")
+    with caplog.at_level(logging.WARNING):
+        library._close()
+    assert "2 queued sheet value updates were not sent" in caplog.text
+
+
+def test_batch_get_sheet_values(library, http):
+    ranges = ["Customers!A1:Z1000", "Orders!A1:Z1000"]
+
+    value_ranges = library.batch_get_sheet_values(SPREADSHEET, ranges)
+    assert [value_range["values"] for value_range in value_ranges] == list(
+        SHEET_VALUES.values()
+    )
+
+    customers, orders = library.batch_get_sheet_values(
+        SPREADSHEET, ranges, as_table=True, header=True
+    )
+    assert customers.columns == ["Name", "City"]
+    assert customers.get_row(1, as_list=True) == ["Bob", None]
+    assert orders.get_column("Total", as_list=True) == [10.5, 3]
+    assert len(http.requests) == 2
+
+
+def test_detect_tables_with_one_values_request(library, http):
+    tables = library.detect_tables(SPREADSHEET)
+
+    assert [table["headers"] for table in tables["Customers"]] == [["Name", "City"]]
+    assert [table["headers"] for table in tables["Orders"]] == [["Id"], ["Total"]]
+    assert [request[1] for request in http.requests] == [
+        f"/v4/spreadsheets/{SPREADSHEET}",
+        "batchGet",
+    ]
@@ -0,0 +1,203 @@
+import io
+import json
+import logging
+import re
+import threading
+from types import SimpleNamespace
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pytest
+import requests
+import urllib3
+from google.api_core import exceptions
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import storage
+
+from RPA.Cloud.Google.keywords.storage import StorageKeywords
+
+
+BUCKET = "invoices"
+
+
+class FakeStorageSession:
+    """Minimal in-memory Cloud Storage JSON API backend for ``storage.Client``."""
+
+    is_mtls = False
+
+    def __init__(self):
+        self.objects = {}
+        self.requests = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def response(content=b"", status=200, **headers):
+        if not isinstance(content, bytes):
+            content = json.dumps(content).encode()
+            headers.setdefault("content-type", "application/json")
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.raw = urllib3.HTTPResponse(
+            io.BytesIO(content), headers=headers, status=status, preload_content=False
+        )
+        response.request = requests.Request("GET", "https://storage.fake").prepare()
+        return response
+
+    def request(self, method, url, data=None, headers=None, **_):
+        with self.lock:
+            self.threads.add(threading.get_ident())
+            self.requests.append((method, url))
+        url = urlparse(url)
+        path = unquote(url.path)
+        params = parse_qs(url.query)
+
+        if path == "/batch/storage/v1":
+            return self.batch(data, headers)
+        if path == f"/storage/v1/b/{BUCKET}":
+            return self.response({"name": BUCKET})
+        if path == f"/upload/storage/v1/b/{BUCKET}/o":
+            metadata, content = re.split(rb"\r\n\r\n", data, maxsplit=2)[1:]
+            name = json.loads(metadata.split(b"\r\n")[0])["name"]
+            with self.lock:
+                self.objects[name] = content.rsplit(b"\r\n--", 1)[0]
+            return self.response({"name": name, "bucket": BUCKET})
+        if path.startswith(f"/download/storage/v1/b/{BUCKET}/o/"):
+            name = path.split("/o/", 1)[1]
+            if name not in self.objects:
+                return self.response({"error": {"code": 404}}, 404)
+            return self.response(self.objects[name])
+        if path == f"/storage/v1/b/{BUCKET}/o":
+            return self.list(params)
+        raise AssertionError(f"Unexpected request: {method} {url}")
+
+    def list(self, params):
+        names = sorted(
+            name
+            for name in self.objects
+            if name.startswith(params.get("prefix", [""])[0])
+        )
+        if "pageToken" in params:
+            names = names[names.index(params["pageToken"][0]) :]
+        page_size = int(params["maxResults"][0])
+        content = {"items": [{"name": name} for name in names[:page_size]]}
+        if len(names) > page_size:
+            content["nextPageToken"] = names[page_size]
+        return self.response(content)
+
+    def batch(self, data, headers):
+        content_type = requests.structures.CaseInsensitiveDict(headers)["content-type"]
+        boundary = content_type.split('boundary="')[1].rstrip('"')
+        parts = data.split(f"--{boundary}")[1:-1]
+        responses = []
+        for idx, part in enumerate(parts):
+            method, uri = re.search(r"\n(\w+) (\S+) HTTP/1.1", part).groups()
+            assert method == "DELETE"
+            name = unquote(urlparse(uri).path).split("/o/", 1)[1]
+            status = "204 No Content"
+            if name == "locked.txt":
+                status = "403 Forbidden"
+            elif self.objects.pop(name, None) is None:
+                status = "404 Not Found"
+            responses.append(
+                f"--batch\nContent-Type: application/http\n"
+                f"Content-ID: <response-{idx}>\n\nHTTP/1.1 {status}\n"
+                "Content-Type: application/json\n\n{}\n"
+            )
+        content = "".join(responses) + "--batch--\n"
+        return self.response(
+            content.encode(), **{"content-type": 'multipart/mixed; boundary="batch"'}
+        )
+
+
+@pytest.fixture
+def session():
+    return FakeStorageSession()
+
+
+@pytest.fixture
+def library(session, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    lib = StorageKeywords(SimpleNamespace(logger=logging.getLogger(__name__)))
+    lib.storage_service = storage.Client(
+        project="rpa", credentials=AnonymousCredentials(), _http=session
+    )
+    return lib
+
+
+def test_upload_and_download_storage_files(library, session, tmp_path):
+    files = {}
+    for idx in range(10):
+        path = tmp_path / f"invoice-{idx}.txt"
+        path.write_text(f"invoice {idx}")
+        files[f"2024/invoice-{idx}.txt"] = str(path)
+
+    assert library.upload_storage_files(BUCKET, files, workers=4) is None
+    assert session.objects["2024/invoice-3.txt"] == b"invoice 3"
+    assert len(session.threads) > 1
+
+    targets = {name: str(tmp_path / f"copy-{idx}") for idx, name in enumerate(files)}
+    targets["missing.txt"] = str(tmp_path / "missing")
+    assert library.download_storage_files(BUCKET, targets) == ["missing.txt"]
+    assert (tmp_path / "copy-7").read_text() == "invoice 7"
+    assert not (tmp_path / "missing").exists()
+
+    (tmp_path / "2024").mkdir()
+    results = library.download_storage_files(
+        BUCKET, "2024/invoice-1.txt, missing.txt", workers=1, return_results=True
+    )
+    assert [(result["name"], result["status"]) for result in results] == [
+        ("2024/invoice-1.txt", "downloaded"),
+        ("missing.txt", "not found"),
+    ]
+    assert (tmp_path / "2024" / "invoice-1.txt").read_text() == "invoice 1"
+
+
+def test_upload_storage_files_results(library, tmp_path):
+    path = tmp_path / "invoice.txt"
+    path.write_text("invoice")
+    files = {"invoice.txt": str(path), "missing.txt": str(tmp_path / "missing")}
+
+    with pytest.raises(FileNotFoundError):
+        library.upload_storage_files(BUCKET, files)
+
+    results = library.upload_storage_files(BUCKET, files, return_results=True)
+    assert [result["status"] for result in results] == ["uploaded", "failed"]
+    assert "No such file" in results[1]["error"]
+
+
+def test_delete_storage_files_in_batches(library, session):
+    session.objects = {f"file-{idx}": b"" for idx in range(250)}
+    session.objects["locked.txt"] = b""
+
+    files = [f"file-{idx}" for idx in range(0, 250, 2)] + ["missing"]
+    assert library.delete_storage_files(BUCKET, files) == ["missing"]
+    assert len(session.objects) == 126
+    batches = [url for method, url in session.requests if "/batch/" in url]
+    assert len(batches) == 2
+
+    assert library.delete_storage_files(BUCKET, "file-1, file-3") is True
+    results = library.delete_storage_files(
+        BUCKET, ["file-5", "locked.txt"], return_results=True
+    )
+    assert [result["status"] for result in results] == ["deleted", "failed"]
+    with pytest.raises(exceptions.Forbidden):
+        library.delete_storage_files(BUCKET, ["locked.txt"])
+
+
+def test_iterate_storage_files(library, session):
+    session.objects = {f"2024/{idx:04}.pdf": b"" for idx in range(25)}
+    session.objects["2023/old.pdf"] = b""
+
+    files = library.iterate_storage_files(BUCKET, prefix="2024/", page_size=10)
+    assert not session.requests  # nothing is listed before iterating
+    assert next(files) == {
+        "name": "2024/0000.pdf",
+        "uri": "gs://invoices/2024/0000.pdf",
+    }
+    assert len(session.requests) == 1
+    assert len(list(files)) == 24
+    assert len(session.requests) == 3
+
+    files = library.list_storage_files(BUCKET)
+    assert [item["name"] for item in files][:2] == ["2023/old.pdf", "2024/0000.pdf"]
@@ -1,12 +1,23 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from fnmatch import fnmatch
+import itertools
 import logging
 import os
 import os.path
 from pathlib import Path
 import tarfile
-from typing import Union, List
+import threading
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 import zipfile
+import zlib
+
+
+# Members bigger than this are compressed by the writer itself, in a streaming
+# fashion, instead of being held in memory by a compression worker.
+PARALLEL_COMPRESSION_MAX_SIZE = 64 * 1024 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
 
 
 def convert_date(timestamp):
@@ -25,8 +36,9 @@ def convert_date(timestamp):
     return formatted_date
 
 
-def list_files_in_directory(folder, recursive=False, include=None, exclude=None):
-    filelist = []
+def iter_files_in_directory(
+    folder, recursive=False, include=None, exclude=None
+) -> Iterator[Tuple[str, str]]:
     for rootdir, _, files in os.walk(folder):
         for file in files:
             archive_absolute = os.path.join(rootdir, file)
@@ -36,10 +48,79 @@ def list_files_in_directory(folder, recursive=False, include=None, exclude=None)
                 continue
             if exclude and fnmatch(archive_relative, exclude):
                 continue
-            filelist.append((archive_absolute, archive_relative))
+            yield archive_absolute, archive_relative
         if not recursive:
             break
-    return filelist
+
+
+def list_files_in_directory(folder, recursive=False, include=None, exclude=None):
+    return list(iter_files_in_directory(folder, recursive, include, exclude))
+
+
+def compress_file(path: str, compress_type: int) -> Tuple[int, int, bytes]:
+    """Compress a file for a ZIP member, returns its CRC, size and compressed data."""
+    # pylint: disable=protected-access
+    compressor = zipfile._get_compressor(compress_type)
+    crc, size, chunks = 0, 0, []
+    with open(path, "rb") as infile:
+        while True:
+            data = infile.read(READ_CHUNK_SIZE)
+            if not data:
+                break
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+            chunks.append(compressor.compress(data) if compressor else data)
+    if compressor:
+        chunks.append(compressor.flush())
+    return crc, size, b"".join(chunks)
+
+
+def can_write_compressed_members(archive: zipfile.ZipFile) -> bool:
+    """Tells if the private `zipfile` internals used by `compress_file` and
+    `write_compressed_member` are available in this Python version.
+    """
+    return hasattr(zipfile, "_get_compressor") and all(
+        hasattr(archive, name) for name in ("_writecheck", "_didModify", "start_dir")
+    )
+
+
+def write_compressed_member(
+    archive: zipfile.ZipFile, zinfo: zipfile.ZipInfo, compressed: Tuple
+) -> None:
+    """Write an already compressed member (as returned by `compress_file`) into
+    an archive opened for writing.
+    """
+    # pylint: disable=protected-access
+    zinfo.CRC, zinfo.file_size, data = compressed
+    zinfo.compress_size = len(data)
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+    archive._writecheck(zinfo)
+    archive._didModify = True
+    zinfo.header_offset = archive.fp.tell()
+    archive.fp.write(zinfo.FileHeader(zip64))
+    archive.fp.write(data)
+    archive.start_dir = archive.fp.tell()
+    archive.filelist.append(zinfo)
+    archive.NameToInfo[zinfo.filename] = zinfo
+
+
+def file_crc(path: Union[str, Path]) -> int:
+    crc = 0
+    with open(path, "rb") as infile:
+        while True:
+            data = infile.read(READ_CHUNK_SIZE)
+            if not data:
+                break
+            crc = zlib.crc32(data, crc)
+    return crc
+
+
+def extraction_target(root: Path, name: str) -> Optional[Path]:
+    """Local path of an archive member, `None` if it would land outside `root`."""
+    target = (root / name).resolve()
+    if not target.is_relative_to(root.resolve()):
+        return None
+    return target
 
 
 class Archive:
@@ -83,21 +164,23 @@ class Archive:
     def archive_folder_with_zip(
         self,
         folder: str,
-        archive_name: str,
+        archive_name: Union[str, BinaryIO],
         recursive: bool = False,
         include: str = None,
         exclude: str = None,
         compression: str = "stored",
+        workers: int = 1,
     ) -> None:
         # pylint: disable=C0301
         """Create a zip archive of a folder
 
         :param folder: name of the folder to archive
-        :param archive_name: filename of the archive
+        :param archive_name: filename of the archive, or a writable binary file object (like a pipe) to stream the archive into
         :param recursive: should sub directories be included, default is False
         :param include: define file pattern to include in the package, default is None which means all files are included
         :param exclude: define file pattern to exclude from the package, default is None
         :param compression: type of package compression method, default is "stored"
+        :param workers: number of threads compressing the files in parallel, default is 1 (no parallelism)
         :return: None
 
         This keyword creates an ZIP archive of a local folder. By default subdirectories are not
@@ -106,6 +189,11 @@ class Archive:
         To include only certain files, like TXT files, the argument `include` can be used.
         Similarly to exclude certain files, like dotfiles, the argument `exclude` can be used.
 
+        The folder is walked while the archive is being written, so members are streamed
+        into the output as soon as they are found. With `workers` greater than 1 the files
+        are compressed in a thread pool and still written in the order they were found,
+        which speeds up the `deflated`, `bzip2` and `lzma` methods on multi-core machines.
+
         Compression methods:
 
         - stored, default
@@ -123,10 +211,12 @@ class Archive:
             Archive Folder With Zip  ${CURDIR}${/}documents  documents.zip    recursive=True
             Archive Folder With Zip  ${CURDIR}               packagelzma.zip  compression=lzma
             Archive Folder With Zip  ${CURDIR}               bzipped.zip      compression=bzip2
+            Archive Folder With Zip  ${CURDIR}${/}documents  documents.zip    compression=deflated  workers=8
 
 
         .. code-block:: python
 
+            import sys
             from RPA.Archive import Archive
 
             lib = Archive()
@@ -136,6 +226,7 @@ class Archive:
             lib.archive_folder_with_zip('./documents', 'documents.zip', recursive=True)
             lib.archive_folder_with_zip('./', 'packagelzma.zip', compression='lzma')
             lib.archive_folder_with_zip('./', 'bzipped.zip', compression='bzip2')
+            lib.archive_folder_with_zip('./documents', sys.stdout.buffer, compression='deflated', workers=8)
         """  # noqa: E501
 
         if compression == "stored":
@@ -149,17 +240,68 @@ class Archive:
         else:
             raise ValueError("Unknown compression method")
 
-        filelist = list_files_in_directory(folder, recursive, include, exclude)
-        if len(filelist) == 0:
+        files = iter_files_in_directory(folder, recursive, include, exclude)
+        target = archive_name if isinstance(archive_name, (str, os.PathLike)) else None
+        if target is not None:
+            # The archive being written can be found while walking the folder.
+            target = os.path.realpath(target)
+            files = (item for item in files if os.path.realpath(item[0]) != target)
+        first = next(files, None)
+        if first is None:
             raise ValueError("No files found to archive")
+        files = itertools.chain([first], files)
 
         with zipfile.ZipFile(
             file=archive_name,
             mode="w",
             compression=comp_method,
         ) as archive:
-            for archive_absolute, archive_relative in filelist:
+            workers = int(workers)
+            if workers > 1 and not can_write_compressed_members(archive):
+                self.logger.warning(
+                    "Parallel compression isn't supported by this Python version, "
+                    "compressing the files one by one"
+                )
+                workers = 1
+            if workers > 1:
+                self._write_zip_in_parallel(archive, files, workers)
+            else:
+                for archive_absolute, archive_relative in files:
+                    archive.write(archive_absolute, arcname=archive_relative)
+
+    def _write_zip_in_parallel(
+        self,
+        archive: zipfile.ZipFile,
+        files: Iterator[Tuple[str, str]],
+        workers: int,
+    ) -> None:
+        # Members are compressed by the pool while the results are written in
+        # order, keeping at most two compressed members per worker in memory.
+        pending = deque()
+
+        def write_next():
+            archive_absolute, archive_relative, zinfo, future = pending.popleft()
+            if future is None:
                 archive.write(archive_absolute, arcname=archive_relative)
+            else:
+                write_compressed_member(archive, zinfo, future.result())
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for archive_absolute, archive_relative in files:
+                zinfo = zipfile.ZipInfo.from_file(
+                    archive_absolute, arcname=archive_relative
+                )
+                zinfo.compress_type = archive.compression
+                future = None
+                if zinfo.file_size <= PARALLEL_COMPRESSION_MAX_SIZE:
+                    future = executor.submit(
+                        compress_file, archive_absolute, archive.compression
+                    )
+                pending.append((archive_absolute, archive_relative, zinfo, future))
+                if len(pending) >= workers * 2:
+                    write_next()
+            while pending:
+                write_next()
 
     def archive_folder_with_tar(
         self,
@@ -275,32 +417,46 @@ class Archive:
                 Log  ${file}[mtime]
             END
         """
-        filelist = []
+        return list(self.iterate_archive(archive_name))
+
+    def iterate_archive(self, archive_name: str) -> Iterator[Dict]:
+        """Iterate over the files in an archive
+
+        :param archive_name: filename of the archive
+        :return: generator yielding a dictionary per file, with the same keys as
+            the ones returned by `List Archive`
+
+        Works like `List Archive`, but the file entries are produced one at a time,
+        which keeps the memory usage low for archives with a very large number of
+        files. TAR members are read lazily from the archive as well.
+
+        Example:
+
+        .. code-block:: python
+
+            from RPA.Archive import Archive
+
+            lib = Archive()
+            total = sum(file["size"] for file in lib.iterate_archive("huge.zip"))
+        """
         if zipfile.is_zipfile(archive_name):
             with zipfile.ZipFile(archive_name, "r") as f:
-                members = f.infolist()
-                for memb in members:
-                    filelist.append(
-                        {
-                            "filename": memb.filename,
-                            "size": memb.file_size,
-                            "mtime": memb.date_time,
-                            "modified": convert_date(memb.date_time),
-                        }
-                    )
+                for memb in f.infolist():
+                    yield {
+                        "filename": memb.filename,
+                        "size": memb.file_size,
+                        "mtime": memb.date_time,
+                        "modified": convert_date(memb.date_time),
+                    }
         elif tarfile.is_tarfile(archive_name):
-            with tarfile.TarFile(archive_name, "r") as f:
-                members = f.getmembers()
-                for memb in members:
-                    filelist.append(
-                        {
-                            "name": memb.name,
-                            "size": memb.size,
-                            "mtime": memb.mtime,
-                            "modified": convert_date(memb.mtime),
-                        }
-                    )
-        return filelist
+            with tarfile.open(archive_name, "r") as f:
+                for memb in f:
+                    yield {
+                        "name": memb.name,
+                        "size": memb.size,
+                        "mtime": memb.mtime,
+                        "modified": convert_date(memb.mtime),
+                    }
 
     def get_archive_info(self, archive_name: str) -> dict:
         """Get information about the archive
@@ -345,7 +501,13 @@ class Archive:
         return archive_info
 
     def extract_archive(
-        self, archive_name: str, path: str = None, members: Union[List, str] = None
+        self,
+        archive_name: str,
+        path: str = None,
+        members: Union[List, str] = None,
+        pattern: str = None,
+        workers: int = 1,
+        skip_existing: bool = False,
     ) -> None:
         """Extract files from archive into local directory
 
@@ -353,6 +515,12 @@ class Archive:
         :param path: filepath to extract file into, default is current working directory
         :param members: list of files to extract from archive, by default
             all files in archive are extracted
+        :param pattern: extract only the files matching this file pattern,
+            default is None which means all files are extracted
+        :param workers: number of threads decompressing ZIP members in parallel,
+            default is 1 (no parallelism)
+        :param skip_existing: skip the files already present in the target
+            directory with identical content, default is False
         :return: None
 
         This keyword supports extracting files from zip, tar and tar.gz archives.
@@ -360,6 +528,10 @@ class Archive:
         By default file is extracted into current working directory, but `path` argument
         can be set to define extraction path.
 
+        With `skip_existing` the ZIP members having the same size and CRC as the
+        existing local file aren't extracted again. For TAR archives, which don't
+        carry checksums, the size and modification time are compared instead.
+
         Example:
 
         .. code-block:: robotframework
@@ -367,24 +539,138 @@ class Archive:
             Extract Archive    myfiles.zip   ${CURDIR}${/}extracted
             @{files}           Create List   filename1.txt    filename2.txt
             Extract Archive    archive.tar   C:${/}myfiles${/}  ${files}
+            Extract Archive    invoices.zip  extracted  pattern=*.pdf  workers=8
+            Extract Archive    invoices.zip  extracted  skip_existing=True
         """  # noqa: E501
         root = Path(path) if path else Path.cwd()
         if members and not isinstance(members, list):
             members = [members]
+        workers = int(workers)
+        selective = pattern or skip_existing or workers > 1
         if zipfile.is_zipfile(archive_name):
             with zipfile.ZipFile(archive_name, "r") as f:
-                if members:
+                if selective:
+                    self._extract_zip_members(
+                        f, root, members, pattern, workers, skip_existing
+                    )
+                elif members:
                     f.extractall(path=root, members=members)
                 else:
                     f.extractall(path=root)
         elif tarfile.is_tarfile(archive_name):
-            members = map(tarfile.TarInfo, members) if members else None
             with tarfile.open(archive_name, "r") as f:
-                if members:
-                    f.extractall(path=root, members=members)
+                if selective:
+                    self._extract_tar_members(f, root, members, pattern, skip_existing)
+                elif members:
+                    f.extractall(path=root, members=map(tarfile.TarInfo, members))
                 else:
                     f.extractall(path=root)
 
+    def _extract_zip_members(
+        self,
+        archive: zipfile.ZipFile,
+        root: Path,
+        members: Optional[List],
+        pattern: Optional[str],
+        workers: int,
+        skip_existing: bool,
+    ) -> None:
+        if members:
+            infos = [archive.getinfo(name) for name in members]
+        else:
+            infos = archive.infolist()
+        if pattern:
+            infos = [info for info in infos if fnmatch(info.filename, pattern)]
+        if skip_existing:
+            selected = [
+                info
+                for info in infos
+                if info.is_dir() or not self._is_same_zip_member(root, info)
+            ]
+            self.logger.info(
+                "Skipped %d up-to-date file(s)", len(infos) - len(selected)
+            )
+            infos = selected
+
+        if workers <= 1:
+            for info in infos:
+                archive.extract(info, root)
+            return
+
+        # Every worker reads through its own handle of the archive, so seeking and
+        # decompressing the members doesn't get serialized on a shared file object.
+        local = threading.local()
+        handles = []
+        lock = threading.Lock()
+
+        def extract(info):
+            handle = getattr(local, "archive", None)
+            if handle is None:
+                # Closed once all the members are extracted, see below.
+                # pylint: disable=consider-using-with
+                handle = local.archive = zipfile.ZipFile(archive.filename, "r")
+                with lock:
+                    handles.append(handle)
+            try:
+                handle.extract(info, root)
+            except FileExistsError:
+                # Another worker created the same parent directory meanwhile.
+                handle.extract(info, root)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(extract, infos):
+                    pass
+        finally:
+            for handle in handles:
+                handle.close()
+
+    @staticmethod
+    def _is_same_zip_member(root: Path, info: zipfile.ZipInfo) -> bool:
+        target = extraction_target(root, info.filename)
+        if target is None or not target.is_file():
+            return False
+        if target.stat().st_size != info.file_size:
+            return False
+        return file_crc(target) == info.CRC
+
+    def _extract_tar_members(
+        self,
+        archive: tarfile.TarFile,
+        root: Path,
+        members: Optional[List],
+        pattern: Optional[str],
+        skip_existing: bool,
+    ) -> None:
+        names = set(members) if members else None
+        skipped = 0
+
+        def selected():
+            nonlocal skipped
+            for info in archive:
+                if names is not None and info.name not in names:
+                    continue
+                if pattern and not fnmatch(info.name, pattern):
+                    continue
+                if skip_existing and self._is_same_tar_member(root, info):
+                    skipped += 1
+                    continue
+                yield info
+
+        archive.extractall(path=root, members=selected())
+        if skip_existing:
+            self.logger.info("Skipped %d up-to-date file(s)", skipped)
+
+    @staticmethod
+    def _is_same_tar_member(root: Path, info: tarfile.TarInfo) -> bool:
+        if not info.isfile():
+            return False
+        target = extraction_target(root, info.name)
+        if target is None or not target.is_file():
+            return False
+        stat = target.stat()
+        return stat.st_size == info.size and int(stat.st_mtime) == int(info.mtime)
+
     def extract_file_from_archive(
         self, filename: str, archive_name: str, path: str = None
     ) -> None:  # pylint: disable=C0301
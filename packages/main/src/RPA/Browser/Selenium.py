@@ -2,26 +2,33 @@
 import atexit
 import base64
 import datetime
+import json
 import logging
 import os
 import platform
 import re
 import shutil
 import subprocess
+import threading
 import time
 import traceback
 import urllib.parse
 import webbrowser
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from itertools import product
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 from selenium import webdriver as selenium_webdriver
 from selenium.common import WebDriverException
-from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    JavascriptException,
+    TimeoutException,
+)
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
@@ -32,6 +39,7 @@ from selenium.webdriver.common.options import ArgOptions
 from selenium.webdriver.common.virtual_authenticator import VirtualAuthenticatorOptions
 from selenium.webdriver.remote.shadowroot import ShadowRoot
 from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
 from selenium.webdriver.support.relative_locator import locate_with
 from selenium.webdriver.support.ui import WebDriverWait
 from SeleniumLibrary import EMBED, SeleniumLibrary, WebElement
@@ -43,15 +51,23 @@ from SeleniumLibrary.keywords import (
     ScreenshotKeywords,
     WindowKeywords as _WindowKeywords,
 )
-from SeleniumLibrary.keywords.webdrivertools import SeleniumOptions, WebDriverCreator
+from SeleniumLibrary.keywords.webdrivertools import (
+    SeleniumOptions,
+    WebDriverCache,
+    WebDriverCreator,
+)
 from SeleniumLibrary.locators import ElementFinder
 
 from RPA.Browser.common import AUTO, auto_headless
 from RPA.core import notebook
-from RPA.core import webdriver as core_webdriver
+from RPA.core.helpers import LazyModule
 from RPA.core.locators import BrowserLocator, LocatorsDatabase
 from RPA.Robocorp.utils import get_output_dir
 
+# The webdriver management (and its HTTP stack) is needed only when starting a
+#  browser.
+core_webdriver = LazyModule("RPA.core.webdriver")
+
 
 Element = Union[WebElement, ShadowRoot]
 Locator = Union[Element, str]
@@ -188,6 +204,185 @@ class WindowKeywords(_WindowKeywords):
         super().maximize_browser_window(*args, **kwargs)
 
 
+class BrowserPool:
+    """Keeps a fixed number of webdrivers launched in the background with the same
+    configuration, handing them out on demand and taking them back when closed.
+
+    ``launch`` starts a new (unregistered) webdriver, ``reset`` cleans the state of
+    a returned one and ``key`` identifies the configuration the instances were
+    started with. An instance is retired after serving ``max_uses`` sessions or if
+    its reset fails, and a fresh one is launched in its place.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        launch: Callable[[], Any],
+        reset: Callable[[Any], None],
+        size: int = 2,
+        max_uses: int = 20,
+    ):
+        if size < 1:
+            raise ValueError("The browser pool size should be at least 1")
+
+        self.key = key
+        self.size = size
+        self.max_uses = max_uses
+        self.logger = logging.getLogger(__name__)
+
+        self._launch = launch
+        self._reset = reset
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="BrowserPool"
+        )
+        self._closed = False
+        self._idle: Deque[Any] = deque()
+        self._leased: Dict[int, Any] = {}
+        self._launching = 0
+        # Startup duration and served sessions count per (alive) driver.
+        self._startup: Dict[int, float] = {}
+        self._uses: Dict[int, int] = {}
+        self._stats = dict.fromkeys(
+            ["hits", "misses", "recycled", "retired", "failures"], 0
+        )
+        self._saved = 0.0
+
+        self._fill()
+
+    def _fill(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - len(self._idle) - len(self._leased) - self._launching
+            self._launching += missing
+        for _ in range(missing):
+            self._executor.submit(self._launch_one)
+
+    def _launch_one(self) -> None:
+        start = time.perf_counter()
+        try:
+            driver = self._launch()
+        except Exception as exc:  # pylint: disable=broad-except
+            self.logger.warning("Couldn't launch pooled browser: %s", exc)
+            with self._lock:
+                self._launching -= 1
+                self._stats["failures"] += 1
+            return
+
+        duration = time.perf_counter() - start
+        self.logger.debug("Launched pooled browser in %.2fs", duration)
+        with self._lock:
+            self._launching -= 1
+            closed = self._closed
+            if not closed:
+                self._startup[id(driver)] = duration
+                self._uses[id(driver)] = 0
+                self._idle.append(driver)
+        if closed:
+            self._quit(driver)
+
+    def acquire(self) -> Optional[Any]:
+        """Hand out an idle webdriver, or `None` if none is ready yet."""
+        with self._lock:
+            if self._closed or not self._idle:
+                self._stats["misses"] += 1
+                return None
+
+            driver = self._idle.popleft()
+            self._leased[id(driver)] = driver
+            self._stats["hits"] += 1
+            self._saved += self._startup[id(driver)]
+            return driver
+
+    def release(self, driver: Any) -> bool:
+        """Take back a handed out webdriver, returns `False` if it isn't a pooled
+        one.
+        """
+        with self._lock:
+            if self._leased.pop(id(driver), None) is None:
+                return False
+            self._uses[id(driver)] += 1
+            retire = self._closed or self._uses[id(driver)] >= self.max_uses > 0
+
+        if not retire:
+            try:
+                self._reset(driver)
+            except Exception as exc:  # pylint: disable=broad-except
+                self.logger.warning("Couldn't reset pooled browser: %s", exc)
+                retire = True
+
+        with self._lock:
+            if retire or self._closed:
+                self._startup.pop(id(driver))
+                self._uses.pop(id(driver))
+                self._stats["retired"] += 1
+            else:
+                self._idle.append(driver)
+                self._stats["recycled"] += 1
+                return True
+
+        self._quit(driver)
+        self._fill()
+        return True
+
+    def close(self) -> None:
+        """Stop launching and quit the idle instances, the handed out ones are quit
+        once released.
+        """
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        self._executor.shutdown(wait=False)
+        for driver in idle:
+            self._quit(driver)
+
+    def _quit(self, driver: Any) -> None:
+        try:
+            driver.quit()
+        except Exception as exc:  # pylint: disable=broad-except
+            self.logger.warning("Encountered error while quitting browser: %s", exc)
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(
+                self._stats,
+                size=self.size,
+                idle=len(self._idle),
+                in_use=len(self._leased),
+                launching=self._launching,
+            )
+            startups = list(self._startup.values())
+            saved = self._saved
+
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / requests if requests else 0.0
+        stats["startup_time_saved"] = round(saved, 3)
+        stats["average_startup_time"] = (
+            round(sum(startups) / len(startups), 3) if startups else None
+        )
+        return stats
+
+
+class PooledWebDriverCache(WebDriverCache):
+    """Webdriver cache giving the pooled browsers back instead of quitting them."""
+
+    def __init__(self):
+        super().__init__()
+        self.pool: Optional[BrowserPool] = None
+
+    def _quit(self, driver, error):
+        if self.pool:
+            raw_driver = driver
+            if isinstance(driver, EventFiringWebDriver):
+                raw_driver = driver.wrapped_driver
+            if self.pool.release(raw_driver):
+                return error
+        return super()._quit(driver, error)
+
+
 class Selenium(SeleniumLibrary):
     # NOTE(cmin764): The docstring below will be appended (and not overridding) the
     #  docstring of the super-class.
@@ -236,6 +431,103 @@ class Selenium(SeleniumLibrary):
     # Both driver and browser lower-case names.
     CHROMIUM_BROWSERS = ["chrome", "edge", "chromiumedge", "msedge", "ie"]
 
+    # Collects the status of all the passed elements within one round trip.
+    ELEMENT_STATUS_SCRIPT = """
+        var names = arguments[0];
+        var elements = Array.prototype.slice.call(arguments, 1);
+        return elements.map(function (el) {
+            var visible;
+            if (typeof el.checkVisibility === "function") {
+                visible = el.checkVisibility(
+                    {opacityProperty: true, visibilityProperty: true}
+                );
+            } else {
+                var style = window.getComputedStyle(el);
+                visible = style.visibility !== "hidden" && style.display !== "none"
+                    && style.opacity !== "0" && el.getClientRects().length > 0;
+            }
+            // Like `Is Element Enabled`, only form elements are enabled or
+            //  disabled, and read-only ones count as disabled. WebDriver reports
+            //  a bare `readonly` attribute as "true".
+            var formElement = /^(input|select|textarea|button|option)$/i.test(
+                el.tagName
+            );
+            var readonly = el.getAttribute("readonly");
+            readonly = readonly === "" || readonly === "readonly"
+                || readonly === "true";
+            var enabled = formElement && !el.matches(":disabled") && !readonly;
+            var rect = el.getBoundingClientRect();
+            var attributes = {};
+            names.forEach(function (name) {
+                attributes[name] = el.getAttribute(name);
+            });
+            return {
+                visible: visible,
+                enabled: enabled,
+                disabled: formElement && !enabled,
+                focused: document.activeElement === el,
+                text: el.innerText !== undefined ? el.innerText : el.textContent,
+                rect: {
+                    x: rect.x, y: rect.y, width: rect.width, height: rect.height
+                },
+                attributes: attributes
+            };
+        });
+    """
+
+    # Installs (once per page) an observer buffering the completed resource loads,
+    # then returns the entries after the `since` cursor, waiting up to `wait` ms
+    # for new ones when there are none yet.
+    NETWORK_OBSERVER_SCRIPT = """
+        var page = arguments[0], since = arguments[1], wait = arguments[2];
+        var done = arguments[arguments.length - 1];
+        var state = window.__rpaNetworkObserver;
+        if (!state) {
+            state = window.__rpaNetworkObserver = {
+                page: String(Date.now()) + Math.random(), entries: [], waiters: []
+            };
+            new PerformanceObserver(function (list) {
+                list.getEntries().forEach(function (entry) {
+                    state.entries.push({
+                        url: entry.name,
+                        initiator_type: entry.initiatorType,
+                        start_time: entry.startTime,
+                        duration: entry.duration,
+                        response_end: entry.responseEnd,
+                        transfer_size: entry.transferSize,
+                        response_status: entry.responseStatus
+                    });
+                });
+                var waiters = state.waiters;
+                state.waiters = [];
+                waiters.forEach(function (waiter) { waiter(); });
+            }).observe({type: "resource", buffered: true});
+        }
+        if (page !== state.page) {
+            since = 0;  // first call or the page got reloaded meanwhile
+        }
+        function flush() {
+            done({
+                page: state.page,
+                next: state.entries.length,
+                entries: state.entries.slice(since)
+            });
+        }
+        if (state.entries.length > since || wait <= 0) {
+            flush();
+            return;
+        }
+        var waiter = function () {
+            clearTimeout(timer);
+            flush();
+        };
+        var timer = setTimeout(function () {
+            state.waiters = state.waiters.filter(function (w) { return w !== waiter; });
+            flush();
+        }, wait);
+        state.waiters.push(waiter);
+    """
+
     def __init__(self, *args, **kwargs):
         # We need to pop our kwargs before passing kwargs to SeleniumLibrary
         self.auto_close = kwargs.pop("auto_close", True)
@@ -256,6 +548,8 @@ class Selenium(SeleniumLibrary):
 
         super().__init__(*args, **kwargs)
         self._element_finder = RobocorpElementFinder(self)
+        self._drivers = PooledWebDriverCache()
+        self._browser_pool: Optional[BrowserPool] = None
 
         # Add inherit/overridden library keywords.
         self.browser_management = BrowserManagementKeywords(self)
@@ -286,6 +580,8 @@ class Selenium(SeleniumLibrary):
         """
 
         def stop_drivers():
+            if self._browser_pool:
+                self._browser_pool.close()
             if self.auto_close:
                 self._quit_all_drivers()
             elif platform.system() == "Windows":
@@ -503,6 +799,13 @@ class Selenium(SeleniumLibrary):
 
         Chromium-based browsers can additionally connect through a ``proxy``, which
         should be given as either a local or remote address.
+
+        == Browser pool ==
+
+        When opening and closing browsers many times during a run, the startup time
+        can be saved by pre-launching them with `Start Browser Pool`. Then a warm
+        browser is taken from the pool whenever this keyword is called with the same
+        arguments the pool was started with.
         """  # noqa: E501
         # pylint: disable=redefined-argument-from-local
         browsers = self._arg_browser_selection(browser_selection)
@@ -514,6 +817,24 @@ class Selenium(SeleniumLibrary):
         current_browser = None
         self.headless: bool = headless  # it's resolved through the decorator
 
+        if self._browser_pool and not (use_profile or profile_path or port):
+            index_or_alias = self._open_pooled_browser(
+                alias,
+                browser_selection=browsers,
+                headless=headless,
+                maximized=maximized,
+                preferences=preferences,
+                proxy=proxy,
+                user_agent=user_agent,
+                download=downloads,
+                options=options,
+                sandbox=sandbox,
+            )
+            if index_or_alias is not None:
+                if url is not None:
+                    self.go_to(url)
+                return index_or_alias
+
         # Try all browsers in preferred order
         for browser, download in product(browsers, downloads):
             if current_browser != browser:
@@ -593,6 +914,191 @@ class Selenium(SeleniumLibrary):
 
     open_available_browser.__doc__ %= ", ".join(SUPPORTED_BROWSERS.values())
 
+    @keyword
+    @auto_headless
+    def start_browser_pool(
+        self,
+        size: int = 2,
+        browser_selection: Any = AUTO,
+        headless: Union[bool, str] = AUTO,
+        maximized: bool = False,
+        preferences: Optional[dict] = None,
+        proxy: str = None,
+        user_agent: Optional[str] = None,
+        download: Any = AUTO,
+        options: Optional[OptionsType] = None,
+        sandbox: bool = False,
+        max_uses: int = 20,
+    ) -> None:
+        """Pre-launches ``size`` browsers in the background, so the following
+        `Open Available Browser` calls using the very same arguments get a warm
+        browser instantly instead of starting a new one.
+
+        The arguments have the same meaning and defaults as in
+        `Open Available Browser`, ``headless`` included: the pooled browsers are
+        headless only where no display is available (like in containers and CI),
+        so pass ``headless=${True}`` to keep them hidden on a desktop too. Opening
+        them with `Open Available Browser` then needs ``headless=${True}`` as well,
+        as the arguments have to match. Opening a browser with
+        different arguments, with a user profile or a custom port, or while all
+        the pooled browsers are in use, starts a new browser as usual.
+
+        Closing a pooled browser (with `Close Browser` or `Close All Browsers`)
+        gives it back to the pool after its cookies and storage are cleared and the
+        extra windows closed. A browser is retired and replaced with a fresh one in
+        the background after serving ``max_uses`` sessions (`0` disables the limit)
+        or if it can't be cleaned up.
+
+        Starting a new pool stops the already running one, see `Stop Browser Pool`.
+
+        Example:
+
+        | Start Browser Pool | size=${3} | browser_selection=Chrome |
+        | FOR | ${item} | IN | @{work_items} |
+        |     | Open Available Browser | ${item}[url] | browser_selection=Chrome |
+        |     | Process Item | ${item} |
+        |     | Close Browser |
+        | END |
+        | ${stats}= | Get Browser Pool Stats |
+        """
+        self.stop_browser_pool()
+
+        browsers = self._arg_browser_selection(browser_selection)
+        downloads = self._arg_download(download)
+        for browser in browsers:
+            kwargs, arguments, browser_version = self._get_driver_args(
+                browser,
+                headless,
+                maximized,
+                preferences=preferences,
+                proxy=proxy,
+                user_agent=user_agent,
+                options=options,
+                sandbox=sandbox,
+            )
+            if browser_version:
+                break
+            self.logger.info("Could not detect version of the %s browser", browser)
+        else:
+            raise BrowserNotFoundError(
+                f"None of the browsers could be found: {', '.join(browsers)}"
+            )
+
+        def launch():
+            error = None
+            for attempt in downloads:
+                try:
+                    return self._launch_webdriver(browser, attempt, **kwargs)
+                except Exception as exc:  # pylint: disable=broad-except
+                    error = exc
+            raise error
+
+        key = self._get_browser_pool_key(
+            browser_selection=browsers,
+            headless=headless,
+            maximized=maximized,
+            preferences=preferences,
+            proxy=proxy,
+            user_agent=user_agent,
+            download=downloads,
+            options=options,
+            sandbox=sandbox,
+        )
+        self._browser_pool = BrowserPool(
+            key,
+            launch,
+            self._reset_pooled_driver,
+            size=int(size),
+            max_uses=int(max_uses),
+        )
+        self._drivers.pool = self._browser_pool
+        self.logger.info(
+            "Launching %d %s browser(s) in the pool with arguments: %s",
+            int(size),
+            browser,
+            " ".join(arguments),
+        )
+
+    @keyword
+    def stop_browser_pool(self) -> None:
+        """Quits the idle browsers of the pool started with `Start Browser Pool`.
+
+        The pooled browsers still in use are quit once closed.
+        """
+        if self._browser_pool:
+            self._browser_pool.close()
+            self._browser_pool = None
+
+    @keyword
+    def get_browser_pool_stats(self) -> dict:
+        """Returns the usage statistics of the last pool started with
+        `Start Browser Pool`, or an empty dictionary if there's no such pool.
+
+        The statistics contain the number of ``idle``, ``in_use`` and ``launching``
+        browsers, the ``hits`` (warm browsers given) and ``misses`` (browsers which
+        had to be started on the spot) along with their ``hit_rate``, the
+        ``recycled`` and ``retired`` browsers, the launch ``failures``, the
+        ``average_startup_time`` of a pooled browser and the total
+        ``startup_time_saved`` in seconds.
+
+        Example:
+
+        | ${stats}= | Get Browser Pool Stats |
+        | Log | Saved ${stats}[startup_time_saved]s with a hit rate of ${stats}[hit_rate] |
+        """  # noqa: E501
+        pool = self._drivers.pool
+        return pool.stats if pool else {}
+
+    @staticmethod
+    def _get_browser_pool_key(**arguments) -> str:
+        """Identifies the browser configuration given by the opening arguments."""
+
+        def serialize(value):
+            if isinstance(value, ArgOptions):
+                return value.to_capabilities()
+            return repr(value)
+
+        return json.dumps(arguments, sort_keys=True, default=serialize)
+
+    def _open_pooled_browser(
+        self, alias: Optional[str], **arguments
+    ) -> Optional[AliasType]:
+        """Registers a warm browser from the pool if it was started with the same
+        opening arguments, returning its index or alias (`None` otherwise).
+        """
+        if self._get_browser_pool_key(**arguments) != self._browser_pool.key:
+            return None
+        driver = self._browser_pool.acquire()
+        if driver is None:
+            return None
+        self.logger.info("Took a warm browser from the pool")
+        # pylint: disable=protected-access
+        driver = self.browser_management._wrap_event_firing_webdriver(driver)
+        return self.register_driver(driver, alias)
+
+    def _reset_pooled_driver(self, driver: Any) -> None:
+        """Clears the cookies, storage and extra windows of a pooled browser."""
+        handles = driver.window_handles
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            origin = driver.execute_script(
+                "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+                " return window.location.origin;"
+            )
+            driver.delete_all_cookies()
+            if hasattr(driver, "execute_cdp_cmd") and str(origin).startswith("http"):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"},
+                )
+            if handle != handles[0]:
+                driver.close()
+
+        driver.switch_to.window(handles[0])
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.get("about:blank")
+
     def _arg_browser_selection(
         self, browser_selection: Union[str, List[str]]
     ) -> List[str]:
@@ -1008,46 +1514,49 @@ class Selenium(SeleniumLibrary):
 
         If webdriver download is requested, a cached version will be used if exists.
         """
-
-        def _create_driver(path: Optional[str] = None) -> AliasType:
-            # Prepare webdriver's service instance keyword arguments.
-            service_kwargs = {
-                # Deprecated params if passed directly to the `WebDriver` class.
-                "service_args": None,
-                "service_log_path": None,
-                "port": 0,
-            }
-            for name, default in service_kwargs.items():
-                service_kwargs[name] = kwargs.pop(name, default)
-            service_kwargs["log_path"] = service_kwargs.pop("service_log_path")
-            if path:
-                service_kwargs["executable_path"] = path
-
-            # Instantiate the right service to be passed during the webdriver creation.
-            lower_browser = browser.lower()
-            if lower_browser == "safari":
-                service_kwargs.pop("log_path")  # not supported at all
-            elif lower_browser == "ie":
-                service_kwargs["log_file"] = service_kwargs.pop("log_path")
-            BrowserService = self._get_service_class(lower_browser)
-            service = BrowserService(**service_kwargs)
-
-            # Capitalize browser name just to ensure it works if passed as lower case.
-            # NOTE: But don't break a browser name like "ChromiumEdge".
-            cap_browser = browser[0].upper() + browser[1:]
-            kwargs["service"] = service
-            return self.browser_management.create_webdriver(
-                cap_browser, alias, **kwargs
-            )
-
-        # No download requested.
-        if not download:
-            return _create_driver()
-
-        # Download web driver. (caching is tackled internally)
-        driver_path = core_webdriver.download(browser)
-        self.logger.debug(f"web driver path: {driver_path}")
-        return _create_driver(path=driver_path)
+        cap_browser, kwargs = self._get_webdriver_kwargs(browser, download, kwargs)
+        return self.browser_management.create_webdriver(cap_browser, alias, **kwargs)
+
+    def _launch_webdriver(self, browser: str, download: bool, **kwargs) -> Any:
+        """Start a webdriver instance without registering it with the library."""
+        cap_browser, kwargs = self._get_webdriver_kwargs(browser, download, kwargs)
+        return getattr(selenium_webdriver, cap_browser)(**kwargs)
+
+    def _get_webdriver_kwargs(
+        self, browser: str, download: bool, kwargs: dict
+    ) -> Tuple[str, dict]:
+        """Get the webdriver class name and its creation arguments."""
+        kwargs = dict(kwargs)
+        # Prepare webdriver's service instance keyword arguments.
+        service_kwargs = {
+            # Deprecated params if passed directly to the `WebDriver` class.
+            "service_args": None,
+            "service_log_path": None,
+            "port": 0,
+        }
+        for name, default in service_kwargs.items():
+            service_kwargs[name] = kwargs.pop(name, default)
+        service_kwargs["log_path"] = service_kwargs.pop("service_log_path")
+        if download:
+            # Download web driver. (caching is tackled internally)
+            driver_path = core_webdriver.download(browser)
+            self.logger.debug(f"web driver path: {driver_path}")
+            if driver_path:
+                service_kwargs["executable_path"] = driver_path
+
+        # Instantiate the right service to be passed during the webdriver creation.
+        lower_browser = browser.lower()
+        if lower_browser == "safari":
+            service_kwargs.pop("log_path")  # not supported at all
+        elif lower_browser == "ie":
+            service_kwargs["log_file"] = service_kwargs.pop("log_path")
+        BrowserService = self._get_service_class(lower_browser)
+        kwargs["service"] = BrowserService(**service_kwargs)
+
+        # Capitalize browser name just to ensure it works if passed as lower case.
+        # NOTE: But don't break a browser name like "ChromiumEdge".
+        cap_browser = browser[0].upper() + browser[1:]
+        return cap_browser, kwargs
 
     @keyword
     def open_chrome_browser(
@@ -1921,6 +2430,12 @@ class Selenium(SeleniumLibrary):
 
         ``locator`` element locator
 
+        The element is located once and its status is collected with a single
+        script execution, while the visibility is checked by WebDriver like
+        with `Is Element Visible`. A missing element reports ``False`` for every
+        status, and elements other than form elements are neither enabled nor
+        disabled.
+
         Example:
 
         | &{res}  | Get Element Status | class:special |
@@ -1929,14 +2444,69 @@ class Selenium(SeleniumLibrary):
         | Log     | ${res.disabled} |
         | Log     | ${res.focused} |
         """
-        status_object = {}
-        status_object["visible"] = self.is_element_visible(locator)
-        status_object["enabled"] = self.is_element_enabled(locator)
-        status_object["disabled"] = self.is_element_disabled(locator)
-        status_object["focused"] = self.is_element_focused(locator)
+        keys = ["visible", "enabled", "disabled", "focused"]
+        elements = self.find_elements(locator)
+        if elements:
+            status = self._inspect_elements(elements[:1])[0]
+            status["visible"] = elements[0].is_displayed()
+            status_object = {key: status[key] for key in keys}
+        else:
+            status_object = dict.fromkeys(keys, False)
         notebook.notebook_json(status_object)
         return status_object
 
+    @keyword
+    def get_elements_status(
+        self,
+        locator: Union[Locator, List[Locator]],
+        attributes: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """Return the status of all the elements matching ``locator``.
+
+        ``locator`` element locator, or a list of locators and elements whose
+        matches are all inspected
+
+        ``attributes`` names of the element attributes to include in the result
+
+        The elements are located once per locator and then inspected all together
+        in a single script execution, so the cost doesn't grow with the number of
+        elements and collected properties. Each returned dictionary contains:
+
+            - visible
+            - enabled
+            - disabled
+            - focused
+            - text
+            - rect (dictionary with ``x``, ``y``, ``width`` and ``height``)
+            - attributes (dictionary of the requested ``attributes``)
+
+        Visibility is checked with the browser's own CSS visibility rules, which
+        can differ in edge cases from the WebDriver based `Is Element Visible`
+        and `Get Element Status`. Like with those, only form elements are
+        enabled or disabled, and read-only ones count as disabled.
+
+        Example:
+
+        | @{rows}  | Get Elements Status | css:table tr | attributes=${{["id", "class"]}} |
+        | FOR      | ${row} | IN | @{rows} |
+        |          | Log    | ${row}[text] is visible: ${row}[visible] |
+        | END      |
+        """
+        locators = locator if isinstance(locator, list) else [locator]
+        elements = []
+        for item in locators:
+            elements.extend(self.find_elements(item))
+        if not elements:
+            return []
+        return self._inspect_elements(elements, attributes)
+
+    def _inspect_elements(
+        self, elements: List[Element], attributes: Optional[List[str]] = None
+    ) -> List[Dict]:
+        return self.driver.execute_script(
+            self.ELEMENT_STATUS_SCRIPT, list(attributes or []), *elements
+        )
+
     @keyword
     def get_testability_status(self) -> bool:
         """Get SeleniumTestability plugin status"""
@@ -2468,9 +3038,10 @@ class Selenium(SeleniumLibrary):
         """Waits until a completed network request URL matching ``url_pattern``
         appears in the browser's performance resource timeline.
 
-        Polls ``window.performance.getEntriesByType('resource')``, which records
-        all completed resource loads (XHR, fetch, images, scripts, stylesheets).
-        No special browser configuration is required.
+        Observes ``window.performance`` resource entries, which record all completed
+        resource loads (XHR, fetch, images, scripts, stylesheets). No special browser
+        configuration is required. See `Wait For Network Requests` for waiting on
+        multiple patterns and getting the timing of the requests.
 
         ``url_pattern`` regular expression matched against request URLs.
 
@@ -2485,24 +3056,84 @@ class Selenium(SeleniumLibrary):
         | ${url}=    Wait For Network Request    /api/v1/data |
         | Log    Captured: ${url} |
         """
+        return self.wait_for_network_requests(url_pattern, timeout=timeout)[0]["url"]
+
+    @keyword
+    def wait_for_network_requests(
+        self, *url_patterns: str, timeout: TimeoutType = None, match_all: bool = True
+    ) -> List[Dict]:
+        """Waits until completed network requests matching the given
+        ``url_patterns`` appear in the browser's performance resource timeline.
+
+        A ``PerformanceObserver`` injected into the page buffers the completed
+        resource loads, and only the entries not seen yet are transferred from the
+        browser while waiting, so the keyword returns as soon as a matching request
+        completes, regardless of how many requests the page already made.
+
+        ``url_patterns`` regular expressions matched against request URLs.
+
+        ``timeout`` maximum wait time; uses the library default if omitted.
+
+        ``match_all`` wait for a request matching every pattern (default), or
+        return as soon as any of the patterns matches when ``False``.
+
+        Returns a list with the first request matched by each pattern (in the order
+        of the patterns, ``None`` for the unmatched ones when ``match_all`` is
+        ``False``). Every request is a dictionary with the ``url``,
+        ``initiator_type``, ``start_time``, ``duration``, ``response_end``
+        (milliseconds relative to the page load), ``transfer_size`` and
+        ``response_status`` (when reported by the browser) keys.
+
+        Example:
+
+        | Click Button    id:load-data |
+        | @{requests}=    Wait For Network Requests    /api/v1/data    /api/v1/user |
+        | FOR    ${request}    IN    @{requests} |
+        |     Log    ${request}[url] took ${request}[duration] ms |
+        | END |
+        """
+        if not url_patterns:
+            raise ValueError("At least one URL pattern is required")
         timeout_val: float = self.browser_management.get_timeout(timeout)
-        pattern = re.compile(url_pattern)
+        patterns = [re.compile(url_pattern) for url_pattern in url_patterns]
+        matches: List[Optional[Dict]] = [None] * len(patterns)
         end_time = time.time() + timeout_val
-        seen: set = set()
-        while time.time() < end_time:
-            urls: List[str] = self.driver.execute_script(
-                "return window.performance"
-                ".getEntriesByType('resource').map(r => r.name);"
-            )
-            for url in urls:
-                if url not in seen and pattern.search(url):
-                    return url
-                seen.add(url)
-            time.sleep(0.5)
-        raise TimeoutException(
-            f"No network request matching '{url_pattern}' detected"
-            f" within {timeout_val}s"
-        )
+        page, since = None, 0
+        while True:
+            remaining = end_time - time.time()
+            # The script blocks in the browser until new entries arrive, but not
+            # longer than a second, keeping it under the WebDriver script timeout.
+            try:
+                result = self.driver.execute_async_script(
+                    self.NETWORK_OBSERVER_SCRIPT,
+                    page,
+                    since,
+                    int(max(0.0, min(remaining, 1.0)) * 1000),
+                )
+            except JavascriptException as exc:
+                # The page navigated away while waiting, the observer gets
+                # installed again into the new one.
+                self.logger.debug("Observing the network requests again: %s", exc)
+                result = {"page": None, "next": 0, "entries": []}
+            page, since = result["page"], result["next"]
+            for entry in result["entries"]:
+                for idx, pattern in enumerate(patterns):
+                    if matches[idx] is None and pattern.search(entry["url"]):
+                        matches[idx] = entry
+            found = all(matches) if match_all else any(matches)
+            if found:
+                break
+            if remaining <= 0:
+                unmatched = [
+                    url_pattern
+                    for url_pattern, match in zip(url_patterns, matches)
+                    if match is None
+                ]
+                raise TimeoutException(
+                    "No network request matching"
+                    f" '{', '.join(unmatched)}' detected within {timeout_val}s"
+                )
+        return matches
 
     # ------------------------------------------------------------------ #
     # Virtual Authenticator (WebAuthn / Passkey testing)
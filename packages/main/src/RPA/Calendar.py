@@ -1,6 +1,8 @@
+import bisect
 from datetime import date as datetime_date
+from functools import lru_cache
 import logging
-from typing import Union, List, Dict, Optional
+from typing import Callable, Iterable, Union, List, Dict, Optional, Tuple
 
 import pendulum as pdl
 from pendulum.parsing.exceptions import ParserError
@@ -20,6 +22,120 @@ valid tokens for the date format.
 DTFormat = Union[str, datetime_date, PendulumDateTime]
 
 
+@lru_cache(maxsize=4096)
+def _parse_date_string(date: str) -> PendulumDateTime:
+    # Parsed values are immutable, thus safe to share between the calls.
+    return pdl.parse(date, strict=False)
+
+
+class BusinessDayIndex:
+    """Sorted array of the business days (as date ordinals) of a calendar, so
+    finding the next or previous business day, counting and adding business days
+    are all binary searches.
+
+    ``business_days`` are the weekdays (0 for Monday) considered business days,
+    ``holidays_for_year`` returns the holiday dates of a given year and these are
+    excluded from the business days only if ``exclude_holidays`` is `True`. The
+    index covers whole years and grows on demand.
+    """
+
+    def __init__(
+        self,
+        business_days: Iterable[int],
+        holidays_for_year: Callable[[int], Iterable[datetime_date]],
+        exclude_holidays: bool = True,
+    ):
+        self.business_days = frozenset(business_days)
+        if not self.business_days:
+            raise ValueError("At least one weekday should be a business day")
+
+        self._holidays_for_year = holidays_for_year
+        self._exclude_holidays = exclude_holidays
+        self._days: List[int] = []
+        self._holidays = set()
+        self._years: Optional[Tuple[int, int]] = None
+
+    def _year_days(self, year: int) -> List[int]:
+        holidays_ = {
+            day.toordinal() for day in self._holidays_for_year(year) if day.year == year
+        }
+        self._holidays |= holidays_
+        excluded = holidays_ if self._exclude_holidays else set()
+        start = datetime_date(year, 1, 1).toordinal()
+        end = datetime_date(year + 1, 1, 1).toordinal()
+        # The ordinal 1 (0001-01-01) is a Monday.
+        return [
+            day
+            for day in range(start, end)
+            if (day - 1) % 7 in self.business_days and day not in excluded
+        ]
+
+    def _cover(self, ordinal: int) -> None:
+        """Extend the index with the years up to the one of the ordinal, plus a year
+        around it.
+        """
+        year = datetime_date.fromordinal(ordinal).year
+        if self._years is None:
+            self._years = (year, year - 1)
+            self._days = []
+        first, last = self._years
+        if first <= year - 1 and year + 1 <= last:
+            return
+
+        lower, upper = min(first, year - 1), max(last, year + 1)
+        before = [day for y in range(lower, first) for day in self._year_days(y)]
+        after = [day for y in range(last + 1, upper + 1) for day in self._year_days(y)]
+        self._days = before + self._days + after
+        self._years = (lower, upper)
+
+    def is_business_day(self, ordinal: int) -> bool:
+        self._cover(ordinal)
+        idx = bisect.bisect_left(self._days, ordinal)
+        return idx < len(self._days) and self._days[idx] == ordinal
+
+    def is_holiday(self, ordinal: int) -> bool:
+        self._cover(ordinal)
+        return ordinal in self._holidays
+
+    def add(self, ordinal: int, count: int) -> int:
+        """Return the business day ``count`` business days after (or before, if
+        negative) the ordinal.
+        """
+        if not count:
+            return ordinal
+        while True:
+            self._cover(ordinal)
+            if count > 0:
+                idx = bisect.bisect_right(self._days, ordinal) + count - 1
+            else:
+                idx = bisect.bisect_left(self._days, ordinal) + count
+            if 0 <= idx < len(self._days):
+                return self._days[idx]
+            # Not enough business days indexed yet, grow towards the result.
+            first, last = self._years
+            edge = datetime_date(last if count > 0 else first, 6, 30)
+            ordinal_edge = edge.toordinal() + (366 if count > 0 else -366)
+            self._cover(ordinal_edge)
+
+    def next(self, ordinal: int) -> int:
+        return self.add(ordinal, 1)
+
+    def previous(self, ordinal: int) -> int:
+        return self.add(ordinal, -1)
+
+    def count(self, start: int, end: int) -> int:
+        """Count the business days from ``start`` (inclusive) until ``end``
+        (exclusive), being negative if ``end`` is before ``start``.
+        """
+        if end < start:
+            return -self.count(start=end, end=start)
+        self._cover(start)
+        self._cover(end)
+        return bisect.bisect_left(self._days, end) - bisect.bisect_left(
+            self._days, start
+        )
+
+
 @library(scope="GLOBAL", doc_format="REST")
 class Calendar:
     """Library for handling different operations for date and time
@@ -47,6 +163,33 @@ class Calendar:
         self.DEFAULT_BUSINESS_DAYS = [0, 1, 2, 3, 4]  # Monday - Friday as a constant
         self.BUSINESS_DAYS = self.DEFAULT_BUSINESS_DAYS.copy()  # Working copy
         self.custom_holidays = holidays.HolidayBase()
+        self._business_day_indexes: Dict[tuple, BusinessDayIndex] = {}
+
+    def _get_business_day_index(self, country: Optional[str]) -> BusinessDayIndex:
+        """Get the cached index of the current business days, country and custom
+        holidays.
+        """
+        custom = frozenset(self.custom_holidays)
+        key = (country, tuple(sorted(set(self.BUSINESS_DAYS))), custom)
+        index = self._business_day_indexes.get(key)
+        if index is None:
+
+            def holidays_for_year(year: int) -> Iterable[datetime_date]:
+                if country:
+                    return set(holidays.country_holidays(country, years=year)) | custom
+                return custom
+
+            index = BusinessDayIndex(
+                key[1], holidays_for_year, exclude_holidays=bool(country)
+            )
+            self._business_day_indexes[key] = index
+        return index
+
+    @staticmethod
+    def _to_datetime(date: DTFormat) -> Union[datetime_date, PendulumDateTime]:
+        if isinstance(date, str):
+            return _parse_date_string(date)
+        return date
 
     @keyword
     def reset_business_days(self) -> None:
@@ -611,44 +754,302 @@ class Calendar:
         locale: Optional[str] = None,
         direction: int = -1,
     ):
-        if isinstance(given_date, str):
-            given_dt = pdl.parse(given_date, strict=False)
-        else:
-            given_dt = given_date
+        return self._shift_business_days(
+            [given_date], direction, country, return_format, locale
+        )[0]
+
+    def _shift_business_days(
+        self,
+        dates: List[DTFormat],
+        count: int,
+        country: Optional[str] = None,
+        return_format: Optional[str] = None,
+        locale: Optional[str] = None,
+    ) -> List:
+        index = self._get_business_day_index(country)
+        results = []
+        for date in dates:
+            given_dt = self._to_datetime(date)
+            ordinal = given_dt.toordinal()
+            # Move by whole days, so the time and timezone of the date are kept.
+            current_dt = given_dt.add(days=index.add(ordinal, count) - ordinal)
+            if return_format:
+                current_dt = current_dt.format(fmt=return_format, locale=locale)
+            results.append(current_dt)
+        return results
 
-        current_dt = given_dt
-        years = [given_dt.year - 1, given_dt.year, given_dt.year + 1]
-        holiday_list = self.return_holidays(years, country)
+    @keyword
+    def return_previous_business_days(
+        self,
+        dates: List[DTFormat],
+        country: Optional[str] = None,
+        return_format: str = "YYYY-MM-DD",
+        locale: Optional[str] = None,
+    ) -> List:
+        """Return the previous business day of each date.
 
-        # Skip the current date for previous/next business day
-        current_dt = current_dt.add(days=direction)
+        Like ``Return Previous Business Day``, but for many dates at once.
 
-        while True:
-            current_date = pdl.date(current_dt.year, current_dt.month, current_dt.day)
-            weekday = current_dt.day_of_week
+        :param dates: list of days of origin
+        :param country: country code, default `None`
+        :param return_format: dates can be formatted for the resulting
+         list, defaults to "YYYY-MM-DD"
+        :param locale: name of the locale
+        :return: list of the previous business days
 
-            self.logger.debug(f"Checking date: {current_date}, weekday: {weekday}")
-            self.logger.debug(f"Business days: {self.BUSINESS_DAYS}")
+        Python example.
 
-            # Check if it's a business day
-            is_business_day = weekday in self.BUSINESS_DAYS
+        .. code-block:: python
 
-            self.logger.debug(f"Is business day? {is_business_day}")
+            days = Calendar().return_previous_business_days(
+                ["2023-01-09", "2023-01-02"], "FI"
+            )
+            # days == ["2023-01-05", "2022-12-30"]
 
-            # Check if it's not a holiday (if country is specified)
-            if country and is_business_day:
-                is_holiday = current_date in holiday_list
-                is_business_day = not is_holiday
-                self.logger.debug(f"Is holiday? {is_holiday}")
+        Robot Framework example.
 
-            if is_business_day:
-                break
+        .. code-block:: robotframework
 
-            current_dt = current_dt.add(days=direction)
+            @{dates}=  Create List  2023-01-09  2023-01-02
+            @{days}=  Return Previous Business Days  ${dates}  FI
+            # ${days} == ["2023-01-05", "2022-12-30"]
+        """
+        return self._shift_business_days(dates, -1, country, return_format, locale)
 
-        if return_format:
-            return current_dt.format(fmt=return_format, locale=locale)
-        return current_dt
+    @keyword
+    def return_next_business_days(
+        self,
+        dates: List[DTFormat],
+        country: Optional[str] = None,
+        return_format: str = "YYYY-MM-DD",
+        locale: Optional[str] = None,
+    ) -> List:
+        """Return the next business day of each date.
+
+        Like ``Return Next Business Day``, but for many dates at once.
+
+        :param dates: list of days of origin
+        :param country: country code, default `None`
+        :param return_format: dates can be formatted for the resulting
+         list, defaults to "YYYY-MM-DD"
+        :param locale: name of the locale
+        :return: list of the next business days
+
+        Python example.
+
+        .. code-block:: python
+
+            days = Calendar().return_next_business_days(
+                ["2023-01-05", "2022-12-23"], "FI"
+            )
+            # days == ["2023-01-09", "2022-12-27"]
+
+        Robot Framework example.
+
+        .. code-block:: robotframework
+
+            @{dates}=  Create List  2023-01-05  2022-12-23
+            @{days}=  Return Next Business Days  ${dates}  FI
+            # ${days} == ["2023-01-09", "2022-12-27"]
+        """
+        return self._shift_business_days(dates, 1, country, return_format, locale)
+
+    @keyword
+    def add_business_days(
+        self,
+        date: DTFormat,
+        days: int,
+        country: Optional[str] = None,
+        return_format: str = "YYYY-MM-DD",
+        locale: Optional[str] = None,
+    ):
+        """Return the date the given number of business days after the date,
+        or before it if ``days`` is negative.
+
+        If `country` is not given then holidays are not considered.
+
+        :param date: day of origin
+        :param days: number of business days to add
+        :param country: country code, default `None`
+        :param return_format: dates can be formatted for the resulting
+         list, defaults to "YYYY-MM-DD"
+        :param locale: name of the locale
+        :return: the business day reached from the day of origin
+
+        Python example.
+
+        .. code-block:: python
+
+            due_date = Calendar().add_business_days("2022-12-22", 3, "FI")
+            # due_date == "2022-12-28"
+
+        Robot Framework example.
+
+        .. code-block:: robotframework
+
+            ${due_date}=  Add Business Days  2022-12-22  3  FI
+            # ${due_date} == "2022-12-28"
+        """
+        return self._shift_business_days(
+            [date], int(days), country, return_format, locale
+        )[0]
+
+    @keyword
+    def add_business_days_to_dates(
+        self,
+        dates: List[DTFormat],
+        days: int,
+        country: Optional[str] = None,
+        return_format: str = "YYYY-MM-DD",
+        locale: Optional[str] = None,
+    ) -> List:
+        """Add the given number of business days to each date.
+
+        Like ``Add Business Days``, but for many dates at once.
+
+        :param dates: list of days of origin
+        :param days: number of business days to add
+        :param country: country code, default `None`
+        :param return_format: dates can be formatted for the resulting
+         list, defaults to "YYYY-MM-DD"
+        :param locale: name of the locale
+        :return: list of the business days reached from the days of origin
+
+        Python example.
+
+        .. code-block:: python
+
+            due_dates = Calendar().add_business_days_to_dates(
+                ["2022-12-22", "2023-01-02"], 3, "FI"
+            )
+            # due_dates == ["2022-12-28", "2023-01-05"]
+
+        Robot Framework example.
+
+        .. code-block:: robotframework
+
+            @{dates}=  Create List  2022-12-22  2023-01-02
+            @{due_dates}=  Add Business Days To Dates  ${dates}  3  FI
+            # ${due_dates} == ["2022-12-28", "2023-01-05"]
+        """
+        return self._shift_business_days(
+            dates, int(days), country, return_format, locale
+        )
+
+    @keyword
+    def business_days_between(
+        self,
+        start_date: DTFormat,
+        end_date: DTFormat,
+        country: Optional[str] = None,
+    ) -> int:
+        """Count the business days from the start date until the end date,
+        including the start date but not the end date. The result is negative if
+        the end date is before the start date.
+
+        If `country` is not given then holidays are not considered.
+
+        :param start_date: first date of the period
+        :param end_date: date after the last date of the period
+        :param country: country code, default `None`
+        :return: number of business days in between
+
+        Python example.
+
+        .. code-block:: python
+
+            days = Calendar().business_days_between("2022-12-22", "2022-12-29", "FI")
+            # days == 4
+
+        Robot Framework example.
+
+        .. code-block:: robotframework
+
+            ${days}=  Business Days Between  2022-12-22  2022-12-29  FI
+            # ${days} == 4
+        """
+        return self.business_days_between_dates([start_date], [end_date], country)[0]
+
+    @keyword
+    def business_days_between_dates(
+        self,
+        start_dates: List[DTFormat],
+        end_dates: List[DTFormat],
+        country: Optional[str] = None,
+    ) -> List[int]:
+        """Count the business days between each pair of start and end dates.
+
+        Like ``Business Days Between``, but for many periods at once.
+
+        :param start_dates: list of first dates of the periods
+        :param end_dates: list of dates after the last dates of the periods
+        :param country: country code, default `None`
+        :return: list of numbers of business days in between
+
+        Python example.
+
+        .. code-block:: python
+
+            days = Calendar().business_days_between_dates(
+                ["2022-12-22", "2023-01-02"], ["2022-12-29", "2023-01-09"], "FI"
+            )
+            # days == [4, 4]
+
+        Robot Framework example.
+
+        .. code-block:: robotframework
+
+            @{starts}=  Create List  2022-12-22  2023-01-02
+            @{ends}=  Create List  2022-12-29  2023-01-09
+            @{days}=  Business Days Between Dates  ${starts}  ${ends}  FI
+            # ${days} == [4, 4]
+        """
+        if len(start_dates) != len(end_dates):
+            raise ValueError("The start and end dates should be of the same count")
+
+        index = self._get_business_day_index(country)
+        return [
+            index.count(
+                self._to_datetime(start).toordinal(),
+                self._to_datetime(end).toordinal(),
+            )
+            for start, end in zip(start_dates, end_dates)
+        ]
+
+    @keyword
+    def are_the_dates_business_days(
+        self, dates: List[DTFormat], country: Optional[str] = None
+    ) -> List[bool]:
+        """Are the dates business days in a country.
+
+        Like ``Is The Date Business Day``, but for many dates at once.
+
+        :param dates: list of input dates
+        :param country: country code, default `None`
+        :return: list of `True` for the business days and `False` for the others
+
+        Python example.
+
+        .. code-block:: python
+
+            flags = Calendar().are_the_dates_business_days(
+                ["2023-01-05", "2023-01-06"], "FI"
+            )
+            # flags == [True, False]
+
+        Robot Framework example.
+
+        .. code-block:: robotframework
+
+            @{dates}=  Create List  2023-01-05  2023-01-06
+            @{flags}=  Are The Dates Business Days  ${dates}  FI
+            # ${flags} == [True, False]
+        """
+        index = self._get_business_day_index(country)
+        return [
+            index.is_business_day(self._to_datetime(date).toordinal())
+            for date in dates
+        ]
 
     @keyword
     def return_holidays(
@@ -979,17 +1380,9 @@ class Calendar:
                 END
             END
         """
-        if isinstance(date, str):
-            given_dt = pdl.parse(date, strict=False)
-        else:
-            given_dt = date
-        holiday_list = self.return_holidays(given_dt.year, country)
-        is_business_day = False
-        if given_dt.day_of_week in self.BUSINESS_DAYS:
-            is_business_day = True
-        if country and is_business_day:
-            is_business_day = given_dt not in holiday_list
-        return is_business_day
+        given_dt = self._to_datetime(date)
+        index = self._get_business_day_index(country)
+        return index.is_business_day(given_dt.toordinal())
 
     @keyword(name="Is the ${date} Business Day in ${country}")
     def _rfw_is_the_day_business_day(self, date: DTFormat, country: str):
@@ -1043,12 +1436,9 @@ class Calendar:
             END
 
         """
-        if isinstance(date, str):
-            given_dt = pdl.parse(date, strict=False)
-        else:
-            given_dt = date
-        holiday_list = self.return_holidays(given_dt.year, country)
-        return given_dt in holiday_list
+        given_dt = self._to_datetime(date)
+        index = self._get_business_day_index(country)
+        return index.is_holiday(given_dt.toordinal())
 
     @keyword(name="Is the ${date} Holiday in ${country}")
     def _rfw_is_the_day_holiday(self, date: DTFormat, country: str):
@@ -1,7 +1,8 @@
 import importlib
 import logging
+import re
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
@@ -20,6 +21,153 @@ except RobotNotRunningError:
 
 
 MYSQL_CONNECTORS = ["MySQLdb", "pymysql", "mysql.connector"]
+# Drivers which accept several `;` separated statements in a single `execute` call.
+# The MySQL ones do so only when connected with the `MULTI_STATEMENTS` client flag.
+MULTI_STATEMENT_MODULES = MYSQL_CONNECTORS + [
+    "psycopg",
+    "psycopg2",
+    "pyodbc",
+    "pymssql",
+]
+
+
+class SQLScriptSplitter:
+    """Tokenizer splitting a stream of SQL script lines into single statements.
+
+    Statement delimiters found inside quoted strings and identifiers, dollar-quoted
+    bodies (``$$ ... $$`` or ``$tag$ ... $tag$``) and block comments are ignored.
+    Line comments (``--`` and lines starting with ``#``) are dropped and the MySQL
+    client ``DELIMITER`` directive changes the delimiter for the statements
+    following it. Backslashes escape quotes within strings only with
+    ``backslash_escapes`` (as in MySQL), standard SQL doubles the quote instead.
+    """
+
+    DELIMITER_DIRECTIVE = re.compile(r"^\s*DELIMITER\s+(\S+)\s*$", re.IGNORECASE)
+    DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+    ESCAPABLE_QUOTES = ("'", '"')
+
+    def __init__(self, delimiter: str = ";", backslash_escapes: bool = False):
+        self.backslash_escapes = backslash_escapes
+        self._buffer: List[str] = []
+        self._has_content = False
+        # Closing token while inside a string, quoted identifier, dollar-quoted body
+        # or block comment, `None` otherwise.
+        self._closing: Optional[str] = None
+        self._tokens = None
+        self.delimiter = delimiter
+
+    @property
+    def delimiter(self) -> str:
+        return self._delimiter
+
+    @delimiter.setter
+    def delimiter(self, value: str):
+        self._delimiter = value
+        # The delimiter goes first, so it wins over a dollar-quote (`DELIMITER $$`).
+        self._tokens = re.compile(
+            "|".join([re.escape(value), "'", '"', "`", "--", r"/\*", r"\$"])
+        )
+
+    def split(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield the statements found in `lines` as soon as they are complete."""
+        for line in lines:
+            yield from self.feed(line)
+        statement = self.flush()
+        if statement:
+            yield statement
+
+    def feed(self, line: str) -> Iterator[str]:
+        """Consume one line of script and yield the statements it completes."""
+        if self._closing is None and self._skip_line(line):
+            return
+
+        pos, end = 0, len(line)
+        while pos < end:
+            if self._closing is not None:
+                pos = self._consume_quoted(line, pos)
+                continue
+
+            match = self._tokens.search(line, pos)
+            if not match:
+                self._append(line[pos:])
+                break
+            self._append(line[pos : match.start()])
+            if match.group(0) == self._delimiter:
+                pos = match.end()
+                statement = self.flush()
+                if statement:
+                    yield statement
+            else:
+                pos = self._consume_token(line, match)
+
+    def flush(self) -> Optional[str]:
+        """Return the pending statement (if any) and reset the buffer."""
+        statement = "".join(self._buffer).strip() if self._has_content else None
+        self._buffer = []
+        self._has_content = False
+        return statement
+
+    def _append(self, text: str):
+        if text:
+            self._buffer.append(text)
+            if not self._has_content and not text.isspace():
+                self._has_content = True
+
+    def _skip_line(self, line: str) -> bool:
+        # Handles the `DELIMITER` directive and the `#` comment lines.
+        if not self._has_content:
+            match = self.DELIMITER_DIRECTIVE.match(line)
+            if match:
+                self.delimiter = match.group(1)
+                return True
+        return line.lstrip().startswith("#")
+
+    def _consume_token(self, line: str, match: re.Match) -> int:
+        token = match.group(0)
+        if token == "--":
+            # Line comment, keep only the line break.
+            if line.endswith("\n"):
+                self._buffer.append("\n")
+            return len(line)
+        if token == "$":
+            return self._consume_dollar(line, match.start())
+        self._buffer.append(token)
+        self._closing = "*/" if token == "/*" else token
+        if token != "/*":
+            self._has_content = True
+        return match.end()
+
+    def _consume_dollar(self, line: str, start: int) -> int:
+        follows_name = start and (line[start - 1].isalnum() or line[start - 1] == "_")
+        tag = None if follows_name else self.DOLLAR_TAG.match(line, start)
+        if not tag:  # positional parameter like `$1` or part of a name
+            self._append("$")
+            return start + 1
+        self._buffer.append(tag.group(0))
+        self._closing = tag.group(0)
+        self._has_content = True
+        return tag.end()
+
+    def _consume_quoted(self, line: str, pos: int) -> int:
+        closing = self._closing
+        idx = line.find(closing, pos)
+        if self.backslash_escapes and closing in self.ESCAPABLE_QUOTES:
+            while idx != -1 and self._is_escaped(line, idx):
+                idx = line.find(closing, idx + 1)
+        if idx == -1:
+            self._buffer.append(line[pos:])
+            return len(line)
+        idx += len(closing)
+        self._buffer.append(line[pos:idx])
+        self._closing = None
+        return idx
+
+    @staticmethod
+    def _is_escaped(line: str, idx: int) -> bool:
+        backslashes = 0
+        while idx > backslashes and line[idx - backslashes - 1] == "\\":
+            backslashes += 1
+        return backslashes % 2 == 1
 
 
 class Configuration:
@@ -521,55 +669,64 @@ class Database:
         if self._dbconnection:
             self._dbconnection.close()
 
-    # pylint: disable=R0912
-    def execute_sql_script(  # noqa: C901
+    def execute_sql_script(
         self,
         filename: str,
         sanstran: Optional[bool] = False,
         encoding: Optional[str] = "utf-8",
-    ) -> None:  # noqa: C901
+        batch_size: Optional[int] = 1,
+    ) -> None:
         """Execute content of SQL script as SQL commands.
 
+        The script is read and split into statements in a streaming fashion, so
+        statement delimiters inside string literals, quoted identifiers,
+        dollar-quoted bodies (``$$ ... $$``) and comments are respected. The MySQL
+        client ``DELIMITER`` directive is supported as well, for scripts defining
+        procedures or triggers.
+
         :param filename: filepath to SQL script to execute
         :param sanstran: Run the query without an implicit transaction commit or
             rollback if such additional action was detected. (turned off by default)
         :param encoding: character encoding of file (utf-8 by default)
+        :param batch_size: Number of statements sent to the database in a single
+            round trip. Applies only when the database module accepts multiple
+            statements per execution (PostgreSQL, SQL Server and MySQL connected
+            with the `MULTI_STATEMENTS` client flag), otherwise statements are
+            executed one by one. (defaults to `1`)
 
         Example:
 
         .. code-block:: robotframework
 
             Execute SQL Script   script.sql
+            Execute SQL Script   migration.sql   batch_size=100
 
         """
-        with open(filename, encoding=encoding) as script_file:
-            sql_script = script_file.readlines()
+        batch_size = int(batch_size or 1)
+        if batch_size > 1 and not self._supports_multi_statements():
+            self.logger.debug(
+                "Module %r doesn't support multiple statements per execution, "
+                "running them one by one",
+                self.db_api_module_name,
+            )
+            batch_size = 1
 
         cur = None
         try:
             cur = self._dbconnection.cursor()
-            sqlStatement = ""
-            for line in sql_script:
-                if line.startswith("#") or line.startswith("--"):
-                    continue
-
-                sql_fragments = line.split(";")
-                if len(sql_fragments) == 1:
-                    sqlStatement += line + " "
-                else:
-                    for sqlFragment in sql_fragments:
-                        sqlFragment = sqlFragment.strip()
-                        if len(sqlFragment) == 0:
-                            continue
-
-                        sqlStatement += sqlFragment + " "
-
-                        self.__execute_sql(cur, sqlStatement)
-                        sqlStatement = ""
-
-            sqlStatement = sqlStatement.strip()
-            if len(sqlStatement) != 0:
-                self.__execute_sql(cur, sqlStatement)
+            with open(filename, encoding=encoding) as script_file:
+                splitter = SQLScriptSplitter(
+                    backslash_escapes=self.db_api_module_name in MYSQL_CONNECTORS
+                )
+                statements = splitter.split(script_file)
+                batch = []
+                for statement in statements:
+                    batch.append(statement)
+                    if len(batch) >= batch_size:
+                        self._execute_sql_batch(cur, batch)
+                        batch = []
+                if batch:
+                    self._execute_sql_batch(cur, batch)
         except Exception as exc:
             # Implicitly rollback when error occurs.
             self.logger.error(exc)
@@ -580,6 +737,26 @@ class Database:
             if not sanstran:
                 self._dbconnection.commit()
 
+    def _supports_multi_statements(self) -> bool:
+        if self.db_api_module_name not in MULTI_STATEMENT_MODULES:
+            return False
+        if self.db_api_module_name in MYSQL_CONNECTORS:
+            client_flags = self.config.get("client_flags") or ""
+            return "MULTI_STATEMENTS" in client_flags.split(",")
+        return True
+
+    def _execute_sql_batch(self, cursor, statements: List[str]):
+        if len(statements) == 1:
+            self.__execute_sql(cursor, statements[0])
+            return
+
+        self.__execute_sql(cursor, ";\n".join(statements))
+        if self.db_api_module_name != "psycopg2":
+            # Errors raised by the subsequent statements of the batch surface only
+            # while walking through their result sets.
+            while cursor.nextset():
+                pass
+
     def query(
         self,
         statement: str,
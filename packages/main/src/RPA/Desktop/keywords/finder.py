@@ -1,5 +1,10 @@
+import hashlib
+import os
+import threading
 import time
-from typing import Callable, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from PIL import Image
 from RPA.Desktop.keywords import (
@@ -71,6 +76,82 @@ def clamp(minimum: float, value: float, maximum: float) -> float:
     return max(minimum, min(value, maximum))
 
 
+def intersect(region: Region, container: Region) -> Optional[Region]:
+    """Return the part of region inside the container, if they overlap."""
+    if (
+        region.right <= container.left
+        or region.left >= container.right
+        or region.bottom <= container.top
+        or region.top >= container.bottom
+    ):
+        return None
+    return region.clamp(container)
+
+
+@lru_cache(maxsize=32)
+def _load_template(path: str, mtime_ns: int, size: int) -> Image.Image:
+    # pylint: disable=unused-argument
+    with Image.open(path) as image:
+        image.load()
+        # Template matching works on RGB data, convert only once.
+        if image.mode == "RGBA":
+            return image.convert("RGB")
+        return image.copy()
+
+
+def load_template(path: str) -> Image.Image:
+    """Load template image from disk, or from memory if the file
+    hasn't changed since it was last loaded.
+    """
+    stat = os.stat(path)
+    return _load_template(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+class ChangeDetector:
+    """Remembers the screen areas captured by consecutive searches, and the
+    matches found in them, to skip re-running the matchers while the screen
+    content doesn't change.
+
+    Captures are compared by a hash of their whole pixel data.
+    """
+
+    def __init__(self):
+        self.runs = 0
+        self.skipped = 0
+        self._frames: Dict[Hashable, Tuple[bytes, List[Region]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(image: Image.Image) -> bytes:
+        """Hash the image, along with its size and mode."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{image.mode}:{image.size}".encode())
+        digest.update(image.tobytes())
+        return digest.digest()
+
+    def search(
+        self,
+        key: Hashable,
+        image: Image.Image,
+        finder: Callable[[Image.Image], List[Region]],
+    ) -> List[Region]:
+        """Run finder on the image, unless the area identified by key was
+        already searched with identical content.
+        """
+        digest = self.digest(image)
+        with self._lock:
+            previous = self._frames.get(key)
+            if previous is not None and previous[0] == digest:
+                self.skipped += 1
+                return previous[1]
+            self.runs += 1
+
+        regions = finder(image)
+        with self._lock:
+            self._frames[key] = (digest, regions)
+        return regions
+
+
 class FinderKeywords(LibraryContext):
     """Keywords for locating elements."""
 
@@ -79,6 +160,8 @@ class FinderKeywords(LibraryContext):
         self._resolver = syntax.Resolver(self._find, self.locators_path)
 
         self.timeout = 3.0
+        # Set while waiting for an element, to skip searching unchanged screens.
+        self._change_detector: Optional[ChangeDetector] = None
         if HAS_RECOGNITION:
             self.confidence = templates.DEFAULT_CONFIDENCE
         else:
@@ -173,19 +256,24 @@ class FinderKeywords(LibraryContext):
             confidence,
         )
 
+        template = load_template(locator.path)
+
         def finder(image: Image.Image) -> List[Region]:
+            # The template can not be inside a smaller search area
+            if image.width < template.width or image.height < template.height:
+                return []
+
             try:
                 return templates.find(
                     image=image,
-                    template=locator.path,
+                    template=template,
                     confidence=confidence,
-                    region=region,
                 )
 
             except templates.ImageNotFoundError:
                 return []
 
-        return self._find_from_displays(finder)
+        return self._find_from_displays(finder, region, key=repr(locator))
 
     def _find_ocr(self, base: Geometry, locator: OcrLocator) -> List[Region]:
         """Find the position of all blocks of text that match the given string,
@@ -218,40 +306,75 @@ class FinderKeywords(LibraryContext):
                 image=image,
                 text=locator.text,
                 confidence=confidence,
-                region=region,
                 language=language,
                 configuration=configuration,
             )
 
             return [match["region"] for match in matches]
 
-        return self._find_from_displays(finder)
+        return self._find_from_displays(finder, region, key=repr(locator))
 
     def _find_from_displays(
-        self, finder: Callable[[Image.Image], List[Region]]
+        self,
+        finder: Callable[[Image.Image], List[Region]],
+        region: Optional[Region] = None,
+        key: Optional[Hashable] = None,
     ) -> List[Region]:
         """Call finder function for each display and return
         a list of found regions.
 
         :param finder: Callable that searches an image
+        :param region: Only capture and search this part of the virtual display
+        :param key: Identifies the search for skipping it on unchanged screens
         """
+        detector = self._change_detector
         matches = []
         screenshots = []
 
+        # Capture only the searched area. A region spanning several displays
+        # is captured as a whole, so that matches across their borders are
+        # found as well.
+        displays = screen.displays()
+        if region is None:
+            areas = displays
+        else:
+            overlapping = [
+                display for display in displays if intersect(region, display)
+            ]
+            if len(overlapping) > 1:
+                bounds = Region(
+                    min(display.left for display in overlapping),
+                    min(display.top for display in overlapping),
+                    max(display.right for display in overlapping),
+                    max(display.bottom for display in overlapping),
+                )
+                areas = [intersect(region, bounds)]
+            else:
+                areas = [intersect(region, display) for display in overlapping]
+
+        def search(area: Region) -> Tuple[Image.Image, List[Region]]:
+            image = screen.grab(area)
+            if detector is None or key is None:
+                return image, finder(image)
+            return image, detector.search((key, area.as_tuple()), image, finder)
+
         # Search all displays, and map results to combined virtual display
 
         start_time = time.time()
-        for display in screen.displays():
-            image = screen.grab(display)
-            regions = finder(image)
+        if len(areas) > 1:
+            with ThreadPoolExecutor(max_workers=len(areas)) as executor:
+                results = list(executor.map(search, areas))
+        else:
+            results = [search(area) for area in areas]
 
-            for region in regions:
-                region = region.resize(5)
-                screenshot = image.crop(region.as_tuple())
+        for area, (image, regions) in zip(areas, results):
+            for match in regions:
+                match = match.resize(5)
+                screenshot = image.crop(match.as_tuple())
                 screenshots.append(screenshot)
 
             local = Region.from_size(0, 0, image.size[0], image.size[1])
-            regions = transform(regions, local, display)
+            regions = transform(regions, local, area)
             matches.extend(regions)
 
         # Log matches and preview images
@@ -326,11 +449,18 @@ class FinderKeywords(LibraryContext):
         locator: LocatorType,
         timeout: Optional[float] = None,
         interval: float = 0.5,
+        detect_changes: bool = True,
     ) -> Geometry:
         """Wait for an element defined by locator to exist, or
         raise a TimeoutException if none were found within timeout.
 
+        While waiting, image and OCR searches are run again only when the
+        searched part of the screen has changed since the previous attempt.
+
         :param locator: Locator string
+        :param timeout: Time in seconds to wait, defaults to the library timeout
+        :param interval: Time in seconds between attempts
+        :param detect_changes: Skip searching again screens which didn't change
 
         Example:
 
@@ -345,19 +475,30 @@ class FinderKeywords(LibraryContext):
         interval = float(interval)
         end_time = time.time() + float(timeout)
 
-        error = "Operation timed out"
-        while time.time() <= end_time:
-            start = time.time()
-            try:
-                return self.find_element(locator)
-            except (ElementNotFound, MultipleElementsFound) as err:
-                error = err
-
-            duration = time.time() - start
-            if duration < interval:
-                time.sleep(interval - duration)
-
-        raise TimeoutException(error)
+        detector = ChangeDetector() if detect_changes else None
+        self._change_detector = detector
+        try:
+            error = "Operation timed out"
+            while time.time() <= end_time:
+                start = time.time()
+                try:
+                    return self.find_element(locator)
+                except (ElementNotFound, MultipleElementsFound) as err:
+                    error = err
+
+                duration = time.time() - start
+                if duration < interval:
+                    time.sleep(interval - duration)
+
+            raise TimeoutException(error)
+        finally:
+            self._change_detector = None
+            if detector is not None and detector.skipped:
+                self.logger.info(
+                    "Skipped %d of %d searches on unchanged screen",
+                    detector.skipped,
+                    detector.skipped + detector.runs,
+                )
 
     @keyword
     def set_default_timeout(self, timeout: float = 3.0):
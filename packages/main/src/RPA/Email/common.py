@@ -3,19 +3,34 @@
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
-import jwt
+from RPA.core.helpers import LazyModule
 
-from RPA.MFA import MFA
 
-
-lib_mfa = MFA()
+# The OAuth2 dependencies are needed by the OAuth keywords only.
+jwt = LazyModule("jwt")
 
 OAuthProviderType = Union["OAuthProvider", str]
 
 
+@lru_cache(maxsize=1)
+def get_mfa_library():
+    """Returns the shared `RPA.MFA` library instance, imported on first use."""
+    from RPA.MFA import MFA  # pylint: disable=import-outside-toplevel
+
+    return MFA()
+
+
+def __getattr__(name: str):
+    # `lib_mfa` stays available as a module attribute, created on first access.
+    if name == "lib_mfa":
+        return get_mfa_library()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class NoRecipientsError(ValueError):
     """Raised when email to be sent does not have any recipients, cc or bcc addresses."""  # noqa: E501
 
@@ -87,7 +102,7 @@ class OAuthMixin:
                 ...     client_id=810482312368-19htmcgcj*******googleusercontent.com
                 Log     Start OAuth2 flow: ${auth_url}
         """
-        return lib_mfa.generate_oauth_url(
+        return get_mfa_library().generate_oauth_url(
             self._oauth_provider.auth_url,
             client_id=client_id,
             redirect_uri=self._oauth_provider.redirect_uri,
@@ -130,7 +145,7 @@ class OAuthMixin:
                 ...     client_secret=GOCSPX-******mqZAW89
                 ...     response_url=${resp_url}  # redirect of `Generate OAuth URL`
         """
-        token = lib_mfa.get_oauth_token(
+        token = get_mfa_library().get_oauth_token(
             self._oauth_provider.token_url,
             client_secret=client_secret,
             response_url=response_url,
@@ -163,7 +178,7 @@ class OAuthMixin:
                 ...     client_secret=GOCSPX-******mqZAW89
                 ...     token=${token}  # from `Get OAuth Token`
         """
-        token = lib_mfa.refresh_oauth_token(
+        token = get_mfa_library().refresh_oauth_token(
             self._oauth_provider.token_url,
             client_id=client_id,
             client_secret=client_secret,
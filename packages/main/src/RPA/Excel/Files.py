@@ -7,21 +7,22 @@ from contextlib import contextmanager
 from io import BytesIO
 from typing import Any, List, Optional, Union
 
-import openpyxl
-import xlrd
-import xlwt
-
-from PIL import Image, ImageColor
-from xlutils.copy import copy as xlutils_copy
-from openpyxl.worksheet.cell_range import CellRange
-from openpyxl.utils import get_column_letter, column_index_from_string
-from openpyxl.utils import cell as utils_cell
-from openpyxl.utils.exceptions import InvalidFileException
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.styles.colors import Color as xlsColor
-from openpyxl.formula.translate import Translator
+from RPA.core.helpers import LazyModule
 from RPA.Tables import Table, Tables, return_table_as_raw_list
 
+# The spreadsheet and imaging dependencies are imported on first use only.
+openpyxl = LazyModule("openpyxl")
+openpyxl_cell_range = LazyModule("openpyxl.worksheet.cell_range")
+openpyxl_exceptions = LazyModule("openpyxl.utils.exceptions")
+openpyxl_styles = LazyModule("openpyxl.styles")
+openpyxl_translate = LazyModule("openpyxl.formula.translate")
+openpyxl_utils = LazyModule("openpyxl.utils")
+xlrd = LazyModule("xlrd")
+xlwt = LazyModule("xlwt")
+xlutils_copy = LazyModule("xlutils.copy")
+Image = LazyModule("PIL.Image")
+ImageColor = LazyModule("PIL.ImageColor")
+
 
 PathType = Union[str, pathlib.Path]
 
@@ -198,7 +199,7 @@ class Files:
             book = XlsxWorkbook(path)
             book.open(data_only=data_only, read_only=read_only)
             return book
-        except InvalidFileException as exc:
+        except openpyxl_exceptions.InvalidFileException as exc:
             self.logger.debug(exc)  # Unsupported extension, silently try xlrd
         except Exception as exc:
             self.logger.info(
@@ -1069,7 +1070,7 @@ class Files:
             lib.clear_cell_range("B2:B50")
         """
         self._require_open_xlsx_workbook("clear_cell_range")
-        cr = CellRange(range_string=range_string)
+        cr = openpyxl_cell_range.CellRange(range_string=range_string)
         for row, acell in list(cr.cells):
             self.workbook.book.active.cell(row, acell).value = None
 
@@ -1128,12 +1129,16 @@ class Files:
         """
         self._require_open_xlsx_workbook("delete_columns")
         start_column_index = (
-            start if isinstance(start, int) else column_index_from_string(start)
+            start
+            if isinstance(start, int)
+            else openpyxl_utils.column_index_from_string(start)
         )
         amount = 1
         if end:
             end_column_index = (
-                end if isinstance(end, int) else column_index_from_string(end)
+                end
+                if isinstance(end, int)
+                else openpyxl_utils.column_index_from_string(end)
             )
             amount = end_column_index - start_column_index + 1
         self.workbook.book.active.delete_cols(start_column_index, amount)
@@ -1163,7 +1168,9 @@ class Files:
         self._require_open_xlsx_workbook("insert_columns_before")
 
         column_index = (
-            column_index_from_string(column) if isinstance(column, str) else column
+            openpyxl_utils.column_index_from_string(column)
+            if isinstance(column, str)
+            else column
         )
         self.workbook.book.active.insert_cols(column_index, amount)
 
@@ -1192,7 +1199,9 @@ class Files:
         self._require_open_xlsx_workbook("insert_columns_after")
 
         column_index = (
-            column_index_from_string(column) if isinstance(column, str) else column
+            openpyxl_utils.column_index_from_string(column)
+            if isinstance(column, str)
+            else column
         )
         self.workbook.book.active.insert_cols(column_index + amount - 1, amount)
 
@@ -1270,10 +1279,10 @@ class Files:
         """
         self._require_open_xlsx_workbook("copy_cell_values")
 
-        cr = CellRange(range_string=source_range)
+        cr = openpyxl_cell_range.CellRange(range_string=source_range)
         cells = list(cr.cells)
-        target_cell_unpacked = utils_cell.coordinate_from_string(target)
-        target_column = column_index_from_string(target_cell_unpacked[0])
+        target_cell_unpacked = openpyxl_utils.cell.coordinate_from_string(target)
+        target_column = openpyxl_utils.column_index_from_string(target_cell_unpacked[0])
         target_row = target_cell_unpacked[1]
 
         last_row = None
@@ -1390,7 +1399,7 @@ class Files:
         """
         self._require_open_xlsx_workbook("set_styles")
 
-        cr = CellRange(range_string=range_string)
+        cr = openpyxl_cell_range.CellRange(range_string=range_string)
         font_parameters = {}
         self._set_font_param_if_given(font_parameters, "name", font_name)
         self._set_font_param_if_given(font_parameters, "family", family)
@@ -1403,7 +1412,7 @@ class Files:
 
         for row, column in list(cr.cells):
             active_cell = self.workbook.book.active.cell(row, column)
-            active_cell.font = Font(**font_parameters)
+            active_cell.font = openpyxl_styles.Font(**font_parameters)
             self._set_fill_color(active_cell, cell_fill)
             self._set_cell_alignments(active_cell, align_horizontal, align_vertical)
             self._set_cell_number_format(active_cell, number_format)
@@ -1420,7 +1429,7 @@ class Files:
             else:
                 color = ImageColor.getrgb(value)
                 color_hex = "%02x%02x%02x" % color
-            parameters["color"] = xlsColor(color_hex)
+            parameters["color"] = openpyxl_styles.Color(color_hex)
 
     def _set_fill_color(self, active_cell, value):
         if value:
@@ -1430,11 +1439,15 @@ class Files:
             else:
                 color = ImageColor.getrgb(value)
                 color_hex = "%02x%02x%02x" % color
-            active_cell.fill = PatternFill("solid", color_hex, color_hex)
+            active_cell.fill = openpyxl_styles.PatternFill(
+                "solid", color_hex, color_hex
+            )
 
     def _set_cell_alignments(self, active_cell, horizontal, vertical):
         if horizontal or vertical:
-            active_cell.alignment = Alignment(horizontal=horizontal, vertical=vertical)
+            active_cell.alignment = openpyxl_styles.Alignment(
+                horizontal=horizontal, vertical=vertical
+            )
 
     def _set_cell_number_format(self, active_cell, number_format):
         if number_format:
@@ -1474,20 +1487,20 @@ class Files:
         """
         self._require_open_xlsx_workbook("auto_size_columns")
         start_index = (
-            column_index_from_string(start_column)
+            openpyxl_utils.column_index_from_string(start_column)
             if isinstance(start_column, str)
             else start_column
         )
         end_index = start_index
         if end_column:
             end_index = (
-                column_index_from_string(end_column)
+                openpyxl_utils.column_index_from_string(end_column)
                 if isinstance(end_column, str)
                 else end_column
             )
 
         for col in range(start_index, end_index + 1):
-            col_letter = get_column_letter(col)
+            col_letter = openpyxl_utils.get_column_letter(col)
             if width:
                 self.workbook.book.active.column_dimensions[col_letter].width = width
             else:
@@ -1555,20 +1568,20 @@ class Files:
 
     def _set_column_hidden(self, hidden: bool, start_column, end_column):
         start_index = (
-            column_index_from_string(start_column)
+            openpyxl_utils.column_index_from_string(start_column)
             if isinstance(start_column, str)
             else start_column
         )
         end_index = start_index
         if end_column:
             end_index = (
-                column_index_from_string(end_column)
+                openpyxl_utils.column_index_from_string(end_column)
                 if isinstance(end_column, str)
                 else end_column
             )
 
         for col in range(start_index, end_index + 1):
-            col_letter = get_column_letter(col)
+            col_letter = openpyxl_utils.get_column_letter(col)
             self.workbook.book.active.column_dimensions[col_letter].hidden = hidden
 
     def set_cell_formula(
@@ -1609,18 +1622,18 @@ class Files:
         """
         self._require_open_xlsx_workbook("set_cell_formula")
 
-        cr = CellRange(range_string=range_string)
+        cr = openpyxl_cell_range.CellRange(range_string=range_string)
         start_col, start_row, _, _ = cr.bounds
-        start_col_str = f"{get_column_letter(start_col)}{start_row}"
+        start_col_str = f"{openpyxl_utils.get_column_letter(start_col)}{start_row}"
         cells = list(cr.cells)
 
         for index, acell in enumerate(cells):
             row, column = acell
-            col_str = f"{get_column_letter(column)}{row}"
+            col_str = f"{openpyxl_utils.get_column_letter(column)}{row}"
             if (transpose and index == 0) or not transpose:
                 self.workbook.book.active[col_str].value = formula
             elif transpose and index > 0:
-                self.workbook.book.active[col_str] = Translator(
+                self.workbook.book.active[col_str] = openpyxl_translate.Translator(
                     formula, origin=start_col_str
                 ).translate_formula(col_str)
 
@@ -1710,7 +1723,7 @@ class Files:
             data_values = return_table_as_raw_list(values, table_heading)
         else:
             data_values = values
-        cr = CellRange(range_string=start_cell)
+        cr = openpyxl_cell_range.CellRange(range_string=start_cell)
         start_col, start_row, _, _ = cr.bounds
         for row_index, row in enumerate(data_values):
             if isinstance(row, list):
@@ -1718,14 +1731,14 @@ class Files:
                     column = start_col + col_index
                     row = start_row + row_index
                     self.workbook.book.active[
-                        f"{get_column_letter(column)}{row}"
+                        f"{openpyxl_utils.get_column_letter(column)}{row}"
                     ].value = col
             else:
                 column = start_col + row_index
                 row = start_row
-                self.workbook.book.active[f"{get_column_letter(column)}{row}"].value = (
-                    row
-                )
+                self.workbook.book.active[
+                    f"{openpyxl_utils.get_column_letter(column)}{row}"
+                ].value = row
 
 
 class BaseWorkbook:
@@ -1814,7 +1827,7 @@ class XlsxWorkbook(BaseWorkbook):
         row = int(row)
         try:
             column = int(column)
-            column = get_column_letter(column)
+            column = openpyxl_utils.get_column_letter(column)
         except ValueError:
             pass
         return "%s%s" % (column, row)
@@ -1888,7 +1901,10 @@ class XlsxWorkbook(BaseWorkbook):
             columns = [cell.value for cell in sheet[start]]
             start += 1
         else:
-            columns = [get_column_letter(i + 1) for i in range(sheet.max_column)]
+            columns = [
+                openpyxl_utils.get_column_letter(i + 1)
+                for i in range(sheet.max_column)
+            ]
 
         columns = [str(value) if value is not None else value for value in columns]
         columns = ensure_unique(columns)
@@ -2156,7 +2172,7 @@ class XlsWorkbook(BaseWorkbook):
 
     @contextmanager
     def _book_write(self):
-        book = xlutils_copy(self._book)
+        book = xlutils_copy.copy(self._book)
         yield book
 
         fd = BytesIO()
@@ -2176,7 +2192,7 @@ class XlsWorkbook(BaseWorkbook):
         if not path:
             raise ValueError("No path defined for workbook")
 
-        book = xlutils_copy(self._book)
+        book = xlutils_copy.copy(self._book)
         self._insert_images(book)
         book.save(path)
 
@@ -2198,7 +2214,9 @@ class XlsWorkbook(BaseWorkbook):
             columns = [self._parse_type(cell) for cell in sheet.row(start)]
             start += 1
         else:
-            columns = [get_column_letter(i + 1) for i in range(sheet.ncols)]
+            columns = [
+                openpyxl_utils.get_column_letter(i + 1) for i in range(sheet.ncols)
+            ]
 
         columns = [value if value != "" else None for value in columns]
         columns = [str(value) if value is not None else value for value in columns]
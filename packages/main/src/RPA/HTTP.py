@@ -1,8 +1,11 @@
 # pylint: disable=C0411,C0412,C0413
+import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
-from typing import Any, Optional, Union, List
+from typing import Any, Dict, Optional, Tuple, Union, List
 from urllib.parse import urlparse
 
 import RequestsLibrary.log
@@ -13,6 +16,7 @@ from RPA.core.notebook import notebook_file
 from RPA.FileSystem import FileSystem
 
 LOG_CHAR_LIMIT = 10000
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
 
 
 def log_response(response):
@@ -140,6 +144,23 @@ class HTTP(RequestsLibrary):
         :param stream: if ``False``, the response content will be immediately downloaded
         :return: request response as a dict
         """  # noqa: E501
+        request_alias, url_path = self._get_session_for(
+            url, verify=verify, force_new_session=force_new_session
+        )
+        self.current_session_alias = request_alias
+        response = self.get_on_session(request_alias, url_path, stream=stream, **kwargs)
+
+        if target_file is not None:
+            self._create_or_overwrite_target_file(target_file, response, overwrite)
+
+        return response
+
+    def _get_session_for(
+        self, url: str, verify: Union[bool, str], force_new_session: bool
+    ) -> tuple:
+        """Get the alias of the session serving the host of the URL, creating one
+        if required, along with the URL path relative to that host.
+        """
         uc = urlparse(url)
 
         http_host = f"{uc.scheme}://{uc.netloc}"
@@ -152,15 +173,7 @@ class HTTP(RequestsLibrary):
         else:
             self.logger.info("Using already existing HTTP session")
 
-        self.current_session_alias = request_alias
-        response = self.get_on_session(request_alias, url_path, stream=stream, **kwargs)
-
-        if target_file is not None:
-            self._create_or_overwrite_target_file(
-                target_file, response.content, overwrite
-            )
-
-        return response
+        return request_alias, url_path
 
     def _create_or_overwrite_target_file(
         self,
@@ -259,6 +272,254 @@ class HTTP(RequestsLibrary):
 
         return response
 
+    def download_files(
+        self,
+        urls: Union[List[str], Dict[str, str]],
+        target_dir: Optional[str] = None,
+        workers: int = 4,
+        checksums: Optional[Dict[str, str]] = None,
+        checksum_algorithm: str = "sha256",
+        overwrite: bool = False,
+        resume: bool = True,
+        verify: Union[bool, str] = True,
+        force_new_session: bool = False,
+        fail_on_error: bool = True,
+        **kwargs,
+    ) -> List[dict]:
+        """Download many files concurrently, streaming each of them straight to
+        disk.
+
+        The ``urls`` can be a list of URLs, in which case each file is named after
+        the URL path (like with ``Download``), or a dictionary mapping URLs to the
+        target file paths. Relative paths are placed under ``target_dir``, which
+        defaults to the current directory.
+
+        The files are fetched by ``workers`` threads sharing the same sessions
+        ``HTTP Get`` uses, one per host. Each file is written into a ``.part``
+        file first and renamed once complete. If a download gets interrupted, the
+        next call resumes it from where it stopped by requesting only the missing
+        bytes with an HTTP ``Range`` header, as long as the server supports it.
+        The ``ETag`` (or ``Last-Modified``) of the file is kept next to the
+        ``.part`` file and sent with ``If-Range``, so a file changed on the server
+        since then is downloaded again from the start.
+
+        Existing files are skipped unless ``overwrite`` is ``True``. When an
+        expected hex digest is given for a URL in ``checksums``, the downloaded
+        file is verified against it (using ``checksum_algorithm``) and an existing
+        one not matching it is downloaded again.
+
+        .. code-block:: robotframework
+
+            *** Tasks ***
+            Download documents
+                @{urls}=    Create List
+                ...    https://example.com/docs/first.pdf
+                ...    https://example.com/docs/second.pdf
+                ${results}=    Download Files    ${urls}
+                ...    target_dir=${OUTPUT_DIR}${/}docs    workers=${8}
+                FOR    ${result}    IN    @{results}
+                    Log    ${result}[url]: ${result}[status]
+                END
+
+        :param urls: list of URLs or dictionary of URLs to file paths
+        :param target_dir: directory for the downloaded files, default is the
+            current directory
+        :param workers: number of files downloaded in parallel, default ``4``
+        :param checksums: dictionary of URLs to expected hex digests
+        :param checksum_algorithm: ``hashlib`` algorithm of the ``checksums``,
+            default ``sha256``
+        :param overwrite: if ``True`` will download again the existing files,
+            default ``False``
+        :param resume: if ``True`` partially downloaded files are resumed,
+            otherwise downloaded from the start, default ``True``
+        :param verify: if SSL verification should be done, default ``True``,
+            a CA_BUNDLE path can also be provided
+        :param force_new_session: if new HTTP sessions should be created,
+            default ``False``
+        :param fail_on_error: if ``True`` raises an error after all the downloads
+            finished if any of them failed, default ``True``
+        :param kwargs: extra arguments passed to every GET request, e.g. ``headers``
+            or ``timeout``
+        :return: list of dictionaries with the ``url``, ``path``, ``status``
+            (`downloaded`, `resumed`, `skipped` or `failed`), ``size`` and
+            ``error`` of each download
+        """
+        root = Path(target_dir) if target_dir else Path()
+        if isinstance(urls, dict):
+            targets = {url: root / path for url, path in urls.items()}
+        else:
+            targets = {
+                url: root / (urlparse(url).path.rsplit("/", 1)[-1] or "downloaded.html")
+                for url in urls
+            }
+        duplicates = len(targets) - len(set(targets.values()))
+        if duplicates:
+            raise ValueError(
+                f"{duplicates} of the URLs would be downloaded into the same files,"
+                " provide a dictionary of URLs to unique file paths instead"
+            )
+        checksums = checksums or {}
+        if checksums:
+            hashlib.new(checksum_algorithm)  # fails early on unknown algorithms
+
+        # Sessions are created upfront (one per host), so the workers just share
+        #  them.
+        aliases, sessions = {}, {}
+        for url in targets:
+            host = urlparse(url)[:2]
+            if host not in aliases:
+                aliases[host], _ = self._get_session_for(
+                    url, verify=verify, force_new_session=force_new_session
+                )
+            sessions[url] = self._cache.get_connection(aliases[host])
+
+        def fetch(url: str) -> dict:
+            path = targets[url]
+            result = {"url": url, "path": str(path), "size": None, "error": None}
+            try:
+                result["status"] = self._download_file(
+                    sessions[url],
+                    url,
+                    path,
+                    checksum=checksums.get(url),
+                    algorithm=checksum_algorithm,
+                    overwrite=overwrite,
+                    resume=resume,
+                    **kwargs,
+                )
+                result["size"] = path.stat().st_size
+            except Exception as exc:  # pylint: disable=broad-except
+                result["status"] = "failed"
+                result["error"] = str(exc)
+            return result
+
+        with ThreadPoolExecutor(max_workers=max(int(workers), 1)) as executor:
+            results = list(executor.map(fetch, targets))
+
+        failed = [result for result in results if result["status"] == "failed"]
+        for result in results:
+            self.logger.info(
+                "%s: %s%s",
+                result["url"],
+                result["status"],
+                f" ({result['error']})" if result["error"] else "",
+            )
+        if failed and fail_on_error:
+            raise RuntimeError(
+                f"Failed to download {len(failed)} of {len(results)} file(s): "
+                + ", ".join(result["url"] for result in failed)
+            )
+        return results
+
+    def _download_file(
+        self,
+        session: Any,
+        url: str,
+        path: Path,
+        checksum: Optional[str],
+        algorithm: str,
+        overwrite: bool,
+        resume: bool,
+        **kwargs,
+    ) -> str:
+        """Stream a single URL into the path, returning the download status."""
+        if path.is_file() and not overwrite:
+            if not checksum or self._file_digest(path, algorithm) == checksum.lower():
+                return "skipped"
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+        # The ETag or Last-Modified of the partially downloaded resource.
+        validator = path.with_name(path.name + ".part.validator")
+        offset, headers = self._get_resume_request(
+            part, validator, resume, kwargs.get("headers")
+        )
+        request_kwargs = dict(kwargs, headers=headers, stream=True)
+        with session.get(url, **request_kwargs) as response:
+            if offset and not self._continues_partial(response, offset):
+                # The partial file doesn't fit the resource anymore, start over.
+                part.unlink()
+                return self._download_file(
+                    session,
+                    url,
+                    path,
+                    checksum,
+                    algorithm,
+                    overwrite=True,
+                    resume=False,
+                    **kwargs,
+                )
+            response.raise_for_status()
+            resumed = bool(offset) and response.status_code == 206
+            self._store_download_validator(response, validator)
+            digest = hashlib.new(algorithm) if checksum else None
+            if resumed and digest:
+                self._file_digest(part, algorithm, digest=digest)
+            with open(part, "ab" if resumed else "wb") as stream:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    stream.write(chunk)
+                    if digest:
+                        digest.update(chunk)
+
+        if validator.is_file():
+            validator.unlink()
+        if digest and digest.hexdigest() != checksum.lower():
+            part.unlink()
+            raise ValueError(
+                f"Checksum mismatch: expected {checksum}, got {digest.hexdigest()}"
+            )
+        os.replace(part, path)
+        return "resumed" if resumed else "downloaded"
+
+    @staticmethod
+    def _get_resume_request(
+        part: Path, validator: Path, resume: bool, headers: Optional[dict]
+    ) -> Tuple[int, dict]:
+        """Offset to resume the partial download from, along with the request
+        headers asking for the missing bytes only.
+        """
+        headers = dict(headers or {})
+        if not (resume and part.is_file() and validator.is_file()):
+            return 0, headers
+        offset = part.stat().st_size
+        if offset:
+            # The server sends the whole resource instead of the range if it
+            #  changed since the partial download.
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator.read_text(encoding="utf-8")
+        return offset, headers
+
+    @staticmethod
+    def _continues_partial(response: Any, offset: int) -> bool:
+        """Tells if the response to a resuming request can be appended to the
+        partial file (or replaces it), `False` if the download has to restart.
+        """
+        if response.status_code == 416:
+            return False
+        if response.status_code != 206:
+            return True
+        match = re.match(r"bytes (\d+)-", response.headers.get("Content-Range", ""))
+        return bool(match) and int(match.group(1)) == offset
+
+    @staticmethod
+    def _store_download_validator(response: Any, validator: Path) -> None:
+        etag = response.headers.get("ETag")
+        if etag and etag.startswith("W/"):
+            etag = None  # weak validators can't be used with ranges
+        value = etag or response.headers.get("Last-Modified")
+        if value:
+            validator.write_text(value, encoding="utf-8")
+        elif validator.is_file():
+            validator.unlink()
+
+    @staticmethod
+    def _file_digest(path: Path, algorithm: str, digest: Any = None) -> str:
+        digest = digest or hashlib.new(algorithm)
+        with open(path, "rb") as stream:
+            for chunk in iter(lambda: stream.read(DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     def check_vulnerabilities(self) -> List:
         """Check for possible vulnerabilities in the installed runtime
         environment packages.
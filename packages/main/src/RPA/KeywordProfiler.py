@@ -0,0 +1,9 @@
+"""
+Dummy module importing core library `KeywordProfiler`,
+because imports to core package should be done only by
+the library itself.
+"""
+
+# flake8: noqa
+# pylint: disable=unused-import
+from RPA.core.profiler import KeywordProfiler
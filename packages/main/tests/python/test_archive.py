@@ -0,0 +1,143 @@
+import io
+import types
+import zipfile
+
+import pytest
+from RPA import Archive as archive_module
+from RPA.Archive import Archive
+
+from . import RESOURCES_DIR, RESULTS_DIR
+
+
+class NonSeekableStream(io.RawIOBase):
+    """Write-only stream behaving like a pipe."""
+
+    def __init__(self):
+        super().__init__()
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+@pytest.fixture
+def library():
+    return Archive()
+
+
+def _members(archive):
+    with zipfile.ZipFile(archive) as zip_archive:
+        assert zip_archive.testzip() is None
+        return {info.filename: zip_archive.read(info) for info in zip_archive.infolist()}
+
+
+@pytest.mark.parametrize("compression", ["stored", "deflated", "bzip2", "lzma"])
+def test_archive_folder_with_zip_in_parallel(library, compression):
+    serial = RESULTS_DIR / "serial.zip"
+    parallel = RESULTS_DIR / "parallel.zip"
+    library.archive_folder_with_zip(
+        str(RESOURCES_DIR), str(serial), recursive=True, compression=compression
+    )
+    library.archive_folder_with_zip(
+        str(RESOURCES_DIR),
+        str(parallel),
+        recursive=True,
+        compression=compression,
+        workers=4,
+    )
+
+    with zipfile.ZipFile(serial) as zserial, zipfile.ZipFile(parallel) as zparallel:
+        assert zserial.namelist() == zparallel.namelist()
+    assert _members(serial) == _members(parallel)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_archive_folder_with_zip_to_stream(library, workers):
+    stream = NonSeekableStream()
+    library.archive_folder_with_zip(
+        str(RESOURCES_DIR), stream, compression="deflated", workers=workers
+    )
+
+    members = _members(io.BytesIO(bytes(stream.data)))
+    assert members["script.sql"] == (RESOURCES_DIR / "script.sql").read_bytes()
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_archive_folder_with_zip_into_folder(library, tmp_path, workers):
+    for idx in range(5):
+        (tmp_path / f"file{idx}.txt").write_text(f"file {idx}")
+    archive = tmp_path / "a.zip"
+
+    library.archive_folder_with_zip(str(tmp_path), str(archive), workers=workers)
+
+    assert sorted(_members(archive)) == [f"file{idx}.txt" for idx in range(5)]
+
+
+def test_archive_folder_with_zip_without_zipfile_internals(
+    library, tmp_path, monkeypatch
+):
+    # Like a Python version without the private zipfile internals.
+    without_internals = types.ModuleType("zipfile")
+    without_internals.__dict__.update(
+        (name, value)
+        for name, value in vars(zipfile).items()
+        if name != "_get_compressor"
+    )
+    monkeypatch.setattr(archive_module, "zipfile", without_internals)
+    monkeypatch.setattr(archive_module, "compress_file", None)
+    archive = tmp_path / "fallback.zip"
+
+    library.archive_folder_with_zip(
+        str(RESOURCES_DIR), str(archive), compression="deflated", workers=4
+    )
+
+    members = _members(archive)
+    assert members["script.sql"] == (RESOURCES_DIR / "script.sql").read_bytes()
+
+
+def test_archive_folder_with_zip_no_files(library, tmp_path):
+    archive = tmp_path / "empty.zip"
+    with pytest.raises(ValueError):
+        library.archive_folder_with_zip(str(tmp_path), str(archive), include="*.none")
+    assert not archive.exists()
+
+
+@pytest.mark.parametrize(
+    "archive", ["testarchive.zip", "testarchive.tar", "testarchive.tar.gz"]
+)
+def test_iterate_archive(library, archive):
+    files = library.iterate_archive(str(RESOURCES_DIR / archive))
+    assert not isinstance(files, list)
+    assert len(list(files)) == 6
+
+
+@pytest.mark.parametrize("archive", ["testarchive.zip", "testarchive.tar"])
+@pytest.mark.parametrize("workers", [1, 4])
+def test_extract_archive_with_pattern(library, tmp_path, archive, workers):
+    library.extract_archive(
+        str(RESOURCES_DIR / archive), str(tmp_path), pattern="*.pdf", workers=workers
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "invoice.pdf",
+        "vero.pdf",
+    ]
+
+
+@pytest.mark.parametrize("archive", ["testarchive.zip", "testarchive.tar.gz"])
+def test_extract_archive_skip_existing(library, tmp_path, archive):
+    archive = str(RESOURCES_DIR / archive)
+    library.extract_archive(archive, str(tmp_path))
+    unchanged = tmp_path / "approved.png"
+    changed = tmp_path / "invoice.pdf"
+    original = changed.read_bytes()
+    changed.write_bytes(b"changed")
+    unchanged_mtime = unchanged.stat().st_mtime_ns
+    changed.touch()
+
+    library.extract_archive(archive, str(tmp_path), workers=2, skip_existing=True)
+    assert changed.read_bytes() == original
+    assert unchanged.stat().st_mtime_ns == unchanged_mtime
@@ -119,6 +119,208 @@ class TestRelativeLocators:
         assert el is not None
 
 
+class TestElementStatus:
+    """Tests for the batched element inspection keywords."""
+
+    @pytest.fixture
+    def driver(self, library):
+        from unittest.mock import MagicMock, PropertyMock, patch
+
+        driver = MagicMock()
+        with patch.object(
+            type(library), "driver", new_callable=PropertyMock, return_value=driver
+        ):
+            yield driver
+
+    @staticmethod
+    def _status(**kwargs):
+        status = {
+            "visible": True,
+            "enabled": True,
+            "disabled": False,
+            "focused": False,
+            "text": "",
+            "rect": {"x": 0, "y": 0, "width": 10, "height": 10},
+            "attributes": {},
+        }
+        status.update(kwargs)
+        return status
+
+    def test_get_element_status_single_round_trip(self, library, driver):
+        from unittest.mock import MagicMock, patch
+
+        element = MagicMock()
+        element.is_displayed.return_value = False
+        driver.execute_script.return_value = [self._status(focused=True)]
+        with patch.object(
+            library, "find_elements", return_value=[element]
+        ) as finder:
+            status = library.get_element_status("id:field")
+
+        finder.assert_called_once_with("id:field")
+        driver.execute_script.assert_called_once_with(
+            library.ELEMENT_STATUS_SCRIPT, [], element
+        )
+        assert status == {
+            "visible": False,
+            "enabled": True,
+            "disabled": False,
+            "focused": True,
+        }
+
+    def test_get_element_status_missing(self, library, driver):
+        from unittest.mock import patch
+
+        with patch.object(library, "find_elements", return_value=[]):
+            status = library.get_element_status("id:missing")
+
+        assert not driver.execute_script.called
+        assert not any(status.values())
+
+    def test_get_elements_status_many_locators(self, library, driver):
+        from unittest.mock import patch
+
+        driver.execute_script.return_value = [
+            self._status(text="a"),
+            self._status(text="b"),
+            self._status(text="c"),
+        ]
+        found = {"css:li": ["li1", "li2"], "id:last": ["last"]}
+        with patch.object(library, "find_elements", side_effect=found.get):
+            statuses = library.get_elements_status(
+                ["css:li", "id:last"], attributes=["id"]
+            )
+
+        driver.execute_script.assert_called_once_with(
+            library.ELEMENT_STATUS_SCRIPT, ["id"], "li1", "li2", "last"
+        )
+        assert [status["text"] for status in statuses] == ["a", "b", "c"]
+
+    def test_get_elements_status_in_browser(self, library):
+        library.open_available_browser(
+            RELATIVE_LOCATOR_PAGE, headless=True, browser_selection="Chrome"
+        )
+        statuses = library.get_elements_status("css:body", attributes=["id"])
+        assert len(statuses) == 1
+        assert statuses[0]["visible"] is True
+        assert set(statuses[0]["rect"]) == {"x", "y", "width", "height"}
+        assert statuses[0]["attributes"] == {"id": None}
+        # Not a form element, so neither enabled nor disabled.
+        assert not statuses[0]["enabled"] and not statuses[0]["disabled"]
+
+
+class TestBrowserPool:
+    """Tests for the warm browser pool keywords."""
+
+    @staticmethod
+    def _wait_idle(library, count, timeout=5):
+        import time
+
+        end = time.time() + timeout
+        while library.get_browser_pool_stats()["idle"] < count:
+            assert time.time() < end, "pool didn't fill up in time"
+            time.sleep(0.01)
+
+    @pytest.fixture
+    def launched(self, library):
+        from unittest.mock import MagicMock, patch
+
+        drivers = []
+
+        def launch(browser, download, **kwargs):
+            driver = MagicMock(name=f"driver-{len(drivers)}")
+            driver.window_handles = ["main"]
+            drivers.append(driver)
+            return driver
+
+        with patch.object(
+            library, "_get_driver_args", return_value=({}, ["--headless"], "120.0")
+        ), patch.object(library, "_launch_webdriver", side_effect=launch):
+            yield drivers
+        library.stop_browser_pool()
+
+    def test_open_takes_warm_browser(self, library, launched):
+        library.start_browser_pool(size=2, browser_selection="Chrome")
+        self._wait_idle(library, 2)
+
+        library.open_available_browser(browser_selection="Chrome", headless=True)
+
+        assert library.driver in launched
+        stats = library.get_browser_pool_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 0)
+        assert stats["idle"] == 1 and stats["in_use"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["startup_time_saved"] >= 0
+
+    @pytest.mark.parametrize("display", [":0", ""])
+    def test_default_arguments_take_warm_browser(
+        self, library, launched, monkeypatch, display
+    ):
+        monkeypatch.setattr("platform.system", lambda: "Linux")
+        monkeypatch.setenv("DISPLAY", display)
+        monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+        monkeypatch.delenv("RPA_HEADLESS_MODE", raising=False)
+        library.start_browser_pool(size=1)
+        self._wait_idle(library, 1)
+
+        library.open_available_browser()
+
+        assert library.driver is launched[0]
+        assert library.headless is not bool(display)
+        assert library.get_browser_pool_stats()["hits"] == 1
+
+    def test_close_recycles_browser(self, library, launched):
+        library.start_browser_pool(size=1, browser_selection="Chrome")
+        self._wait_idle(library, 1)
+
+        library.open_available_browser(browser_selection="Chrome", headless=True)
+        driver = library.driver
+        library.close_browser()
+
+        assert not driver.quit.called
+        driver.delete_all_cookies.assert_called_once_with()
+        driver.get.assert_called_with("about:blank")
+        library.open_available_browser(browser_selection="Chrome", headless=True)
+        assert library.driver is driver
+        stats = library.get_browser_pool_stats()
+        assert (stats["hits"], stats["recycled"]) == (2, 1)
+
+    def test_retired_browser_is_replaced(self, library, launched):
+        library.start_browser_pool(size=1, browser_selection="Chrome", max_uses=1)
+        self._wait_idle(library, 1)
+
+        library.open_available_browser(browser_selection="Chrome", headless=True)
+        library.close_all_browsers()
+        self._wait_idle(library, 1)
+
+        assert len(launched) == 2
+        launched[0].quit.assert_called_once_with()
+        assert library.get_browser_pool_stats()["retired"] == 1
+
+    def test_different_arguments_skip_pool(self, library, launched):
+        from unittest.mock import patch
+
+        library.start_browser_pool(size=1, browser_selection="Chrome")
+        self._wait_idle(library, 1)
+
+        with patch.object(library, "_create_webdriver", return_value=1) as create:
+            library.open_available_browser(
+                browser_selection="Chrome", headless=True, user_agent="bot"
+            )
+
+        create.assert_called_once()
+        assert library.get_browser_pool_stats()["hits"] == 0
+
+    def test_stop_quits_idle_browsers(self, library, launched):
+        library.start_browser_pool(size=2, browser_selection="Chrome")
+        self._wait_idle(library, 2)
+
+        library.stop_browser_pool()
+
+        for driver in launched:
+            driver.quit.assert_called_once_with()
+
+
 class TestBrowserLogs:
     """Tests for Get Browser Logs keyword."""
 
@@ -219,6 +421,70 @@ class TestNetworkInterception:
         with pytest.raises(TimeoutException, match="nonexistent_pattern_xyz"):
             library.wait_for_network_request("nonexistent_pattern_xyz", timeout=1)
 
+    def test_wait_for_network_requests_incremental(self, library):
+        from unittest.mock import MagicMock, PropertyMock, patch
+
+        def entry(url):
+            return {"url": url, "duration": 1.0}
+
+        driver = MagicMock()
+        driver.execute_async_script.side_effect = [
+            {"page": "p1", "next": 2, "entries": [entry("a.js"), entry("/api/user")]},
+            {"page": "p1", "next": 3, "entries": [entry("b.css")]},
+            {"page": "p1", "next": 4, "entries": [entry("/api/data?id=1")]},
+        ]
+        with patch.object(
+            type(library), "driver", new_callable=PropertyMock, return_value=driver
+        ):
+            requests = library.wait_for_network_requests(
+                "/api/data", "/api/user", timeout=10
+            )
+
+        assert [request["url"] for request in requests] == [
+            "/api/data?id=1",
+            "/api/user",
+        ]
+        cursors = [call.args[1:3] for call in driver.execute_async_script.mock_calls]
+        assert cursors == [(None, 0), ("p1", 2), ("p1", 3)]
+
+    def test_wait_for_network_requests_after_navigation(self, library):
+        from unittest.mock import MagicMock, PropertyMock, patch
+
+        from selenium.common.exceptions import JavascriptException
+
+        driver = MagicMock()
+        driver.execute_async_script.side_effect = [
+            {"page": "p1", "next": 1, "entries": [{"url": "/index.html"}]},
+            JavascriptException("document unloaded while waiting for result"),
+            {"page": "p2", "next": 1, "entries": [{"url": "/api/user"}]},
+        ]
+        with patch.object(
+            type(library), "driver", new_callable=PropertyMock, return_value=driver
+        ):
+            requests = library.wait_for_network_requests("/api/user", timeout=10)
+
+        assert requests == [{"url": "/api/user"}]
+        cursors = [call.args[1:3] for call in driver.execute_async_script.mock_calls]
+        assert cursors == [(None, 0), ("p1", 1), (None, 0)]
+
+    def test_wait_for_network_requests_any(self, library):
+        from unittest.mock import MagicMock, PropertyMock, patch
+
+        driver = MagicMock()
+        driver.execute_async_script.return_value = {
+            "page": "p1",
+            "next": 1,
+            "entries": [{"url": "/api/user"}],
+        }
+        with patch.object(
+            type(library), "driver", new_callable=PropertyMock, return_value=driver
+        ):
+            requests = library.wait_for_network_requests(
+                "/api/data", "/api/user", timeout=10, match_all=False
+            )
+
+        assert requests == [None, {"url": "/api/user"}]
+
 
 class TestVirtualAuthenticator:
     """Tests for Add/Remove Virtual Authenticator keywords."""
@@ -31,3 +31,50 @@ def test_set_locale_english(library):
         timezone="Europe/Helsinki", return_format="dddd DD MMMM YYYY"
     )
     assert now == "Thursday 09 March 2023"
+
+
+def test_next_and_previous_business_days(library):
+    assert library.return_next_business_day("2022-12-23", "FI") == "2022-12-27"
+    assert library.return_previous_business_day("2023-01-09", "FI") == "2023-01-05"
+    assert library.return_next_business_days(["2023-01-05", "2022-12-23"], "FI") == [
+        "2023-01-09",
+        "2022-12-27",
+    ]
+    assert library.return_previous_business_days(
+        ["2023-01-09", "2023-01-02"], "FI"
+    ) == ["2023-01-05", "2022-12-30"]
+
+
+def test_add_business_days(library):
+    assert library.add_business_days("2022-12-22", 3, "FI") == "2022-12-28"
+    assert library.add_business_days("2022-12-28", -3, "FI") == "2022-12-22"
+    assert library.add_business_days("2023-01-02", 0) == "2023-01-02"
+    # Crossing a few years grows the index on demand.
+    assert library.add_business_days("2023-01-02", 1000) == "2026-11-02"
+    assert library.add_business_days_to_dates(
+        ["2022-12-22", "2023-01-02"], 3, "FI"
+    ) == ["2022-12-28", "2023-01-05"]
+
+
+def test_business_days_between(library):
+    assert library.business_days_between("2022-12-22", "2022-12-29", "FI") == 4
+    assert library.business_days_between("2022-12-29", "2022-12-22", "FI") == -4
+    assert library.business_days_between("2022-12-22", "2022-12-29") == 5
+    assert library.business_days_between_dates(
+        ["2022-12-22", "2023-01-02"], ["2022-12-29", "2023-01-09"], "FI"
+    ) == [4, 4]
+
+
+def test_business_day_index_follows_settings(library):
+    assert library.is_the_date_business_day("2023-03-08", "FI")
+    library.add_custom_holidays("2023-03-08")
+    assert not library.is_the_date_business_day("2023-03-08", "FI")
+    assert library.is_the_date_holiday("2023-03-08")
+
+    library.set_business_days([5, 6])
+    assert library.are_the_dates_business_days(
+        ["2023-03-10", "2023-03-11", "2023-03-12"], "FI"
+    ) == [False, True, True]
+    library.reset_business_days()
+    library.reset_custom_holidays()
+    assert library.is_the_date_business_day("2023-03-08", "FI")
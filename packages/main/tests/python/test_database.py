@@ -8,7 +8,7 @@ except ImportError:
     from contextlib import suppress as nullcontext
 
 import pytest
-from RPA.Database import Database
+from RPA.Database import Database, SQLScriptSplitter
 
 from . import RESOURCES_DIR, RESULTS_DIR, temp_filename
 
@@ -157,3 +157,72 @@ def test_connect_to_database_uses_dbname_for_psycopg_variants(module_name):
     )
     assert library._dbconnection is connection
     assert connection.autocommit is True
+
+
+@pytest.mark.parametrize(
+    "script, statements",
+    [
+        (
+            "INSERT INTO t VALUES('a;b');\nINSERT INTO t VALUES(\"c;d\");",
+            ["INSERT INTO t VALUES('a;b')", 'INSERT INTO t VALUES("c;d")'],
+        ),
+        (
+            "SELECT 'it''s; here', 'C:\\';\nSELECT 2;",
+            ["SELECT 'it''s; here', 'C:\\'", "SELECT 2"],
+        ),
+        (
+            "-- comment; with delimiter\n# another; comment\nSELECT 1; -- trailing;\n"
+            "/* block; comment */ SELECT 2;",
+            ["SELECT 1", "/* block; comment */ SELECT 2"],
+        ),
+        (
+            "CREATE FUNCTION f() RETURNS int AS $body$\nBEGIN\n  RETURN 1;\nEND;\n"
+            "$body$ LANGUAGE plpgsql;\nSELECT $1, a$b$c FROM t;",
+            [
+                "CREATE FUNCTION f() RETURNS int AS $body$\nBEGIN\n  RETURN 1;\nEND;\n"
+                "$body$ LANGUAGE plpgsql",
+                "SELECT $1, a$b$c FROM t",
+            ],
+        ),
+        (
+            "DELIMITER //\nCREATE PROCEDURE p()\nBEGIN\n  SELECT 1;\nEND //\n"
+            "DELIMITER ;\nCALL p();\n",
+            ["CREATE PROCEDURE p()\nBEGIN\n  SELECT 1;\nEND", "CALL p()"],
+        ),
+        ("SELECT 1;;  \n;\nSELECT 2", ["SELECT 1", "SELECT 2"]),
+    ],
+)
+def test_sql_script_splitter(script, statements):
+    lines = script.splitlines(keepends=True)
+    assert list(SQLScriptSplitter().split(lines)) == statements
+
+
+def test_sql_script_splitter_backslash_escapes():
+    lines = ["SELECT 'esc\\'; aped', \"C:\\\\\";\n", "SELECT 2;"]
+    splitter = SQLScriptSplitter(backslash_escapes=True)
+    assert list(splitter.split(lines)) == [
+        "SELECT 'esc\\'; aped', \"C:\\\\\"",
+        "SELECT 2",
+    ]
+
+
+def test_execute_sql_script_batches(library_no_commit):
+    sql_data = (RESOURCES_DIR / "script.sql").read_text()
+    executed = []
+    cursor = mock.Mock()
+    cursor.execute.side_effect = executed.append
+    cursor.nextset.return_value = None
+    library_no_commit._dbconnection = mock.Mock()
+    library_no_commit._dbconnection.cursor.return_value = cursor
+
+    with temp_filename(content=sql_data, suffix=".sql", mode="w") as sql_script:
+        # SQLite doesn't accept multiple statements per execution.
+        library_no_commit.execute_sql_script(sql_script, batch_size=2)
+        assert len(executed) == 3
+
+        executed.clear()
+        library_no_commit.db_api_module_name = "pyodbc"
+        library_no_commit.execute_sql_script(sql_script, batch_size=2)
+    assert len(executed) == 2
+    assert executed[0].count(";") == 1
+    assert cursor.nextset.called
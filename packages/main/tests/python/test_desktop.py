@@ -1,4 +1,4 @@
-"""Tests for RPA.Desktop keyboard and mouse keyword utilities."""
+"""Tests for RPA.Desktop keyboard, mouse and finder keyword utilities."""
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -185,3 +185,159 @@ def test_type_text():
     kb.type_text("hello")
 
     ctrl.type.assert_called_once_with("hello")
+
+
+# --- FinderKeywords ---
+
+
+def _make_finder_keywords():
+    from RPA.Desktop.keywords.finder import FinderKeywords
+
+    ctx = MagicMock()
+    ctx.locators_path = None
+    return FinderKeywords(ctx)
+
+
+def test_find_from_displays_grabs_region_across_displays():
+    from PIL import Image
+    from RPA.core.geometry import Region
+
+    finder = _make_finder_keywords()
+    displays = [Region(0, 0, 100, 100), Region(100, 0, 200, 100)]
+    grabbed = []
+
+    def grab(area):
+        grabbed.append(area)
+        return Image.new("RGB", (area.width, area.height))
+
+    def search(image):
+        # A match straddling the border between the displays
+        return [Region.from_size(5, 0, 10, 10)]
+
+    with patch("RPA.Desktop.keywords.finder.screen") as screen:
+        screen.displays.return_value = displays
+        screen.grab.side_effect = grab
+        matches = finder._find_from_displays(search, Region(90, 10, 250, 60))
+
+    assert grabbed == [Region(90, 10, 200, 60)]
+    assert matches == [Region.from_size(95, 10, 10, 10)]
+
+
+def test_find_templates_in_region_across_displays(tmp_path):
+    from PIL import Image
+    from RPA.core.geometry import Region, Undefined
+    from RPA.core.locators import ImageLocator
+
+    finder = _make_finder_keywords()
+    path = tmp_path / "template.png"
+    Image.new("RGB", (20, 20), "red").save(path)
+    searched = []
+
+    def find(image, template, confidence):
+        searched.append(image.size)
+        return [Region.from_size(0, 0, 20, 20)]
+
+    with patch("RPA.Desktop.keywords.finder.screen") as screen, patch(
+        "RPA.Desktop.keywords.finder.ensure_recognition"
+    ), patch("RPA.Desktop.keywords.finder.templates") as templates:
+        screen.displays.return_value = [
+            Region(0, 0, 100, 100),
+            Region(100, 0, 200, 100),
+        ]
+        screen.grab.side_effect = lambda area: Image.new(
+            "RGB", (area.width, area.height)
+        )
+        templates.find.side_effect = find
+        locator = ImageLocator(str(path))
+
+        # Only 5 pixels of the region are on the first display
+        matches = finder._find_templates(Region(95, 0, 150, 50), locator)
+        assert searched == [(55, 50)]
+        assert matches == [Region.from_size(95, 0, 20, 20)]
+
+        # A search area smaller than the template has no matches
+        assert finder._find_templates(Region(0, 0, 10, 50), locator) == []
+        assert len(searched) == 1
+        assert finder._find_templates(Undefined(), locator) != []
+
+
+def test_find_from_displays_skips_displays_outside_region():
+    from PIL import Image
+    from RPA.core.geometry import Region
+
+    finder = _make_finder_keywords()
+    with patch("RPA.Desktop.keywords.finder.screen") as screen:
+        screen.displays.return_value = [
+            Region(0, 0, 100, 100),
+            Region(100, 0, 200, 100),
+        ]
+        screen.grab.return_value = Image.new("RGB", (50, 50))
+        finder._find_from_displays(lambda image: [], Region(0, 0, 50, 50))
+
+    screen.grab.assert_called_once_with(Region(0, 0, 50, 50))
+
+
+def test_load_template_cached_until_modified(tmp_path):
+    import os
+
+    from PIL import Image
+    from RPA.Desktop.keywords.finder import load_template
+
+    path = tmp_path / "template.png"
+    Image.new("RGBA", (4, 4), "red").save(path)
+
+    first = load_template(str(path))
+    assert first.mode == "RGB"
+    assert load_template(str(path)) is first
+
+    Image.new("RGBA", (6, 6), "blue").save(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_template(str(path)).size == (6, 6)
+
+
+def test_wait_for_element_skips_unchanged_screen():
+    from PIL import Image
+    from RPA.core.geometry import Region
+    from RPA.core.locators import ImageLocator
+    from RPA.Desktop.keywords import TimeoutException
+
+    finder = _make_finder_keywords()
+    frames = [Image.new("RGB", (100, 100))] * 3 + [Image.new("RGB", (100, 100), "red")]
+    searched = []
+
+    def find(base, locator):
+        def search(image):
+            searched.append(image)
+            return []
+
+        return finder._find_from_displays(search, key=repr(locator))
+
+    with patch("RPA.Desktop.keywords.finder.screen") as screen, patch.object(
+        finder, "_find_templates", side_effect=find
+    ):
+        screen.displays.return_value = [Region(0, 0, 100, 100)]
+        screen.grab.side_effect = frames + [frames[-1]] * 100
+        with pytest.raises(TimeoutException):
+            finder.wait_for_element(
+                ImageLocator("button.png"), timeout=0.2, interval=0.01
+            )
+
+    assert screen.grab.call_count > 4
+    assert len(searched) == 2
+    assert finder._change_detector is None
+
+
+def test_change_detector_digest():
+    from PIL import Image
+    from RPA.Desktop.keywords.finder import ChangeDetector
+
+    image = Image.new("RGB", (10, 100))
+    changed = image.copy()
+    changed.putpixel((5, 70), (255, 0, 0))
+
+    assert ChangeDetector.digest(image) == ChangeDetector.digest(image.copy())
+    assert ChangeDetector.digest(image) != ChangeDetector.digest(changed)
+    # Same pixel data in another shape.
+    reshaped = Image.new("RGB", (100, 10))
+    assert ChangeDetector.digest(image) != ChangeDetector.digest(reshaped)
@@ -0,0 +1,181 @@
+import hashlib
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from RPA.HTTP import HTTP
+
+
+FILES = {f"/file{idx}.bin": bytes([idx]) * (100_000 + idx) for idx in range(5)}
+ETAG = '"v1"'
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves the in-memory files, honoring single byte ranges and ``If-Range``."""
+
+    requests = []
+
+    def do_GET(self):  # noqa: N802
+        self.requests.append((self.path, self.headers.get("Range")))
+        body = FILES.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+
+        match = re.match(r"bytes=(\d+)-", self.headers.get("Range") or "")
+        if match and self.headers.get("If-Range", ETAG) == ETAG:
+            start = int(match.group(1))
+            if start >= len(body):
+                self.send_error(416)
+                return
+            if self.path == "/file0.bin":
+                start = 0  # a broken server ignoring the requested start
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+            )
+            body = body[start:]
+        else:
+            self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def library(server):
+    RangeHandler.requests.clear()
+    return HTTP()
+
+
+def test_download_files(library, server, tmp_path):
+    urls = [server + path for path in FILES]
+
+    results = library.download_files(urls, target_dir=tmp_path, workers=3)
+
+    assert [result["status"] for result in results] == ["downloaded"] * len(FILES)
+    for path, body in FILES.items():
+        assert (tmp_path / path.lstrip("/")).read_bytes() == body
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_download_files_resumes_partial(library, server, tmp_path):
+    body = FILES["/file1.bin"]
+    (tmp_path / "file1.bin.part").write_bytes(body[:1000])
+    (tmp_path / "file1.bin.part.validator").write_text(ETAG)
+
+    results = library.download_files(
+        [server + "/file1.bin"],
+        target_dir=tmp_path,
+        checksums={server + "/file1.bin": hashlib.sha256(body).hexdigest()},
+    )
+
+    assert results[0]["status"] == "resumed"
+    assert RangeHandler.requests == [("/file1.bin", "bytes=1000-")]
+    assert (tmp_path / "file1.bin").read_bytes() == body
+    assert not list(tmp_path.glob("*.part*"))
+
+
+def test_download_files_restarts_changed_partial(library, server, tmp_path):
+    body = FILES["/file1.bin"]
+    (tmp_path / "file1.bin.part").write_bytes(b"stale" * 200)
+    (tmp_path / "file1.bin.part.validator").write_text('"v0"')
+
+    results = library.download_files([server + "/file1.bin"], target_dir=tmp_path)
+
+    assert results[0]["status"] == "downloaded"
+    assert RangeHandler.requests == [("/file1.bin", "bytes=1000-")]
+    assert (tmp_path / "file1.bin").read_bytes() == body
+
+
+def test_download_files_restarts_on_other_range(library, server, tmp_path):
+    body = FILES["/file0.bin"]
+    (tmp_path / "file0.bin.part").write_bytes(body[:1000])
+    (tmp_path / "file0.bin.part.validator").write_text(ETAG)
+
+    results = library.download_files([server + "/file0.bin"], target_dir=tmp_path)
+
+    assert results[0]["status"] == "downloaded"
+    assert RangeHandler.requests == [
+        ("/file0.bin", "bytes=1000-"),
+        ("/file0.bin", None),
+    ]
+    assert (tmp_path / "file0.bin").read_bytes() == body
+
+
+def test_download_files_restarts_partial_without_validator(
+    library, server, tmp_path
+):
+    body = FILES["/file1.bin"]
+    (tmp_path / "file1.bin.part").write_bytes(body[:1000])
+
+    results = library.download_files([server + "/file1.bin"], target_dir=tmp_path)
+
+    assert results[0]["status"] == "downloaded"
+    assert RangeHandler.requests == [("/file1.bin", None)]
+    assert (tmp_path / "file1.bin").read_bytes() == body
+
+
+def test_download_files_restarts_oversized_partial(library, server, tmp_path):
+    body = FILES["/file2.bin"]
+    (tmp_path / "file2.bin.part").write_bytes(body + b"garbage")
+    (tmp_path / "file2.bin.part.validator").write_text(ETAG)
+
+    results = library.download_files([server + "/file2.bin"], target_dir=tmp_path)
+
+    assert results[0]["status"] == "downloaded"
+    assert (tmp_path / "file2.bin").read_bytes() == body
+
+
+def test_download_files_skips_existing(library, server, tmp_path):
+    (tmp_path / "file0.bin").write_bytes(FILES["/file0.bin"])
+
+    results = library.download_files(
+        {server + "/file0.bin": "file0.bin", server + "/file3.bin": "sub/three.bin"},
+        target_dir=tmp_path,
+    )
+
+    assert [result["status"] for result in results] == ["skipped", "downloaded"]
+    assert (tmp_path / "sub" / "three.bin").read_bytes() == FILES["/file3.bin"]
+    assert RangeHandler.requests == [("/file3.bin", None)]
+
+
+def test_download_files_checksum_mismatch(library, server, tmp_path):
+    url = server + "/file4.bin"
+
+    with pytest.raises(RuntimeError, match="Failed to download 2 of 2"):
+        library.download_files(
+            [url, server + "/missing.bin"],
+            target_dir=tmp_path,
+            checksums={url: "0" * 64},
+        )
+
+    results = library.download_files(
+        [url], target_dir=tmp_path, checksums={url: "0" * 64}, fail_on_error=False
+    )
+    assert results[0]["status"] == "failed"
+    assert "Checksum mismatch" in results[0]["error"]
+    assert not (tmp_path / "file4.bin").exists()
+    assert not (tmp_path / "file4.bin.part").exists()
+
+
+def test_download_files_duplicate_targets(library, server, tmp_path):
+    with pytest.raises(ValueError, match="same files"):
+        library.download_files(
+            [server + "/a/file0.bin", server + "/b/file0.bin"], target_dir=tmp_path
+        )
@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 from RPA.Email.ImapSmtp import ImapSmtp
+from RPA.Email import common
 from RPA.Email.common import counter_duplicate_path
 from docx import Document
 
@@ -206,3 +207,13 @@ def test_counter_duplicate_path(tmp_path):
     new_file_path.write_text("some data 2")
     newest_file_path = counter_duplicate_path(file_path)
     assert newest_file_path.name == "my-attachment-3.txt"
+
+
+def test_lib_mfa_alias():
+    from RPA.Email.common import lib_mfa
+    from RPA.MFA import MFA
+
+    assert isinstance(lib_mfa, MFA)
+    assert common.lib_mfa is lib_mfa is common.get_mfa_library()
+    with pytest.raises(AttributeError):
+        common.missing_attribute  # pylint: disable=pointless-statement
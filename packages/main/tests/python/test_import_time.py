@@ -0,0 +1,131 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+
+# Heavy dependencies which must not be loaded by just importing a library, as
+#  they are imported on the first keyword needing them.
+HEAVY_DEPENDENCIES = [
+    "openpyxl",
+    "xlrd",
+    "xlwt",
+    "xlutils",
+    "PIL",
+    "selenium",
+    "webdriver_manager",
+    "RPA.core.webdriver",
+    "boto3",
+    "botocore",
+    "jwt",
+    "requests_oauthlib",
+    "RPA.MFA",
+]
+
+# The libraries made lazy, with the heavy dependencies they still import eagerly.
+LAZY_LIBRARIES = {
+    # SeleniumLibrary, the base class of the library, imports selenium.
+    "RPA.Browser.Selenium": ["selenium"],
+    "RPA.Email.ImapSmtp": [],
+    "RPA.Email.common": [],
+    "RPA.Excel.Files": [],
+}
+
+# All the libraries of the package, benchmarked for their import time.
+LIBRARIES = [
+    "RPA.Archive",
+    "RPA.Browser.Playwright",
+    "RPA.Browser.Selenium",
+    "RPA.Calendar",
+    "RPA.Cloud.Azure",
+    "RPA.Crypto",
+    "RPA.Database",
+    "RPA.Desktop",
+    "RPA.Desktop.Clipboard",
+    "RPA.Desktop.OperatingSystem",
+    "RPA.Desktop.Windows",
+    "RPA.DocumentAI",
+    "RPA.DocumentAI.Base64AI",
+    "RPA.DocumentAI.Nanonets",
+    "RPA.Email.Exchange",
+    "RPA.Email.ImapSmtp",
+    "RPA.Excel.Application",
+    "RPA.Excel.Files",
+    "RPA.FTP",
+    "RPA.FileSystem",
+    "RPA.HTTP",
+    "RPA.Images",
+    "RPA.JSON",
+    "RPA.JavaAccessBridge",
+    "RPA.MFA",
+    "RPA.MSGraph",
+    "RPA.Netsuite",
+    "RPA.Notifier",
+    "RPA.Outlook.Application",
+    "RPA.Robocorp.Process",
+    "RPA.Robocorp.Storage",
+    "RPA.Robocorp.Vault",
+    "RPA.Robocorp.WorkItems",
+    "RPA.RobotLogListener",
+    "RPA.SAP",
+    "RPA.Salesforce",
+    "RPA.Slack",
+    "RPA.Smartsheet",
+    "RPA.Tables",
+    "RPA.Tasks",
+    "RPA.Twitter",
+    "RPA.Word.Application",
+]
+
+# Upper bound for the cumulative import time of a library. The slowest ones take
+#  around 600ms locally, this leaves room for slower CI machines.
+IMPORT_TIME_LIMIT_MS = 1500
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def profile_import(module: str) -> dict:
+    """Imports `module` in a fresh interpreter with ``-X importtime``, returning
+    the cumulative import time (in microseconds) of every loaded module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        # Libraries needing an optional or platform specific package.
+        pytest.skip(f"{module} can't be imported: {result.stderr.splitlines()[-1]}")
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            timings[match.group(4)] = int(match.group(2))
+    return timings
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+def test_import_time(library):
+    timings = profile_import(library)
+
+    assert library in timings
+    import_time = timings[library] / 1000
+    assert import_time < IMPORT_TIME_LIMIT_MS, (
+        f"{library} took {import_time:.1f}ms to import"
+    )
+
+
+@pytest.mark.parametrize("library", LAZY_LIBRARIES)
+def test_heavy_dependencies_not_imported(library):
+    timings = profile_import(library)
+
+    loaded = {
+        dependency
+        for dependency in HEAVY_DEPENDENCIES
+        if dependency not in LAZY_LIBRARIES[library]
+        for module in timings
+        if module == dependency or module.startswith(f"{dependency}.")
+    }
+    assert not loaded, f"{library} imported {sorted(loaded)} eagerly"